@@ -9,21 +9,30 @@ while keeping existing backend logic in ``script.py``.
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
 import math
+import operator
 import os
 import re
 import shutil
+import struct
 import threading
+from array import array
+from itertools import compress, count
+from concurrent.futures import Future, ThreadPoolExecutor
 import urllib.error
 import urllib.request
 import webbrowser
-from dataclasses import dataclass
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import tkinter.font as tkfont
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from typing import Any, Callable, DefaultDict, Dict, Iterable, Iterator, List, Optional, Set
 
 from PIL import Image, ImageTk
 from ttkwidgets import CheckboxTreeview
@@ -62,6 +71,10 @@ SAVE_FILENAME_VARIANTS: tuple[str, ...] = (
     "rep+persistentgamedata",
     "rep+_persistentgamedata",
 )
+_SAVE_VARIANT_REPLACEMENTS: Dict[str, tuple[str, ...]] = {
+    source: tuple(variant for variant in SAVE_FILENAME_VARIANTS if variant != source)
+    for source in SAVE_FILENAME_VARIANTS
+}
 
 LOCKED_ITEM_TAG = "locked_highlight"
 LOCKED_ITEM_BACKGROUND = "#f8d7da"
@@ -265,6 +278,143 @@ def _variable_to_bool(var: Optional[tk.Variable]) -> bool:
             return False
     return bool(value)
 
+
+def _sorted_int_ids(ids: Iterable[str]) -> List[int]:
+    """Convert tree ids to ints at the save-file boundary, in ascending order."""
+
+    return sorted(map(int, ids))
+
+
+@lru_cache(maxsize=None)
+def _flag_table(mask: int) -> bytes:
+    return bytes(1 if value & mask else 0 for value in range(256))
+
+
+def _flagged_ids(values: Iterable[int], mask: int = 0xFF) -> Set[str]:
+    """Return 1-based ids (as strings) whose byte value shares a bit with ``mask``."""
+
+    flags = bytes(values).translate(_flag_table(mask))
+    return set(map(str, compress(count(1), flags)))
+
+
+def _write_file_atomic(path: str | os.PathLike[str], data: bytes) -> None:
+    """Write ``data`` next to ``path`` and swap it in, so a failed write never
+    leaves a truncated save behind."""
+
+    target = Path(path)
+    tmp_path = target.with_suffix(target.suffix + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, target)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _copy_file_atomic(
+    source: str | os.PathLike[str], path: str | os.PathLike[str], size: int
+) -> None:
+    """Clone ``size`` bytes of ``source`` into ``path`` in the kernel, via a temp file."""
+
+    target = Path(path)
+    tmp_path = target.with_suffix(target.suffix + ".tmp")
+    try:
+        with open(source, "rb") as src, open(tmp_path, "wb") as dst:
+            copied = 0
+            while copied < size:
+                chunk = os.copy_file_range(src.fileno(), dst.fileno(), size - copied)
+                if not chunk:
+                    raise OSError(f"short copy from {source}")
+                copied += chunk
+        os.replace(tmp_path, target)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _read_file_exact(path: str | os.PathLike[str]) -> bytes:
+    """Read a whole file into a buffer sized from ``fstat`` up front."""
+
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return data
+
+
+def _csv_cell(row: List[str], index: Optional[int]) -> str:
+    if index is None or index >= len(row):
+        return ""
+    return row[index].strip()
+
+
+@lru_cache(maxsize=64)
+def _comparable_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+@lru_cache(maxsize=4096)
+def _format_display_name_cached(
+    frozen_translations: frozenset,
+    english: str | None,
+    english_first: bool,
+    language_code: str,
+) -> str:
+    translations: Dict[str, str] = {
+        str(key): str(value)
+        for key, value in frozen_translations
+        if value is not None and str(value).strip()
+    }
+    korean_text = translations.get("ko_kr") or translations.get("korean") or ""
+    english_text = (
+        translations.get("en_us")
+        or translations.get("english")
+        or english
+        or ""
+    )
+
+    primary_text = translations.get(language_code, "").strip()
+    if not primary_text:
+        if language_code == "ko_kr":
+            primary_text = korean_text or english_text
+        elif language_code == "en_us":
+            primary_text = english_text or korean_text
+        else:
+            primary_text = translations.get(language_code.split("_", 1)[0], "").strip()
+    if not primary_text:
+        primary_text = english_text or korean_text
+
+    secondary_text = ""
+    if english_first:
+        primary = english_text or primary_text
+        secondary_text = primary_text if primary != primary_text else ""
+    else:
+        primary = primary_text
+        comparison = english_text
+        if language_code == "ko_kr":
+            comparison = english_text
+        elif language_code != "en_us":
+            comparison = english_text or korean_text
+        if comparison and comparison != primary:
+            secondary_text = comparison
+
+    if primary and secondary_text:
+        return f"{primary} ({secondary_text})"
+    return primary or secondary_text or english_text or korean_text or ""
+
 TOTAL_COMPLETION_MARKS = 12
 
 DEFAULT_COMPLETION_UNLOCK_MASK = getattr(script, "COMPLETION_DEFAULT_UNLOCK_MASK", 0x03)
@@ -277,11 +427,156 @@ ITEM_UNLOCK_MASK = (
     | getattr(script, "ITEM_FLAG_COLLECTED", 0x04)
 )
 
+_ICON_AFFIX_RE = re.compile(r"^(?:Collectible|Trinket)_|_icon$")
+_ICON_SEPARATOR_RE = re.compile(r"[_-]+")
+_ICON_TRAILING_KIND_RE = re.compile(r"\b(item|trinket)\b$", re.IGNORECASE)
+_LOOKUP_PUNCT_RE = re.compile(r"[!?.]")
+_LOOKUP_PAREN_RE = re.compile(r"\s*\(.*?\)")
+# Every character for which str.isspace() is true (the same set as re's \s).
+_WHITESPACE_DELETE_TABLE = dict.fromkeys(
+    map(
+        ord,
+        "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+        "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+        "\u2028\u2029\u202f\u205f\u3000",
+    )
+)
+_SAVE_SLOT_RE = re.compile(r"(\d+)(?=\.dat$)")
+
+_LOCKED_VALUES_NO_QUALITY = ("X",)
+_LOCKED_VALUES_BY_QUALITY: Dict[Optional[object], tuple[str, str]] = {None: ("X", "-")}
+
+
+def _locked_values_with_quality(quality: Optional[object]) -> tuple[str, str]:
+    values = _LOCKED_VALUES_BY_QUALITY.get(quality)
+    if values is None:
+        values = _LOCKED_VALUES_BY_QUALITY[quality] = ("X", str(quality))
+    return values
+
+
+# Column id -> (sort key, Korean heading, English heading, column options)
+_STANDARD_TREE_COLUMNS: Dict[str, tuple[str, str, str, Dict[str, object]]] = {
+    "#0": ("name", "이름", "Name", {"anchor": "w", "width": 360, "stretch": True}),
+    "unlock": (
+        "unlock",
+        "해금 여부",
+        "Unlock Status",
+        {"anchor": "center", "width": 140, "stretch": False},
+    ),
+    "quality": (
+        "quality",
+        "등급",
+        "Quality",
+        {"anchor": "center", "width": 120, "stretch": False},
+    ),
+}
+
 MAX_ICON_HEIGHT = 32
 try:
-    _RESAMPLING_LANCZOS = Image.Resampling.LANCZOS  # type: ignore[attr-defined]
+    _RESAMPLING_BILINEAR = Image.Resampling.BILINEAR  # type: ignore[attr-defined]
 except AttributeError:  # Pillow < 9.1 compatibility
-    _RESAMPLING_LANCZOS = Image.LANCZOS
+    _RESAMPLING_BILINEAR = Image.BILINEAR
+
+
+ICON_CACHE_DIR = DATA_DIR / "cache"
+_ICON_CACHE_MAGIC = b"ICN2"
+_ICON_CACHE_HEADER = struct.Struct("<4sI")
+_ICON_CACHE_ENTRY = struct.Struct("<HHH")
+
+
+def _icon_cache_path(paths: Iterable[Path]) -> Path:
+    """Return the cache file for the given icon files.
+
+    The name is derived from each file's name, size and mtime so that any
+    change to the icon folders produces a fresh cache.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(MAX_ICON_HEIGHT).encode("ascii"))
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(
+            f"{path.parent.name}/{path.name}:{stat.st_mtime_ns}:{stat.st_size}\n".encode(
+                "utf-8"
+            )
+        )
+    return ICON_CACHE_DIR / f"icons_{digest.hexdigest()}.bin"
+
+
+def _read_icon_cache(cache_path: Path) -> Optional[Dict[str, Image.Image]]:
+    try:
+        payload = cache_path.read_bytes()
+    except OSError:
+        return None
+    try:
+        magic, count = _ICON_CACHE_HEADER.unpack_from(payload, 0)
+        if magic != _ICON_CACHE_MAGIC:
+            return None
+        position = _ICON_CACHE_HEADER.size
+        images: Dict[str, Image.Image] = {}
+        for _ in range(count):
+            name_length, width, height = _ICON_CACHE_ENTRY.unpack_from(payload, position)
+            position += _ICON_CACHE_ENTRY.size
+            name = payload[position : position + name_length].decode("utf-8")
+            position += name_length
+            size = width * height * 4
+            pixels = payload[position : position + size]
+            if len(pixels) != size:
+                return None
+            position += size
+            images[name] = Image.frombytes("RGBA", (width, height), pixels)
+    except (struct.error, UnicodeDecodeError, ValueError):
+        return None
+    return images
+
+
+def _write_icon_cache(cache_path: Path, images: Dict[str, Image.Image]) -> None:
+    chunks = [_ICON_CACHE_HEADER.pack(_ICON_CACHE_MAGIC, len(images))]
+    for name, image in images.items():
+        encoded_name = name.encode("utf-8")
+        chunks.append(_ICON_CACHE_ENTRY.pack(len(encoded_name), image.width, image.height))
+        chunks.append(encoded_name)
+        chunks.append(image.tobytes())
+    temp_path = cache_path.with_suffix(".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(b"".join(chunks))
+        os.replace(temp_path, cache_path)
+    except OSError:
+        return
+    for stale in cache_path.parent.glob("icons_*.bin"):
+        if stale != cache_path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def _decode_icon(path: Path) -> Optional[Image.Image]:
+    try:
+        with Image.open(path) as source:
+            image = source.convert("RGBA")
+    except (OSError, ValueError):
+        return None
+    if image.height > MAX_ICON_HEIGHT:
+        image.thumbnail((image.width, MAX_ICON_HEIGHT), _RESAMPLING_BILINEAR)
+    return image
+
+
+def _icon_base_name(path: Path) -> str:
+    base_name = path.stem
+    if "__" in base_name:
+        prefix, _ = base_name.rsplit("__", 1)
+        if prefix:
+            base_name = prefix
+    if "___" in base_name:
+        base_name = base_name.replace("___", "???")
+    base_name = _ICON_AFFIX_RE.sub("", base_name)
+    base_name = _ICON_SEPARATOR_RE.sub(" ", base_name).strip()
+    return _ICON_TRAILING_KIND_RE.sub("", base_name).strip()
 
 
 def _load_checkbox_asset(path: str) -> Image.Image:
@@ -299,7 +594,69 @@ _CHECKBOX_BASE_IMAGES: Dict[str, Image.Image] = {
 @dataclass
 class SecretIcon:
     pil_image: Image.Image
-    tk_image: ImageTk.PhotoImage
+    _tk_image: Optional[ImageTk.PhotoImage] = field(default=None, init=False, repr=False)
+
+    @property
+    def tk_image(self) -> ImageTk.PhotoImage:
+        # Rows are drawn from composited PIL images, so the Tk copy is only
+        # created if something asks for it.
+        if self._tk_image is None:
+            self._tk_image = ImageTk.PhotoImage(self.pil_image)
+        return self._tk_image
+
+
+@dataclass(slots=True)
+class TreeRecord:
+    """Sort and unlock state for a single tree row."""
+
+    iid: str
+    name_sort: str
+    unlock: bool
+    quality: Optional[int]
+    sort_default: str
+    sort_english: str
+
+    def __getitem__(self, key: str) -> object:
+        return getattr(self, key)
+
+
+@dataclass(frozen=True, slots=True)
+class NumericField:
+    """Decoded layout of one numeric field config; ``offsets[0]`` is the primary."""
+
+    key: str
+    offsets: tuple[int, ...]
+    is_absolute: bool
+    num_bytes: int
+    signed: bool
+    min_value: Optional[int]
+    max_value: Optional[int]
+    description: tuple[str, str]
+
+
+@dataclass(slots=True)
+class ItemRecord:
+    """A row of ``ui_items.csv`` with its precomputed display and sort keys."""
+
+    iid: str
+    display: str
+    name_sort: str
+    quality: Optional[int]
+    english: str
+    korean: str
+    item_type: str
+    translations: Dict[str, str]
+    display_by_lang: Dict[tuple[str, bool], str]
+    sort_default: str
+    sort_english: str
+
+    # The display/sort helpers are shared with the dict-based secret and
+    # challenge records, so keep mapping-style access working.
+    def __getitem__(self, key: str) -> object:
+        return getattr(self, key)
+
+    def get(self, key: str, default: object = None) -> object:
+        return getattr(self, key, default)
 
 
 class IconCheckboxTreeview(CheckboxTreeview):
@@ -312,6 +669,7 @@ class IconCheckboxTreeview(CheckboxTreeview):
     _ICON_ROW_PADDING = 0
     _COMPACT_ROW_PADDING = 6
     _ICON_PLACEHOLDER_SIZE = (MAX_ICON_HEIGHT, MAX_ICON_HEIGHT)
+    _VIEWPORT_OVERSCAN = 10
     _CONFIGURED_STYLES: Set[str] = set()
 
     def __init__(
@@ -346,25 +704,103 @@ class IconCheckboxTreeview(CheckboxTreeview):
         self.configure(style=style_name)
         self._item_icons: Dict[str, Image.Image] = {}
         self._composite_images: Dict[str, Dict[str, ImageTk.PhotoImage]] = {}
+        # Icon composites are only rendered for rows near the visible viewport;
+        # the rest stay pending until they are scrolled into view.
+        self._pending_icon_ids: Set[str] = set()
+        self._viewport_job: Optional[str] = None
+        self.bind("<Configure>", self.schedule_viewport_refresh, add="+")
+        self.bind("<Map>", self.schedule_viewport_refresh, add="+")
 
     def set_item_icon(self, item_id: str, icon: SecretIcon) -> None:
-        self._item_icons[item_id] = icon.pil_image
-        if self._icon_mode:
-            placeholder_width, placeholder_height = self._icon_placeholder_size
-            new_width = max(placeholder_width, icon.pil_image.width)
-            new_height = max(placeholder_height, icon.pil_image.height)
-            if (new_width, new_height) != self._icon_placeholder_size:
-                self._icon_placeholder_size = (new_width, new_height)
-                self._placeholder_images.clear()
-                self._refresh_placeholder_items()
-        self._composite_images.pop(item_id, None)
-        self._apply_item_image(item_id)
+        self.set_item_icons({item_id: icon})
+
+    def set_item_icons(self, icons: Dict[str, SecretIcon]) -> None:
+        if not icons:
+            return
+        placeholder_width, placeholder_height = self._icon_placeholder_size
+        for item_id, icon in icons.items():
+            self._item_icons[item_id] = icon.pil_image
+            self._composite_images.pop(item_id, None)
+            placeholder_width = max(placeholder_width, icon.pil_image.width)
+            placeholder_height = max(placeholder_height, icon.pil_image.height)
+        if self._icon_mode and (placeholder_width, placeholder_height) != self._icon_placeholder_size:
+            self._icon_placeholder_size = (placeholder_width, placeholder_height)
+            self._placeholder_images.clear()
+            self._refresh_placeholder_items()
+        self._pending_icon_ids.update(icons)
+        self.schedule_viewport_refresh()
+
+    def set_item_texts(self, texts: Dict[str, str]) -> None:
+        """Set the ``#0`` text of many rows with a single Tcl call."""
+
+        if not texts:
+            return
+        pairs = tuple(value for pair in texts.items() for value in pair)
+        self.tk.call(
+            "apply",
+            "{w pairs} {foreach {iid text} $pairs {$w item $iid -text $text}}",
+            self._w,
+            pairs,
+        )
+
+    def tag_add_items(self, tag: str, items: Iterable[str]) -> None:
+        items = tuple(items)
+        if items:
+            self.tk.call(self._w, "tag", "add", tag, items)
+
+    def tag_remove_items(self, tag: str, items: Iterable[str]) -> None:
+        items = tuple(items)
+        if items:
+            self.tk.call(self._w, "tag", "remove", tag, items)
+
+    def change_states(self, items: Iterable[str], state: str) -> None:
+        """Move many rows to ``state`` with one tag call per checkbox state."""
+
+        items = tuple(items)
+        if not items:
+            return
+        changed: Set[str] = set()
+        for other in ("checked", "unchecked", "tristate"):
+            if other != state:
+                changed.update(self.tag_has(other))
+                self.tag_remove_items(other, items)
+        self.tag_add_items(state, items)
+        for item in changed.intersection(items).intersection(self._item_icons):
+            if item not in self._pending_icon_ids:
+                self._apply_item_image(item)
+
+    def set_all_states(self, state: str) -> None:
+        self.change_states(self.get_children(""), state)
 
     def change_state(self, item, state):  # type: ignore[override]
         super().change_state(item, state)
-        if item in self._item_icons:
+        if item in self._item_icons and item not in self._pending_icon_ids:
             self._apply_item_image(item)
 
+    def schedule_viewport_refresh(self, _event: Optional[tk.Event] = None) -> None:
+        if self._viewport_job is not None or not self._pending_icon_ids:
+            return
+        self._viewport_job = self.after_idle(self._materialize_visible_icons)
+
+    def _materialize_visible_icons(self) -> None:
+        self._viewport_job = None
+        if not self._pending_icon_ids or not self.winfo_ismapped():
+            return
+        children = self.get_children("")
+        if not children:
+            return
+        try:
+            top, bottom = self.yview()
+        except tk.TclError:
+            return
+        count = len(children)
+        first = max(0, int(top * count) - self._VIEWPORT_OVERSCAN)
+        last = min(count, int(math.ceil(bottom * count)) + self._VIEWPORT_OVERSCAN)
+        for item_id in children[first:last]:
+            if item_id in self._pending_icon_ids:
+                self._pending_icon_ids.discard(item_id)
+                self._apply_item_image(item_id)
+
     def _apply_item_image(self, item_id: str) -> None:
         image = self._get_state_image(item_id, self._get_item_state(item_id))
         self.item(item_id, image=image)
@@ -441,9 +877,10 @@ class IconCheckboxTreeview(CheckboxTreeview):
 class TreeManager:
     """Manage sorting and column updates for :class:`IconCheckboxTreeview`."""
 
-    def __init__(self, tree: IconCheckboxTreeview, records: Dict[str, Dict[str, object]]):
+    def __init__(self, tree: IconCheckboxTreeview, records: Dict[str, TreeRecord]):
         self.tree = tree
-        self.records = records
+        self._records = records
+        self._name_order: Optional[List[str]] = None
         self._next_direction: Dict[str, bool] = {}
         self._last_sort_column: Optional[str] = None
         self._last_sort_ascending: bool = True
@@ -454,14 +891,9 @@ class TreeManager:
             return
         if ascending is None:
             ascending = self._next_direction.get(column, True)
-        entries = [
-            info
-            for info in self.records.values()
-            if str(info.get("iid")) not in self._hidden_ids
-        ]
-        self._sort_entries(entries, column, ascending)
-        for index, info in enumerate(entries):
-            self.tree.move(str(info["iid"]), "", index)
+        include = self.records.keys() - self._hidden_ids
+        for index, iid in enumerate(self._ordered_ids(include, column, ascending)):
+            self.tree.move(iid, "", index)
         if update_toggle:
             self._next_direction[column] = not ascending
         else:
@@ -469,45 +901,63 @@ class TreeManager:
         self._last_sort_column = column
         self._last_sort_ascending = ascending
 
+    @property
+    def records(self) -> Dict[str, TreeRecord]:
+        return self._records
+
+    @records.setter
+    def records(self, records: Dict[str, TreeRecord]) -> None:
+        self._records = records
+        self._name_order = None
+
+    def invalidate_name_order(self) -> None:
+        """Drop the cached name order after ``name_sort`` values change."""
+
+        self._name_order = None
+
+    def mark_sorted(self, column: str, ascending: bool = True) -> None:
+        """Record that rows were inserted already sorted by ``column``."""
+
+        self._next_direction.setdefault(column, not ascending)
+        self._last_sort_column = column
+        self._last_sort_ascending = ascending
+
     def resort(self) -> None:
         if self._last_sort_column:
             self.sort(self._last_sort_column, ascending=self._last_sort_ascending, update_toggle=False)
 
-    def _sort_entries(self, entries: List[Dict[str, object]], column: str, ascending: bool) -> None:
+    def _ordered_ids(self, include: Set[str], column: str, ascending: bool) -> List[str]:
+        records = self.records
+        if column not in ("name", "unlock", "quality"):
+            return [iid for iid in records if iid in include]
+        if self._name_order is None:
+            iids = list(records)
+            keys = [records[iid].name_sort for iid in iids]
+            self._name_order = [iids[index] for index in sorted(range(len(iids)), key=keys.__getitem__)]
+        ordered = [iid for iid in self._name_order if iid in include]
         if column == "name":
-            entries.sort(key=lambda info: str(info.get("name_sort", "")))
             if not ascending:
-                entries.reverse()
-            return
-        if column == "unlock":
-            entries.sort(key=lambda info: str(info.get("name_sort", "")))
-            entries.sort(key=lambda info: 1 if info.get("unlock") else 0, reverse=not ascending)
-            return
-        if column == "quality":
-            entries.sort(key=lambda info: str(info.get("name_sort", "")))
-            entries.sort(
-                key=lambda info: info.get("quality") if info.get("quality") is not None else -1,
+                ordered.reverse()
+        elif column == "unlock":
+            ordered.sort(key=lambda iid: 1 if records[iid].unlock else 0, reverse=not ascending)
+        else:
+            ordered.sort(
+                key=lambda iid: records[iid].quality if records[iid].quality is not None else -1,
                 reverse=not ascending,
             )
+        return ordered
 
     def sorted_ids(self, include_ids: Optional[Set[str]] = None) -> List[str]:
         if not self.records:
             return []
         column = self._last_sort_column or "name"
         ascending = self._last_sort_ascending if self._last_sort_column else True
-        entries = list(self.records.values())
         if include_ids is None:
-            include: Set[str] = {
-                str(info.get("iid"))
-                for info in entries
-                if str(info.get("iid")) not in self._hidden_ids
-            }
+            include: Set[str] = self.records.keys() - self._hidden_ids
         else:
             include = {str(value) for value in include_ids}
             include.difference_update(self._hidden_ids)
-        entries = [info for info in entries if str(info.get("iid")) in include]
-        self._sort_entries(entries, column, ascending)
-        return [str(info.get("iid")) for info in entries]
+        return self._ordered_ids(include, column, ascending)
 
     def set_hidden_ids(self, hidden_ids: Set[str]) -> None:
         self._hidden_ids = {str(value) for value in hidden_ids if str(value)}
@@ -520,7 +970,7 @@ class TreeManager:
 
     def set_unlock(self, iid: str, unlocked: bool) -> None:
         if iid in self.records:
-            self.records[iid]["unlock"] = bool(unlocked)
+            self.records[iid].unlock = bool(unlocked)
             self.tree.set(iid, "unlock", "O" if unlocked else "X")
 
 
@@ -544,6 +994,13 @@ class IsaacSaveEditor(tk.Tk):
     }
     SECRET_FALLBACK_TYPE = "Other"
     SECRET_SEARCH_TYPES = frozenset({"Item.Passive", "Item.Active", "Trinket"})
+    _SEARCH_GRAM_LENGTH = 3
+    _SAVE_POLL_MS = 50
+    _REFRESH_SECTIONS = frozenset(
+        {"numeric", "bestiary", "completion", "secrets", "items", "challenges"}
+    )
+    # Secret writes also touch stat counters through SECRET_UNLOCK_OVERRIDES.
+    _SECRET_REFRESH_SECTIONS = frozenset({"numeric", "secrets", "challenges"})
     SECRET_UNLOCK_OVERRIDES: Dict[str, Dict[str, object]] = dict(script.SECRET_UNLOCK_OVERRIDES)
 
     def _text(self, korean: str, english: str | None = None) -> str:
@@ -839,15 +1296,37 @@ class IsaacSaveEditor(tk.Tk):
             callback()
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _normalize_sort_key(value: str) -> str:
         return " ".join((value or "").casefold().split())
 
-    def _make_tree_item_language_updater(
+    @staticmethod
+    def _make_tree_record(record: Dict[str, object], quality: Optional[int]) -> TreeRecord:
+        name_sort = str(record.get("name_sort", ""))
+        sort_default = str(record.get("sort_default", name_sort))
+        return TreeRecord(
+            iid=str(record["iid"]),
+            name_sort=sort_default,
+            unlock=False,
+            quality=quality,
+            sort_default=sort_default,
+            sort_english=str(record.get("sort_english", name_sort)),
+        )
+
+    @staticmethod
+    def _presorted_records(records: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
+        # Matches TreeManager's "name" ordering for freshly built rows, whose
+        # name_sort starts out as the record's sort_default.
+        return sorted(
+            records,
+            key=lambda record: str(record.get("sort_default", record.get("name_sort", ""))),
+        )
+
+    def _make_tree_language_updater(
         self,
         tree: IconCheckboxTreeview,
-        item_id: str,
+        records_by_id: Dict[str, Dict[str, object]],
         category: str,
-        translations: Dict[str, str] | None,
         *,
         is_secret: bool = True,
     ) -> Callable[[], None]:
@@ -857,13 +1336,32 @@ class IsaacSaveEditor(tk.Tk):
                 english_first = self._secret_alphabetical.get(category, False)
             else:
                 english_first = self._item_alphabetical.get(category, False)
-            tree.item(
-                item_id,
-                text=self._format_display_name(translations or {}, english_first=english_first),
+            tree.set_item_texts(
+                {
+                    item_id: self._record_display_name(record, english_first=english_first)
+                    for item_id, record in records_by_id.items()
+                }
             )
 
         return updater
 
+    def _record_display_name(
+        self, record: Dict[str, object], *, english_first: bool = False
+    ) -> str:
+        display_by_lang = record.get("display_by_lang")
+        if not isinstance(display_by_lang, dict):
+            display_by_lang = {}
+            record["display_by_lang"] = display_by_lang
+        key = (getattr(self, "_language_code", "ko_kr"), english_first)
+        display = display_by_lang.get(key)
+        if display is None:
+            display = self._format_display_name(
+                record.get("translations", {}),
+                english_first=english_first,
+            )
+            display_by_lang[key] = display
+        return display
+
     def _format_display_name(
         self,
         korean_or_translations: object,
@@ -872,58 +1370,22 @@ class IsaacSaveEditor(tk.Tk):
         english_first: bool = False,
     ) -> str:
         language_code = getattr(self, "_language_code", "ko_kr")
-        translations: Dict[str, str]
         if isinstance(korean_or_translations, dict):
-            translations = {
-                str(key): str(value)
-                for key, value in korean_or_translations.items()
-                if value is not None and str(value).strip()
-            }
-            korean_text = translations.get("ko_kr") or translations.get("korean") or ""
-            english_text = (
-                translations.get("en_us")
-                or translations.get("english")
-                or english
-                or ""
-            )
+            frozen_translations = frozenset(korean_or_translations.items())
         else:
             korean_text = str(korean_or_translations or "")
             english_text = str(english or "")
-            translations = {
-                "ko_kr": korean_text,
-                "korean": korean_text,
-                "en_us": english_text,
-                "english": english_text,
-            }
-
-        primary_text = translations.get(language_code, "").strip()
-        if not primary_text:
-            if language_code == "ko_kr":
-                primary_text = korean_text or english_text
-            elif language_code == "en_us":
-                primary_text = english_text or korean_text
-            else:
-                primary_text = translations.get(language_code.split("_", 1)[0], "").strip()
-        if not primary_text:
-            primary_text = english_text or korean_text
-
-        secondary_text = ""
-        if english_first:
-            primary = english_text or primary_text
-            secondary_text = primary_text if primary != primary_text else ""
-        else:
-            primary = primary_text
-            comparison = english_text
-            if language_code == "ko_kr":
-                comparison = english_text
-            elif language_code != "en_us":
-                comparison = english_text or korean_text
-            if comparison and comparison != primary:
-                secondary_text = comparison
-
-        if primary and secondary_text:
-            return f"{primary} ({secondary_text})"
-        return primary or secondary_text or english_text or korean_text or ""
+            frozen_translations = frozenset(
+                (
+                    ("ko_kr", korean_text),
+                    ("korean", korean_text),
+                    ("en_us", english_text),
+                    ("english", english_text),
+                )
+            )
+        return _format_display_name_cached(
+            frozen_translations, english, english_first, language_code
+        )
 
     def _load_available_languages(self) -> Dict[str, Dict[str, str]]:
         languages: Dict[str, Dict[str, str]] = {}
@@ -1037,13 +1499,20 @@ class IsaacSaveEditor(tk.Tk):
         selector = getattr(self, "_language_selector", None)
         if selector is None:
             return
-        selector.configure(values=self._language_display_options)
+        self._set_combobox_values(selector, self._language_display_options)
         display_value = self._language_display_by_code.get(
             self._language_code,
             self._language_code,
         )
         self._language_display_var.set(display_value)
 
+    def _set_combobox_values(self, box: ttk.Combobox, values: Iterable[str]) -> None:
+        new_values = tuple(values)
+        if self._combobox_last_values.get(id(box)) == new_values:
+            return
+        box.configure(values=new_values)
+        self._combobox_last_values[id(box)] = new_values
+
     def _refresh_completion_character_options(self) -> None:
         box = getattr(self, "_completion_character_box", None)
         if box is None:
@@ -1055,7 +1524,7 @@ class IsaacSaveEditor(tk.Tk):
             mapping[display] = int(info.get("index", 0))
             options.append(display)
         self._completion_display_to_index = mapping
-        box.configure(values=options)
+        self._set_combobox_values(box, options)
         if not options:
             box.configure(state="disabled")
             self._completion_character_var.set("")
@@ -1105,6 +1574,8 @@ class IsaacSaveEditor(tk.Tk):
             self.loaded_file_var.set(self._default_loaded_text)
 
     def __init__(self) -> None:
+        # Parse the translation table while Tk and the widgets come up.
+        localization.preload_ui_translations()
         super().__init__()
         self.title(f"Isaac Savefile Editor v{APP_VERSION}")
 
@@ -1117,6 +1588,9 @@ class IsaacSaveEditor(tk.Tk):
         self.settings = self._load_settings()
         self._geometry_ready = False
         self._geometry_dirty = False
+        self._settings_after_id: Optional[str] = None
+        self._settings_written = ""
+        self._related_paths_cache: Optional[tuple[str, tuple[Path, ...]]] = None
         self.bind("<Configure>", self._on_window_configure)
         self.protocol("WM_DELETE_WINDOW", self._on_close_requested)
         self._available_languages = self._load_available_languages()
@@ -1142,11 +1616,19 @@ class IsaacSaveEditor(tk.Tk):
         self._update_check_started = False
         self._set_version_status("버전 확인 중...", "Checking for updates...")
         self._register_language_binding(self._refresh_version_status_language)
+        # ``self.settings`` mirrors the checkbox variables; the toggle handlers
+        # keep it current so settings writes never have to read back from Tcl.
+        self.settings["highlight_locked_items"] = bool(
+            self.settings.get("highlight_locked_items", False)
+        )
+        self.settings["highlight_locked_secrets"] = bool(
+            self.settings.get("highlight_locked_secrets", False)
+        )
         self._highlight_locked_items_var = tk.BooleanVar(
-            value=bool(self.settings.get("highlight_locked_items", False))
+            value=self.settings["highlight_locked_items"]
         )
         self._highlight_locked_secrets_var = tk.BooleanVar(
-            value=bool(self.settings.get("highlight_locked_secrets", False))
+            value=self.settings["highlight_locked_secrets"]
         )
         self.settings["language"] = self._language_code
         self.settings["english_ui"] = self._english_ui_enabled
@@ -1156,6 +1638,7 @@ class IsaacSaveEditor(tk.Tk):
         self.settings["source_save_path"] = self.source_save_path
         self.settings["target_save_path"] = self.target_save_path
         remember_path = bool(self.settings.get("remember_path", False))
+        self.settings["remember_path"] = remember_path
         self.remember_path_var = tk.BooleanVar(value=remember_path)
         self._register_language_binding(lambda: self._update_default_loaded_text())
 
@@ -1224,9 +1707,10 @@ class IsaacSaveEditor(tk.Tk):
             "streak",
             "eden",
         ]
+        self._numeric_fields = self._build_numeric_fields()
         self._stat_order: List[str] = []
 
-        self._numeric_vars: Dict[str, Dict[str, tk.StringVar]] = {}
+        self._numeric_vars: Dict[str, Dict[str, tk.Variable]] = {}
         self._bestiary_entries: List[Dict[str, object]] = [
             {
                 "key": "frowning_gaper",
@@ -1260,11 +1744,34 @@ class IsaacSaveEditor(tk.Tk):
         self._bestiary_positions: Dict[bytes, Dict[int, int]] = {}
 
         self._locked_tree_ids: Set[int] = set()
+        self._tree_refresh_keys: Dict[int, tuple[int, bool]] = {}
+        self._combobox_last_values: Dict[int, tuple[str, ...]] = {}
+        # A single worker keeps queued saves in submission order.
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_save: Optional[Future[None]] = None
+        # Saves whose failure has not been shown yet, keyed to their path.
+        self._unreported_saves: Dict[Future[None], str] = {}
+        # Last buffer from script.updateChecksum; lets the next checksum
+        # rehash only the bytes an edit changed.
+        self._checksummed_data: Optional[bytes] = None
+
+        loader = ThreadPoolExecutor(max_workers=4)
+        item_future = loader.submit(self._load_item_records)
+        secret_future = loader.submit(
+            lambda: self._load_secret_records(item_future.result()[2])
+        )
+        challenge_future = loader.submit(self._load_challenge_records)
+        completion_future = loader.submit(self._load_completion_records)
+        icon_future = loader.submit(self._read_secret_icon_images)
+        # Build the checksum lookup table off the UI thread, before the first edit.
+        loader.submit(script.prepareChecksumTables)
 
         (
             self._completion_characters,
             self._completion_marks_by_character,
-        ) = self._load_completion_records()
+        ) = completion_future.result()
+        self._completion_mask_cache: Dict[int, Dict[int, int]] = {}
+        self._completion_mask_tables: Dict[tuple[Optional[int], int], tuple[int, ...]] = {}
         self._completion_character_var = tk.StringVar()
         self._completion_display_to_index: Dict[str, int] = {}
         self._completion_tree: Optional[IconCheckboxTreeview] = None
@@ -1276,7 +1783,7 @@ class IsaacSaveEditor(tk.Tk):
             self._item_records,
             self._item_ids_by_type,
             self._item_lookup_by_name,
-        ) = self._load_item_records()
+        ) = item_future.result()
 
         (
             self._secret_records_by_type,
@@ -1284,27 +1791,45 @@ class IsaacSaveEditor(tk.Tk):
             self._secret_tab_labels,
             self._secret_tab_order,
             self._secret_details_by_id,
-        ) = self._load_secret_records(self._item_lookup_by_name)
+        ) = secret_future.result()
         self._secret_icon_store: List[SecretIcon] = []
         self._secret_icon_images_by_type: Dict[str, Dict[str, SecretIcon]] = (
-            self._load_secret_icons()
+            self._load_secret_icons(*icon_future.result())
         )
         self._secret_trees: Dict[str, IconCheckboxTreeview] = {}
         self._secret_managers: Dict[str, TreeManager] = {}
         self._secret_alphabetical: Dict[str, bool] = {}
         self._secret_search_vars: Dict[str, tk.StringVar] = {}
         self._secret_search_filters: Dict[str, str] = {}
+        self._secret_search_index_cache: Dict[tuple[str, str], List[tuple[str, str]]] = {}
+        self._secret_search_gram_cache: Dict[tuple[str, str], Dict[str, Set[str]]] = {}
+        self._known_secret_ids: frozenset[str] = frozenset(
+            secret_id for secret_ids in self._secret_ids_by_type.values() for secret_id in secret_ids
+        )
+        self._unlocked_secret_ids: Set[str] = set()
+        self._parsed_data_source: Optional[bytes] = None
+        self._parsed_data_cache: Dict[Callable[[bytes], Any], Any] = {}
+        self._pending_tab_builders: Dict[str, Callable[[], None]] = {}
+        self._built_tabs: Set[str] = set()
+        self._secret_tab_ids: Dict[str, str] = {}
+        self._deferred_tab_refreshes: Dict[str, Callable[[], None]] = {}
 
         self._item_trees: Dict[str, IconCheckboxTreeview] = {}
         self._item_managers: Dict[str, TreeManager] = {}
         self._item_alphabetical: Dict[str, bool] = {}
 
-        self._secret_to_challenges: Dict[str, Set[str]] = {}
-        self._challenge_to_secrets: Dict[str, Set[str]] = {}
-        self._challenge_records = self._load_challenge_records()
+        self._secret_to_challenges: Dict[str, frozenset[str]] = {}
+        self._challenge_to_secrets: Dict[str, frozenset[str]] = {}
+        # Secrets reachable from each secret through its linked challenges.
+        self._secret_closure: Dict[str, frozenset[str]] = {}
+        self._relation_cache: Dict[tuple[str, frozenset[str]], tuple[frozenset[str], frozenset[str]]] = {}
+        self._challenge_records = challenge_future.result()
+        loader.shutdown(wait=False)
         self._challenge_tree: Optional[IconCheckboxTreeview] = None
         self._challenge_manager: Optional[TreeManager] = None
         self._challenge_ids: List[str] = [record["iid"] for record in self._challenge_records]
+        self._challenge_ids_sorted: tuple[int, ...] = tuple(_sorted_int_ids(self._challenge_ids))
+        self._unlocked_challenge_ids: Set[str] = set()
 
         self._build_secret_challenge_links()
 
@@ -1317,13 +1842,18 @@ class IsaacSaveEditor(tk.Tk):
         self.after(0, self._perform_startup_tasks)
 
     @staticmethod
-    def _build_lookup_keys(*values: str) -> Set[str]:
+    def _normalize_lookup_name(value: str) -> str:
+        return " ".join(value.replace("’", "'").split()).casefold()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _build_lookup_keys(*values: str) -> frozenset[str]:
         keys: Set[str] = set()
         articles = ("the ", "a ", "an ")
         for value in values:
             if not value:
                 continue
-            normalized = " ".join(value.replace("’", "'").split()).casefold()
+            normalized = IsaacSaveEditor._normalize_lookup_name(value)
             if not normalized:
                 continue
             candidates = {normalized, normalized.replace("'", "")}
@@ -1336,10 +1866,10 @@ class IsaacSaveEditor(tk.Tk):
             stripped = normalized.strip("!?.")
             if stripped:
                 candidates.add(stripped)
-            no_punct = re.sub(r"[!?.]", "", normalized).strip()
+            no_punct = _LOOKUP_PUNCT_RE.sub("", normalized).strip()
             if no_punct:
                 candidates.add(no_punct)
-            no_paren = re.sub(r"\s*\(.*?\)", "", normalized).strip()
+            no_paren = _LOOKUP_PAREN_RE.sub("", normalized).strip()
             if no_paren:
                 candidates.add(no_paren)
             for candidate in list(candidates):
@@ -1351,36 +1881,54 @@ class IsaacSaveEditor(tk.Tk):
                         if stripped_candidate:
                             candidates.add(stripped_candidate)
             keys.update(candidate for candidate in candidates if candidate)
-        return keys
+        return frozenset(keys)
 
     def _completion_mask_for_mark(
         self, mark_index: int, char_index: Optional[int] = None
     ) -> int:
         if char_index is not None:
-            marks = self._completion_marks_by_character.get(char_index, [])
-            for mark in marks:
-                try:
-                    if int(mark.get("mark_index", -1)) != mark_index:
-                        continue
-                except (TypeError, ValueError):
-                    continue
-                value = mark.get("unlock_value")
-                if isinstance(value, int):
-                    return value
-                if isinstance(value, str):
-                    value_str = value.strip()
-                    if value_str:
-                        try:
-                            parsed = int(value_str)
-                        except ValueError:
-                            pass
-                        else:
-                            mark["unlock_value"] = parsed
-                            return parsed
+            mask = self._completion_masks_for_character(char_index).get(mark_index)
+            if mask is not None:
+                return mask
         if mark_index == COMPLETION_GREED_MARK_INDEX:
             return GREED_COMPLETION_UNLOCK_MASK
         return DEFAULT_COMPLETION_UNLOCK_MASK
 
+    def _completion_mask_table(self, char_index: Optional[int], length: int) -> tuple[int, ...]:
+        key = (char_index, length)
+        table = self._completion_mask_tables.get(key)
+        if table is None:
+            table = tuple(
+                self._completion_mask_for_mark(mark_index, char_index) for mark_index in range(length)
+            )
+            self._completion_mask_tables[key] = table
+        return table
+
+    def _completion_masks_for_character(self, char_index: int) -> Dict[int, int]:
+        """Return the CSV-provided unlock masks of a character, keyed by mark index."""
+
+        cached = self._completion_mask_cache.get(char_index)
+        if cached is not None:
+            return cached
+        masks: Dict[int, int] = {}
+        for mark in self._completion_marks_by_character.get(char_index, []):
+            try:
+                mark_index = int(mark.get("mark_index", -1))
+            except (TypeError, ValueError):
+                continue
+            if mark_index in masks:
+                continue
+            value = mark.get("unlock_value")
+            if isinstance(value, str):
+                try:
+                    value = int(value.strip())
+                except ValueError:
+                    continue
+            if isinstance(value, int):
+                masks[mark_index] = value
+        self._completion_mask_cache[char_index] = masks
+        return masks
+
     @staticmethod
     def _normalize_save_path(value: object) -> str:
         if isinstance(value, str):
@@ -1393,10 +1941,14 @@ class IsaacSaveEditor(tk.Tk):
     def _paths_equal(first: str, second: str) -> bool:
         if not first or not second:
             return False
+        first_normalized = _comparable_path(first)
+        second_normalized = _comparable_path(second)
+        if first_normalized == second_normalized:
+            return True
         try:
             return os.path.samefile(first, second)
         except OSError:
-            return os.path.abspath(first) == os.path.abspath(second)
+            return False
 
     @staticmethod
     def _path_contains_steam(path: str) -> bool:
@@ -1439,7 +1991,10 @@ class IsaacSaveEditor(tk.Tk):
             secrets_tab.columnconfigure(0, weight=1)
             notebook.add(secrets_tab)
             self._register_tab_text(notebook, secrets_tab, tab_label[0], tab_label[1])
-            self._build_secrets_tab(secrets_tab, secret_type)
+            self._secret_tab_ids[secret_type] = str(secrets_tab)
+            self._pending_tab_builders[str(secrets_tab)] = partial(
+                self._build_pending_secrets_tab, secrets_tab, secret_type
+            )
 
         secret_order = [
             secret_type
@@ -1465,6 +2020,38 @@ class IsaacSaveEditor(tk.Tk):
         if none_tab_type:
             add_secret_tab(none_tab_type)
 
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+
+    def _on_tab_changed(self, _event: Optional[tk.Event] = None) -> None:
+        notebook = getattr(self, "notebook", None)
+        if notebook is None:
+            return
+        tab_id = notebook.select()
+        refresher = self._deferred_tab_refreshes.pop(tab_id, None)
+        if refresher is not None:
+            refresher()
+        if not tab_id or tab_id in self._built_tabs:
+            return
+        builder = self._pending_tab_builders.pop(tab_id, None)
+        if builder is None:
+            return
+        self._built_tabs.add(tab_id)
+        builder()
+
+    def _build_pending_secrets_tab(self, container: ttk.Frame, secret_type: str) -> None:
+        self._build_secrets_tab(container, secret_type)
+        self._refresh_secret_tree_from_state(secret_type)
+
+    def _refresh_when_visible(self, tab_id: Optional[str], refresher: Callable[[], None]) -> None:
+        """Run ``refresher`` now if ``tab_id`` is showing, otherwise on its next selection."""
+
+        notebook = getattr(self, "notebook", None)
+        if tab_id is None or notebook is None or notebook.select() == tab_id:
+            self._deferred_tab_refreshes.pop(tab_id, None)
+            refresher()
+        else:
+            self._deferred_tab_refreshes[tab_id] = refresher
+
     def _record_window_geometry(
         self, width: int, height: int, *, mark_dirty: bool = True
     ) -> None:
@@ -1523,7 +2110,10 @@ class IsaacSaveEditor(tk.Tk):
         except tk.TclError:
             width = height = 0
         self._record_window_geometry(width, height)
-        self._save_settings()
+        self._flush_settings()
+        if not self._flush_pending_saves():
+            return
+        self._save_executor.shutdown()
         self.destroy()
 
     def _set_initial_window_size(self) -> None:
@@ -1666,7 +2256,7 @@ class IsaacSaveEditor(tk.Tk):
         next_row = 0
         for key in self._numeric_order:
             config = self._numeric_config[key]
-            current_var = tk.StringVar(value="0")
+            current_var = tk.IntVar(value=0)
             entry_var = tk.StringVar(value="0")
             self._numeric_vars[key] = {
                 "current": current_var,
@@ -1759,7 +2349,7 @@ class IsaacSaveEditor(tk.Tk):
         container.columnconfigure(0, weight=1)
         for index, key in enumerate(self._stat_order):
             config = self._numeric_config[key]
-            current_var = tk.StringVar(value="0")
+            current_var = tk.IntVar(value=0)
             entry_var = tk.StringVar(value="0")
             self._numeric_vars[key] = {
                 "current": current_var,
@@ -2059,76 +2649,54 @@ class IsaacSaveEditor(tk.Tk):
             columns = ("unlock",)
         icon_mode = secret_type in {"Item.Passive", "Item.Active", "Trinket"}
         tree = self._create_tree(tree_container, columns, icon_mode=icon_mode)
-        tree.column("#0", anchor="w", width=360, stretch=True)
-        tree.column("unlock", anchor="center", width=140, stretch=False)
-        if include_quality:
-            tree.column("quality", anchor="center", width=120, stretch=False)
         tree.tag_configure(LOCKED_SECRET_TAG, background=LOCKED_SECRET_BACKGROUND)
 
         manager = TreeManager(tree, {})
-        tree.heading("#0", command=lambda m=manager: m.sort("name"))
-        self._register_heading_text(tree, "#0", "이름", "Name")
-        tree.heading("unlock", command=lambda m=manager: m.sort("unlock"))
-        self._register_heading_text(tree, "unlock", "해금 여부", "Unlock Status")
-        if include_quality:
-            tree.heading("quality", command=lambda m=manager: m.sort("quality"))
-            self._register_heading_text(tree, "quality", "등급", "Quality")
-
-        records: Dict[str, Dict[str, object]] = {}
-        english_first = self._secret_alphabetical.get(secret_type, False)
-        for record in self._secret_records_by_type.get(secret_type, []):
-            quality_value = record.get("quality")
-            values: List[str] = ["X"]
-            if include_quality:
-                quality_display = "-" if quality_value is None else str(quality_value)
-                values.append(quality_display)
-            item_id = record["iid"]
-            translations = dict(record.get("translations", {}))
-            translations.setdefault("ko_kr", str(record.get("korean", "")))
-            translations.setdefault("en_us", str(record.get("english", "")))
-            display_text = self._format_display_name(
-                translations,
-                english_first=english_first,
-            )
-            icon = self._get_secret_icon(
-                secret_type,
-                str(record.get("unlock_name") or ""),
-                str(record.get("secret_name") or ""),
-                str(record.get("english") or ""),
-            )
-            insert_kwargs = {
-                "iid": item_id,
-                "text": display_text,
-                "values": tuple(values),
-            }
-            tree.insert("", "end", **insert_kwargs)
-            if icon is not None:
-                tree.set_item_icon(item_id, icon)
-            records[record["iid"]] = {
-                "iid": record["iid"],
-                "name_sort": record.get("sort_default", record.get("name_sort")),
-                "unlock": False,
-                "quality": quality_value if include_quality else None,
-                "sort_default": record.get("sort_default", record.get("name_sort")),
-                "sort_english": record.get("sort_english", record.get("name_sort")),
-            }
-            self._register_language_binding(
-                self._make_tree_item_language_updater(
-                    tree,
-                    item_id,
+        self._apply_standard_columns(tree, manager, columns)
+
+        records: Dict[str, TreeRecord] = {}
+        source_records: Dict[str, Dict[str, object]] = {}
+        icons: Dict[str, SecretIcon] = {}
+        with self._suspend_tree_updates(tree):
+            for record in self._presorted_records(
+                self._secret_records_by_type.get(secret_type, [])
+            ):
+                quality_value = record.get("quality")
+                if include_quality:
+                    values = _locked_values_with_quality(quality_value)
+                else:
+                    values = _LOCKED_VALUES_NO_QUALITY
+                item_id = record["iid"]
+                source_records[item_id] = record
+                icon = self._get_secret_icon(
                     secret_type,
-                    translations,
+                    str(record.get("unlock_name") or ""),
+                    str(record.get("secret_name") or ""),
+                    str(record.get("english") or ""),
                 )
-            )
-        manager.records = records
-        manager.sort("name", ascending=True, update_toggle=False)
+                insert_kwargs = {
+                    "iid": item_id,
+                    "values": values,
+                }
+                tree.insert("", "end", **insert_kwargs)
+                if icon is not None:
+                    icons[item_id] = icon
+                records[item_id] = self._make_tree_record(
+                    record, quality_value if include_quality else None
+                )
+            manager.records = records
+            manager.mark_sorted("name", ascending=True)
+        tree.set_item_icons(icons)
+        self._register_language_binding(
+            self._make_tree_language_updater(tree, source_records, secret_type)
+        )
 
         self._secret_trees[secret_type] = tree
         self._secret_managers[secret_type] = manager
         self._secret_alphabetical.setdefault(secret_type, False)
         if secret_type in self.SECRET_SEARCH_TYPES:
             self._apply_secret_search_filter(secret_type, update_var=True)
-        self._update_secret_highlighting()
+        self._update_secret_highlighting((secret_type,))
 
     def _build_item_tab(self, container: ttk.Frame, item_type: str) -> None:
         button_frame = ttk.Frame(container)
@@ -2194,64 +2762,41 @@ class IsaacSaveEditor(tk.Tk):
         tree_container.columnconfigure(0, weight=1)
         tree_container.rowconfigure(0, weight=1)
         icon_mode = item_type in {"Passive", "Active"}
-        tree = self._create_tree(tree_container, ("unlock", "quality"), icon_mode=icon_mode)
-        tree.column("#0", anchor="w", width=360, stretch=True)
-        tree.column("unlock", anchor="center", width=140, stretch=False)
-        tree.column("quality", anchor="center", width=120, stretch=False)
+        columns = ("unlock", "quality")
+        tree = self._create_tree(tree_container, columns, icon_mode=icon_mode)
         tree.tag_configure(LOCKED_ITEM_TAG, background=LOCKED_ITEM_BACKGROUND)
 
         manager = TreeManager(tree, {})
-        tree.heading("#0", command=lambda m=manager: m.sort("name"))
-        self._register_heading_text(tree, "#0", "이름", "Name")
-        tree.heading("unlock", command=lambda m=manager: m.sort("unlock"))
-        self._register_heading_text(tree, "unlock", "해금 여부", "Unlock Status")
-        tree.heading("quality", command=lambda m=manager: m.sort("quality"))
-        self._register_heading_text(tree, "quality", "등급", "Quality")
-
-        records: Dict[str, Dict[str, object]] = {}
-        english_first = self._item_alphabetical.get(item_type, False)
-        for item_id, record in self._item_records.get(item_type, {}).items():
-            quality = record.get("quality")
-            quality_display = "-" if quality is None else str(quality)
-            translations = dict(record.get("translations", {}))
-            translations.setdefault("ko_kr", str(record.get("korean", "")))
-            translations.setdefault("en_us", str(record.get("english", "")))
-            display_text = self._format_display_name(
-                translations,
-                english_first=english_first,
-            )
-            tree.insert("", "end", iid=item_id, text=display_text, values=("X", quality_display))
-            icon = self._get_secret_icon(
-                f"Item.{item_type}",
-                str(record.get("english", "")),
-                str(record.get("korean", "")),
-            )
-            if icon is not None:
-                tree.set_item_icon(item_id, icon)
-            records[item_id] = {
-                "iid": item_id,
-                "name_sort": record.get("sort_default", record.get("name_sort")),
-                "unlock": False,
-                "quality": quality,
-                "sort_default": record.get("sort_default", record.get("name_sort")),
-                "sort_english": record.get("sort_english", record.get("name_sort")),
-            }
-            self._register_language_binding(
-                self._make_tree_item_language_updater(
-                    tree,
-                    item_id,
-                    item_type,
-                    translations,
-                    is_secret=False,
-                )
+        self._apply_standard_columns(tree, manager, columns)
+
+        records: Dict[str, TreeRecord] = {}
+        source_records: Dict[str, ItemRecord] = {}
+        icons: Dict[str, SecretIcon] = {}
+        with self._suspend_tree_updates(tree):
+            for record in self._presorted_records(
+                self._item_records.get(item_type, {}).values()
+            ):
+                item_id = record.iid
+                quality = record.quality
+                source_records[item_id] = record
+                tree.insert("", "end", iid=item_id, values=_locked_values_with_quality(quality))
+                icon = self._get_secret_icon(f"Item.{item_type}", record.english, record.korean)
+                if icon is not None:
+                    icons[item_id] = icon
+                records[item_id] = self._make_tree_record(record, quality)
+            manager.records = records
+            manager.mark_sorted("name", ascending=True)
+        tree.set_item_icons(icons)
+        self._register_language_binding(
+            self._make_tree_language_updater(
+                tree, source_records, item_type, is_secret=False
             )
-        manager.records = records
-        manager.sort("name", ascending=True, update_toggle=False)
+        )
 
         self._item_trees[item_type] = tree
         self._item_managers[item_type] = manager
         self._item_alphabetical.setdefault(item_type, False)
-        self._update_item_highlighting()
+        self._update_item_highlighting((item_type,))
 
     def _build_challenges_tab(self, container: ttk.Frame) -> None:
         button_frame = ttk.Frame(container)
@@ -2300,47 +2845,27 @@ class IsaacSaveEditor(tk.Tk):
         tree_container.grid(column=0, row=tree_row, sticky="nsew", pady=(12, 0))
         tree_container.columnconfigure(0, weight=1)
         tree_container.rowconfigure(0, weight=1)
-        tree = self._create_tree(tree_container, ("unlock",))
-        tree.column("#0", anchor="w", width=360, stretch=True)
-        tree.column("unlock", anchor="center", width=140, stretch=False)
+        columns = ("unlock",)
+        tree = self._create_tree(tree_container, columns)
 
         manager = TreeManager(tree, {})
-        tree.heading("#0", command=lambda m=manager: m.sort("name"))
-        self._register_heading_text(tree, "#0", "이름", "Name")
-        tree.heading("unlock", command=lambda m=manager: m.sort("unlock"))
-        self._register_heading_text(tree, "unlock", "해금 여부", "Unlock Status")
-
-        records: Dict[str, Dict[str, object]] = {}
-        for record in self._challenge_records:
-            item_id = record["iid"]
-            translations = {
-                "ko_kr": str(record.get("korean", "")),
-                "en_us": str(record.get("english", "")),
-            }
-            extra = record.get("translations")
-            if isinstance(extra, dict):
-                translations.update({str(k): str(v) for k, v in extra.items() if v})
-            display_text = self._format_display_name(translations)
-            tree.insert("", "end", iid=item_id, text=display_text, values=("X",))
-            records[record["iid"]] = {
-                "iid": record["iid"],
-                "name_sort": record.get("sort_default", record.get("name_sort")),
-                "unlock": False,
-                "quality": None,
-                "sort_default": record.get("sort_default", record.get("name_sort")),
-                "sort_english": record.get("sort_english", record.get("name_sort")),
-            }
-            self._register_language_binding(
-                self._make_tree_item_language_updater(
-                    tree,
-                    item_id,
-                    "challenge",
-                    translations,
-                    is_secret=False,
-                )
+        self._apply_standard_columns(tree, manager, columns)
+
+        records: Dict[str, TreeRecord] = {}
+        source_records: Dict[str, Dict[str, object]] = {}
+        with self._suspend_tree_updates(tree):
+            for record in self._presorted_records(self._challenge_records):
+                item_id = record["iid"]
+                source_records[item_id] = record
+                tree.insert("", "end", iid=item_id, values=_LOCKED_VALUES_NO_QUALITY)
+                records[item_id] = self._make_tree_record(record, None)
+            manager.records = records
+            manager.mark_sorted("name", ascending=True)
+        self._register_language_binding(
+            self._make_tree_language_updater(
+                tree, source_records, "challenge", is_secret=False
             )
-        manager.records = records
-        manager.sort("name", ascending=True, update_toggle=False)
+        )
 
         self._challenge_tree = tree
         self._challenge_manager = manager
@@ -2373,12 +2898,44 @@ class IsaacSaveEditor(tk.Tk):
         tree.grid(column=0, row=0, sticky="nsew")
         yscroll = ttk.Scrollbar(container, orient="vertical", command=tree.yview)
         yscroll.grid(column=1, row=0, sticky="ns")
-        tree.configure(yscrollcommand=yscroll.set)
+
+        def _on_yview_changed(first: str, last: str) -> None:
+            yscroll.set(first, last)
+            tree.schedule_viewport_refresh()
+
+        tree.configure(yscrollcommand=_on_yview_changed)
         xscroll = ttk.Scrollbar(container, orient="horizontal", command=tree.xview)
         xscroll.grid(column=0, row=1, sticky="ew")
         tree.configure(xscrollcommand=xscroll.set)
         return tree
 
+    def _apply_standard_columns(
+        self,
+        tree: IconCheckboxTreeview,
+        manager: TreeManager,
+        columns: tuple[str, ...],
+    ) -> None:
+        for column in ("#0",) + columns:
+            options = _STANDARD_TREE_COLUMNS.get(column)
+            if options is None:
+                continue
+            sort_key, korean, english, column_options = options
+            tree.column(column, **column_options)
+            tree.heading(column, command=lambda m=manager, key=sort_key: m.sort(key))
+            self._register_heading_text(tree, column, korean, english)
+
+    @contextmanager
+    def _suspend_tree_updates(self, tree: IconCheckboxTreeview) -> Iterator[None]:
+        # Hide the data columns and detach the scrollbar while rows are inserted
+        # so Tk does not recompute column layout and scroll state for every row.
+        display_columns = tree.cget("displaycolumns")
+        yscroll_command = tree.cget("yscrollcommand")
+        tree.configure(displaycolumns=(), yscrollcommand="")
+        try:
+            yield
+        finally:
+            tree.configure(displaycolumns=display_columns, yscrollcommand=yscroll_command)
+
     def _lock_tree(self, tree: IconCheckboxTreeview) -> None:
         self._locked_tree_ids.add(id(tree))
 
@@ -2388,6 +2945,22 @@ class IsaacSaveEditor(tk.Tk):
     def _is_tree_locked(self, tree: IconCheckboxTreeview) -> bool:
         return id(tree) in self._locked_tree_ids
 
+    def _skip_unchanged_tree_refresh(
+        self, tree: IconCheckboxTreeview, highlight_enabled: bool = False
+    ) -> bool:
+        """Only clear pending checks when the tree already reflects ``self.data``."""
+
+        key = (hash(self.data), highlight_enabled)
+        if self._tree_refresh_keys.get(id(tree)) != key:
+            self._tree_refresh_keys[id(tree)] = key
+            return False
+        self._lock_tree(tree)
+        try:
+            tree.change_states(tree.tag_has("checked") + tree.tag_has("tristate"), "unchecked")
+        finally:
+            self._unlock_tree(tree)
+        return True
+
     def _get_checked_or_warn(self, tree: IconCheckboxTreeview) -> Set[str] | None:
         selected = set(tree.get_checked())
         if not selected:
@@ -2415,10 +2988,9 @@ class IsaacSaveEditor(tk.Tk):
             }
             for idx, mark_name in enumerate(getattr(script, "checklist_order", []))
         ]
-        marks_by_character: Dict[int, List[Dict[str, object]]] = {
-            index: [entry.copy() for entry in default_marks_template]
-            for index in characters_by_index
-        }
+        # Per-character marks are only materialized for characters that
+        # appear in the CSV; the rest get a template copy at the end.
+        marks_by_character: Dict[int, Dict[int, Dict[str, object]]] = {}
 
         csv_path = DATA_DIR / "ui_completion_marks.csv"
         if csv_path.exists():
@@ -2446,10 +3018,10 @@ class IsaacSaveEditor(tk.Tk):
                             character_info["english"] = english_name
                         if korean_name:
                             character_info["korean"] = korean_name
-                        marks = marks_by_character.setdefault(
-                            char_index,
-                            [entry.copy() for entry in default_marks_template],
-                        )
+                        marks = marks_by_character.get(char_index)
+                        if marks is None:
+                            marks = {entry["mark_index"]: {**entry} for entry in default_marks_template}
+                            marks_by_character[char_index] = marks
                         unlock_value: Optional[int] = None
                         for value_key in ("Value(0/2)", "Value"):
                             value_text = row.get(value_key)
@@ -2472,14 +3044,11 @@ class IsaacSaveEditor(tk.Tk):
                         }
                         if unlock_value is not None:
                             mark_record["unlock_value"] = unlock_value
-                        replaced = False
-                        for existing in marks:
-                            if int(existing.get("mark_index", -1)) == mark_index:
-                                existing.update(mark_record)
-                                replaced = True
-                                break
-                        if not replaced:
-                            marks.append(mark_record)
+                        existing = marks.get(mark_index)
+                        if existing is not None:
+                            existing.update(mark_record)
+                        else:
+                            marks[mark_index] = mark_record
             except OSError:
                 pass
 
@@ -2492,11 +3061,11 @@ class IsaacSaveEditor(tk.Tk):
             info.setdefault("korean", info["english"])
             info["index"] = index
             characters.append(info)
-            marks = marks_by_character.get(index, [entry.copy() for entry in default_marks_template])
-            try:
-                marks.sort(key=lambda entry: int(entry.get("mark_index", 0)))
-            except TypeError:
-                pass
+            marks_by_index = marks_by_character.get(index)
+            if marks_by_index is None:
+                marks = [{**entry} for entry in default_marks_template]
+            else:
+                marks = [marks_by_index[mark_index] for mark_index in sorted(marks_by_index)]
             for entry in marks:
                 entry.setdefault("mark_name", f"Mark {entry.get('mark_index', 0)}")
                 entry.setdefault("display", entry["mark_name"])
@@ -2550,7 +3119,7 @@ class IsaacSaveEditor(tk.Tk):
                 )
             ]
             normalized_marks = {
-                info["index"]: [entry.copy() for entry in default_marks_template]
+                info["index"]: [{**entry} for entry in default_marks_template]
                 for info in characters
             }
 
@@ -2558,7 +3127,7 @@ class IsaacSaveEditor(tk.Tk):
 
     def _load_secret_records(
         self,
-        item_lookup: Optional[Dict[str, Dict[str, object]]] = None,
+        item_lookup: Optional[Dict[str, ItemRecord]] = None,
     ) -> tuple[
         Dict[str, List[Dict[str, object]]],
         Dict[str, List[str]],
@@ -2599,9 +3168,10 @@ class IsaacSaveEditor(tk.Tk):
                 type_order.append(secret_type)
 
         map_duplicate_secret_ids = {"57", "78"}
-        with csv_path.open(encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file)
-            fieldnames = reader.fieldnames or []
+        with csv_path.open(encoding="utf-8-sig", newline="") as file:
+            reader = csv.reader(file)
+            fieldnames = next(reader, None) or []
+            column_index = {name: position for position, name in enumerate(fieldnames)}
             base_columns = {
                 "SecretID",
                 "SecretName",
@@ -2611,42 +3181,51 @@ class IsaacSaveEditor(tk.Tk):
                 "UnlockedFlag",
             }
             language_columns = [
-                name
-                for name in fieldnames
-                if name not in base_columns and name is not None
+                (name, position)
+                for position, name in enumerate(fieldnames)
+                if name not in base_columns
             ]
+            secret_id_index = column_index.get("SecretID")
+            type_index = column_index.get("Type")
+            korean_index = column_index.get("Korean")
+            unlock_name_index = column_index.get("UnlockName")
+            secret_name_index = column_index.get("SecretName")
+
+            def match_item(names: tuple[str, ...]) -> Optional[ItemRecord]:
+                # The item lookup already holds every key variant of each item
+                # name, so a plain normalized probe resolves almost every row.
+                for name in names:
+                    if name:
+                        matched = item_lookup.get(self._normalize_lookup_name(name))
+                        if matched is not None:
+                            return matched
+                for key in self._build_lookup_keys(*names):
+                    matched = item_lookup.get(key)
+                    if matched is not None:
+                        return matched
+                return None
+
             for row in reader:
-                secret_id = (row.get("SecretID") or "").strip()
+                secret_id = _csv_cell(row, secret_id_index)
                 if not secret_id:
                     continue
-                secret_type_raw = (row.get("Type") or "").strip()
+                secret_type_raw = _csv_cell(row, type_index)
                 if not secret_type_raw:
                     secret_type_raw = self.SECRET_FALLBACK_TYPE
                 if secret_type_raw not in allowed_types:
                     secret_type_raw = self.SECRET_FALLBACK_TYPE
-                korean = (row.get("Korean") or "").strip()
-                unlock_name = (row.get("UnlockName") or "").strip()
-                secret_name = (row.get("SecretName") or "").strip()
+                korean = _csv_cell(row, korean_index)
+                unlock_name = _csv_cell(row, unlock_name_index)
+                secret_name = _csv_cell(row, secret_name_index)
                 quality_value: Optional[int] = None
                 lookup_names = (unlock_name, secret_name, korean)
                 if secret_type_raw == "Item":
-                    matched_info: Optional[Dict[str, object]] = None
-                    for key in self._build_lookup_keys(*lookup_names):
-                        matched_info = item_lookup.get(key)
-                        if matched_info:
-                            break
+                    matched_info = match_item(lookup_names)
                     if matched_info:
-                        item_type = str(matched_info.get("item_type"))
+                        item_type = matched_info.item_type
                         if item_type in {"Passive", "Active"}:
                             secret_type = f"Item.{item_type}"
-                            try:
-                                quality_value = (
-                                    int(matched_info.get("quality"))
-                                    if matched_info.get("quality") is not None
-                                    else None
-                                )
-                            except (TypeError, ValueError):
-                                quality_value = None
+                            quality_value = matched_info.quality
                         else:
                             secret_type = self.SECRET_FALLBACK_TYPE
                     else:
@@ -2663,8 +3242,8 @@ class IsaacSaveEditor(tk.Tk):
                     "ko_kr": korean_name,
                     "en_us": english_name,
                 }
-                for column in language_columns:
-                    value = (row.get(column) or "").strip()
+                for column, position in language_columns:
+                    value = _csv_cell(row, position)
                     if value:
                         translations[column] = value
                 display = self._format_display_name(translations)
@@ -2679,6 +3258,7 @@ class IsaacSaveEditor(tk.Tk):
                     "korean": korean,
                     "english": english_name,
                     "translations": translations,
+                    "display_by_lang": {(self._language_code, False): display},
                     "sort_default": self._normalize_sort_key(korean_name or english_name or secret_id),
                     "sort_english": self._normalize_sort_key(english_name or korean_name or secret_id),
                 }
@@ -2696,69 +3276,80 @@ class IsaacSaveEditor(tk.Tk):
                     register_type("Map")
                     records_by_type["Map"].append(record.copy())
                     ids_by_type["Map"].append(secret_id)
-        if "Pickup" in type_order:
-            type_order.remove("Pickup")
-            if "Pill" in type_order:
-                pill_index = type_order.index("Pill")
-                type_order.insert(pill_index + 1, "Pickup")
-            elif "None" in type_order:
-                type_order.insert(type_order.index("None"), "Pickup")
-            else:
-                type_order.append("Pickup")
-        if "None" in type_order:
-            type_order = [
-                secret_type
-                for secret_type in type_order
-                if secret_type != "None"
-            ]
-            type_order.append("None")
+        # Keep CSV order, but place Pickup right after Pill (or before None)
+        # and None last, in a single stable sort.
+        first_seen = {secret_type: index for index, secret_type in enumerate(type_order)}
+        if "Pill" in first_seen:
+            pickup_rank = first_seen["Pill"] + 0.5
+        elif "None" in first_seen:
+            pickup_rank = first_seen["None"] - 0.5
+        else:
+            pickup_rank = float(len(type_order))
+        type_rank = {**first_seen, "Pickup": pickup_rank, "None": len(type_order) + 1}
+        type_order.sort(key=type_rank.__getitem__)
         return records_by_type, ids_by_type, tab_labels, type_order, details_by_id
 
-    def _load_secret_icons(self) -> Dict[str, Dict[str, SecretIcon]]:
-        icons_by_type: Dict[str, Dict[str, SecretIcon]] = {
-            "Item.Passive": {},
-            "Item.Active": {},
-            "Trinket": {},
-        }
+    @staticmethod
+    def _read_secret_icon_images() -> tuple[
+        List[tuple[Path, tuple[str, ...], frozenset[str]]], Dict[str, Image.Image]
+    ]:
         icon_root = DATA_DIR / "icons"
         icon_sets = [
             (icon_root / "items", ("Item.Passive", "Item.Active")),
             (icon_root / "trinkets", ("Trinket",)),
         ]
+        icon_paths: List[tuple[Path, tuple[str, ...]]] = []
         for folder, secret_types in icon_sets:
             if not folder.is_dir():
                 continue
             for path in sorted(folder.glob("*.png")):
-                try:
-                    with Image.open(path) as source:
-                        image = source.convert("RGBA")
-                except (OSError, ValueError):
-                    continue
-                if image.height > MAX_ICON_HEIGHT and image.height > 0:
-                    ratio = MAX_ICON_HEIGHT / float(image.height)
-                    new_width = max(1, int(round(image.width * ratio)))
-                    image = image.resize((new_width, MAX_ICON_HEIGHT), _RESAMPLING_LANCZOS)
-                tk_image = ImageTk.PhotoImage(image)
-                icon_asset = SecretIcon(pil_image=image, tk_image=tk_image)
-                self._secret_icon_store.append(icon_asset)
-                base_name = path.stem
-                if "__" in base_name:
-                    prefix, _ = base_name.rsplit("__", 1)
-                    if prefix:
-                        base_name = prefix
-                if "___" in base_name:
-                    base_name = base_name.replace("___", "???")
-                base_name = re.sub(r"^(Collectible|Trinket)_", "", base_name)
-                base_name = re.sub(r"_icon$", "", base_name)
-                base_name = re.sub(r"[_-]+", " ", base_name).strip()
-                base_name = re.sub(r"\b(item|trinket)\b$", "", base_name, flags=re.IGNORECASE).strip()
-                lookup_keys = self._build_lookup_keys(base_name)
-                if not lookup_keys:
-                    continue
+                icon_paths.append((path, secret_types))
+
+        cache_path = _icon_cache_path(path for path, _ in icon_paths)
+        images = _read_icon_cache(cache_path)
+        if images is None:
+            images = {}
+            paths = [path for path, _ in icon_paths]
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as decoder:
+                decoded = list(decoder.map(_decode_icon, paths))
+            for path, image in zip(paths, decoded):
+                if image is not None:
+                    images[f"{path.parent.name}/{path.name}"] = image
+            if images:
+                _write_icon_cache(cache_path, images)
+        entries = [
+            (path, secret_types, IsaacSaveEditor._build_lookup_keys(_icon_base_name(path)))
+            for path, secret_types in icon_paths
+        ]
+        return entries, images
+
+    def _load_secret_icons(
+        self,
+        entries: List[tuple[Path, tuple[str, ...], frozenset[str]]],
+        images: Dict[str, Image.Image],
+    ) -> Dict[str, Dict[str, SecretIcon]]:
+        icons_by_type: Dict[str, Dict[str, SecretIcon]] = {
+            "Item.Passive": {},
+            "Item.Active": {},
+            "Trinket": {},
+        }
+        icons_by_folder: Dict[tuple[str, ...], Dict[str, SecretIcon]] = {}
+        for path, secret_types, lookup_keys in entries:
+            if not lookup_keys:
+                continue
+            image = images.get(f"{path.parent.name}/{path.name}")
+            if image is None:
+                continue
+            icon_asset = SecretIcon(pil_image=image)
+            self._secret_icon_store.append(icon_asset)
+            # Types fed by the same icon folder share one key map.
+            mapping = icons_by_folder.get(secret_types)
+            if mapping is None:
+                mapping = icons_by_folder[secret_types] = {}
                 for secret_type in secret_types:
-                    mapping = icons_by_type.setdefault(secret_type, {})
-                    for key in lookup_keys:
-                        mapping.setdefault(key, icon_asset)
+                    icons_by_type[secret_type] = mapping
+            for key in lookup_keys:
+                mapping.setdefault(key, icon_asset)
         return icons_by_type
 
     def _get_secret_icon(self, secret_type: str, *names: str) -> Optional[SecretIcon]:
@@ -2768,6 +3359,11 @@ class IsaacSaveEditor(tk.Tk):
         for name in names:
             if not name:
                 continue
+            # Every icon is registered under its plain normalized name, so
+            # try that before walking the punctuation/article variants.
+            icon = mapping.get(self._normalize_lookup_name(name))
+            if icon is not None:
+                return icon
             for key in self._build_lookup_keys(name):
                 icon = mapping.get(key)
                 if icon is not None:
@@ -2777,44 +3373,52 @@ class IsaacSaveEditor(tk.Tk):
     def _load_item_records(
         self,
     ) -> tuple[
-        Dict[str, Dict[str, Dict[str, object]]],
+        Dict[str, Dict[str, ItemRecord]],
         Dict[str, List[str]],
-        Dict[str, Dict[str, object]],
+        Dict[str, ItemRecord],
     ]:
         csv_path = DATA_DIR / "ui_items.csv"
-        records: Dict[str, Dict[str, Dict[str, object]]] = {"Passive": {}, "Active": {}}
+        records: Dict[str, Dict[str, ItemRecord]] = {"Passive": {}, "Active": {}}
         ids_by_type: Dict[str, List[str]] = {"Passive": [], "Active": []}
-        lookup_by_name: Dict[str, Dict[str, object]] = {}
+        lookup_by_name: Dict[str, ItemRecord] = {}
         if not csv_path.exists():
             return records, ids_by_type, lookup_by_name
-        with csv_path.open(encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file)
+        with csv_path.open(encoding="utf-8-sig", newline="") as file:
+            reader = csv.reader(file)
+            column_index = {name: position for position, name in enumerate(next(reader, None) or [])}
+            item_id_index = column_index.get("ItemID")
+            type_index = column_index.get("Type")
+            korean_index = column_index.get("Korean")
+            english_index = column_index.get("ItemName")
+            quality_index = column_index.get("Quality")
             for row in reader:
-                item_id = (row.get("ItemID") or "").strip()
-                item_type = (row.get("Type") or "").strip()
+                item_id = _csv_cell(row, item_id_index)
+                item_type = _csv_cell(row, type_index)
                 if not item_id or item_type not in records:
                     continue
-                korean = (row.get("Korean") or "").strip()
-                english = (row.get("ItemName") or "").strip()
-                quality_text = (row.get("Quality") or "").strip()
+                korean = _csv_cell(row, korean_index)
+                english = _csv_cell(row, english_index)
+                quality_text = _csv_cell(row, quality_index)
                 try:
                     quality_value = int(quality_text) if quality_text else None
                 except ValueError:
                     quality_value = None
                 translations = {"ko_kr": korean, "en_us": english}
                 display = self._format_display_name(translations)
-                record = {
-                    "iid": item_id,
-                    "display": display,
-                    "name_sort": self._normalize_sort_key(korean or english or item_id),
-                    "quality": quality_value,
-                    "english": english,
-                    "korean": korean,
-                    "item_type": item_type,
-                    "translations": translations,
-                    "sort_default": self._normalize_sort_key(korean or english or item_id),
-                    "sort_english": self._normalize_sort_key(english or korean or item_id),
-                }
+                sort_default = self._normalize_sort_key(korean or english or item_id)
+                record = ItemRecord(
+                    iid=item_id,
+                    display=display,
+                    name_sort=sort_default,
+                    quality=quality_value,
+                    english=english,
+                    korean=korean,
+                    item_type=item_type,
+                    translations=translations,
+                    display_by_lang={(self._language_code, False): display},
+                    sort_default=sort_default,
+                    sort_english=self._normalize_sort_key(english or korean or item_id),
+                )
                 records[item_type][item_id] = record
                 ids_by_type[item_type].append(item_id)
                 for key in self._build_lookup_keys(english, korean):
@@ -2826,14 +3430,18 @@ class IsaacSaveEditor(tk.Tk):
         records: List[Dict[str, str]] = []
         if not csv_path.exists():
             return records
-        with csv_path.open(encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file)
+        with csv_path.open(encoding="utf-8-sig", newline="") as file:
+            reader = csv.reader(file)
+            column_index = {name: position for position, name in enumerate(next(reader, None) or [])}
+            challenge_id_index = column_index.get("ChallengeID")
+            korean_index = column_index.get("Korean")
+            name_index = column_index.get("ChallengeName")
             for row in reader:
-                challenge_id = (row.get("ChallengeID") or "").strip()
+                challenge_id = _csv_cell(row, challenge_id_index)
                 if not challenge_id:
                     continue
-                korean = (row.get("Korean") or "").strip()
-                challenge_name = (row.get("ChallengeName") or "").strip()
+                korean = _csv_cell(row, korean_index)
+                challenge_name = _csv_cell(row, name_index)
                 translations = {"ko_kr": korean, "en_us": challenge_name}
                 display = self._format_display_name(translations)
                 records.append(
@@ -2846,6 +3454,7 @@ class IsaacSaveEditor(tk.Tk):
                         "english": challenge_name,
                         "korean": korean,
                         "translations": translations,
+                        "display_by_lang": {(self._language_code, False): display},
                         "sort_default": self._normalize_sort_key(
                             korean or challenge_name or challenge_id
                         ),
@@ -2861,36 +3470,52 @@ class IsaacSaveEditor(tk.Tk):
         if not details or not self._challenge_records:
             self._secret_to_challenges = {}
             self._challenge_to_secrets = {}
+            self._secret_closure = {}
             return
 
-        name_to_challenges: Dict[str, Set[str]] = {}
+        name_to_challenges: DefaultDict[str, Set[str]] = defaultdict(set)
+        # The loaders strip every CSV cell, so the values are used as-is.
         for record in self._challenge_records:
-            challenge_id = str(record.get("iid", "")).strip()
-            if not challenge_id:
-                continue
-            english = str(record.get("english", "")).strip()
-            korean = str(record.get("korean", "")).strip()
-            for key in self._build_lookup_keys(english, korean):
-                if key:
-                    name_to_challenges.setdefault(key, set()).add(challenge_id)
-
-        secret_to_challenges: Dict[str, Set[str]] = {}
-        challenge_to_secrets: Dict[str, Set[str]] = {}
+            challenge_id = record["iid"]
+            for key in self._build_lookup_keys(record["english"], record["korean"]):
+                name_to_challenges[key].add(challenge_id)
+        if not name_to_challenges:
+            self._secret_to_challenges = {}
+            self._challenge_to_secrets = {}
+            self._secret_closure = {}
+            return
+
+        secret_to_challenges: Dict[str, frozenset[str]] = {}
+        challenge_to_secrets: DefaultDict[str, Set[str]] = defaultdict(set)
         for secret_id, info in details.items():
-            unlock_name = str(info.get("unlock_name", "")).strip()
-            secret_name = str(info.get("secret_name", "")).strip()
-            korean = str(info.get("korean", "")).strip()
-            matched: Set[str] = set()
-            for key in self._build_lookup_keys(unlock_name, secret_name, korean):
-                matched.update(name_to_challenges.get(key, set()))
+            hits = [
+                name_to_challenges[key]
+                for key in self._build_lookup_keys(
+                    info["unlock_name"], info["secret_name"], info["korean"]
+                )
+                if key in name_to_challenges
+            ]
+            if not hits:
+                continue
+            matched: Set[str] = set().union(*hits)
             if not matched:
                 continue
-            secret_to_challenges[secret_id] = matched
+            secret_to_challenges[secret_id] = frozenset(matched)
             for challenge_id in matched:
-                challenge_to_secrets.setdefault(challenge_id, set()).add(secret_id)
+                challenge_to_secrets[challenge_id].add(secret_id)
 
         self._secret_to_challenges = secret_to_challenges
-        self._challenge_to_secrets = challenge_to_secrets
+        self._challenge_to_secrets = {
+            challenge_id: frozenset(secrets)
+            for challenge_id, secrets in challenge_to_secrets.items()
+        }
+        self._secret_closure = {
+            secret_id: frozenset().union(
+                *[self._challenge_to_secrets[challenge_id] for challenge_id in challenges]
+            )
+            for secret_id, challenges in secret_to_challenges.items()
+        }
+        self._relation_cache.clear()
     # ------------------------------------------------------------------
     # Event handlers and select helpers
     # ------------------------------------------------------------------
@@ -2926,7 +3551,10 @@ class IsaacSaveEditor(tk.Tk):
             len(current_values),
             len(self._completion_current_mark_ids),
         )
-        new_values: List[int] = list(current_values) + [0] * max(0, mark_count - len(current_values))
+        # Checklist values are u16 in the save, so an unsigned short array
+        # holds them without an int object per entry and masks them in place.
+        new_values = array("H", current_values)
+        new_values.extend([0] * max(0, mark_count - len(new_values)))
         for mark_id in self._completion_current_mark_ids:
             try:
                 index = int(mark_id)
@@ -2952,6 +3580,7 @@ class IsaacSaveEditor(tk.Tk):
                 "체크리스트를 업데이트하지 못했습니다.",
                 "Failed to update checklists.",
             ),
+            refresh=("completion",),
         )
         if not success:
             self._refresh_completion_tab()
@@ -2995,12 +3624,10 @@ class IsaacSaveEditor(tk.Tk):
                 except Exception:
                     current_values = []
                 target_length = max(mark_count, len(current_values), TOTAL_COMPLETION_MARKS)
-                values = list(current_values) + [0] * max(0, target_length - len(current_values))
-                for mark_index in range(target_length):
-                    unlock_value = self._completion_mask_for_mark(mark_index, index)
-                    if unlock_value <= 0:
-                        unlock_value = DEFAULT_COMPLETION_UNLOCK_MASK | GREED_COMPLETION_UNLOCK_MASK
-                    values[mark_index] = unlock_value
+                values = [
+                    mask if mask > 0 else DEFAULT_COMPLETION_UNLOCK_MASK | GREED_COMPLETION_UNLOCK_MASK
+                    for mask in self._completion_mask_table(index, target_length)
+                ]
                 result = script.updateCheckListUnlocks(result, index, values)
             return result
 
@@ -3010,6 +3637,7 @@ class IsaacSaveEditor(tk.Tk):
                 "모든 캐릭터 체크리스트를 완료하지 못했습니다.",
                 "Failed to complete all character checklists.",
             ),
+            refresh=("completion",),
         ):
             messagebox.showinfo(
                 self._text("완료", "Done"),
@@ -3027,8 +3655,7 @@ class IsaacSaveEditor(tk.Tk):
                 target_ids = manager.get_visible_ids()
             else:
                 target_ids = self._secret_ids_by_type.get(secret_type, [])
-            for secret_id in target_ids:
-                tree.change_state(secret_id, "checked")
+            tree.change_states(target_ids, "checked")
         finally:
             self._unlock_tree(tree)
 
@@ -3043,8 +3670,7 @@ class IsaacSaveEditor(tk.Tk):
                 target_ids = manager.get_visible_ids()
             else:
                 target_ids = self._secret_ids_by_type.get(secret_type, [])
-            for secret_id in target_ids:
-                tree.change_state(secret_id, "unchecked")
+            tree.change_states(target_ids, "unchecked")
         finally:
             self._unlock_tree(tree)
 
@@ -3056,22 +3682,19 @@ class IsaacSaveEditor(tk.Tk):
         new_state = not self._secret_alphabetical.get(secret_type, False)
         self._secret_alphabetical[secret_type] = new_state
         records = self._secret_records_by_type.get(secret_type, [])
+        manager.invalidate_name_order()
+        texts: Dict[str, str] = {}
         for record in records:
             item_id = record.get("iid")
             if not item_id:
                 continue
             manager_record = manager.records.get(item_id)
             if manager_record:
-                key = "sort_english" if new_state else "sort_default"
-                if key in manager_record:
-                    manager_record["name_sort"] = manager_record.get(key, manager_record.get("name_sort"))
-            tree.item(
-                item_id,
-                text=self._format_display_name(
-                    record.get("translations", {}),
-                    english_first=new_state,
-                ),
-            )
+                manager_record.name_sort = (
+                    manager_record.sort_english if new_state else manager_record.sort_default
+                )
+            texts[item_id] = self._record_display_name(record, english_first=new_state)
+        tree.set_item_texts(texts)
         manager.sort("name", ascending=True, update_toggle=False)
         tree.yview_moveto(0)
 
@@ -3118,8 +3741,43 @@ class IsaacSaveEditor(tk.Tk):
         self._secret_search_filters[secret_type] = raw_query
         if manager is None or tree is None:
             return
+        grams = self._secret_search_grams(secret_type)
+        prefix = normalized[: self._SEARCH_GRAM_LENGTH]
+        candidates = grams.get(prefix, set())
+        if len(normalized) <= self._SEARCH_GRAM_LENGTH:
+            allowed_ids = set(candidates)
+        else:
+            allowed_ids = {
+                item_id
+                for item_id, haystack in self._secret_search_index(secret_type)
+                if item_id in candidates and normalized in haystack
+            }
+        self._filter_secret_tree(secret_type, allowed_ids)
+
+    def _secret_search_grams(self, secret_type: str) -> Dict[str, Set[str]]:
+        """Map every 1..3 character substring of the search text to its ids."""
+
+        cache_key = (secret_type, getattr(self, "_language_code", "ko_kr"))
+        cached = self._secret_search_gram_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        grams: DefaultDict[str, Set[str]] = defaultdict(set)
+        for item_id, haystack in self._secret_search_index(secret_type):
+            for name in haystack.split("\x1f"):
+                for size in range(1, self._SEARCH_GRAM_LENGTH + 1):
+                    for start in range(len(name) - size + 1):
+                        grams[name[start : start + size]].add(item_id)
+        result = dict(grams)
+        self._secret_search_gram_cache[cache_key] = result
+        return result
+
+    def _secret_search_index(self, secret_type: str) -> List[tuple[str, str]]:
         language_code = getattr(self, "_language_code", "ko_kr")
-        allowed_ids: Set[str] = set()
+        cache_key = (secret_type, language_code)
+        cached = self._secret_search_index_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        index: List[tuple[str, str]] = []
         for record in self._secret_records_by_type.get(secret_type, []):
             item_id = str(record.get("iid") or "").strip()
             if not item_id:
@@ -3140,12 +3798,17 @@ class IsaacSaveEditor(tk.Tk):
                 candidates.append(english_value)
             if local_value and local_value not in candidates:
                 candidates.append(local_value)
-            for candidate in candidates:
-                normalized_candidate = self._normalize_search_text(candidate)
-                if normalized_candidate and normalized in normalized_candidate:
-                    allowed_ids.add(item_id)
-                    break
-        self._filter_secret_tree(secret_type, allowed_ids)
+            # Normalized text has no whitespace, so the separator never
+            # lets a query match across the two names.
+            haystack = "\x1f".join(
+                normalized_candidate
+                for normalized_candidate in map(self._normalize_search_text, candidates)
+                if normalized_candidate
+            )
+            if haystack:
+                index.append((item_id, haystack))
+        self._secret_search_index_cache[cache_key] = index
+        return index
 
     def _filter_secret_tree(
         self, secret_type: str, allowed_ids: Optional[Set[str]]
@@ -3163,25 +3826,33 @@ class IsaacSaveEditor(tk.Tk):
             allowed_set = {str(value) for value in allowed_ids if str(value)}
             manager.set_hidden_ids(all_ids_set - allowed_set)
             order = manager.sorted_ids(include_ids=allowed_set)
-        for secret_id in all_ids:
-            tree.detach(secret_id)
-        for secret_id in order:
-            tree.reattach(secret_id, "", "end")
+        current = tree.get_children("")
+        order_set = set(order)
+        stale = [secret_id for secret_id in current if secret_id not in order_set]
+        if stale:
+            tree.detach(*stale)
+        kept = [secret_id for secret_id in current if secret_id in order_set]
+        # Rows already in place at the top need no Tk call; move the rest.
+        start = 0
+        limit = min(len(kept), len(order))
+        while start < limit and kept[start] == order[start]:
+            start += 1
+        for index in range(start, len(order)):
+            tree.move(order[index], "", index)
         tree.yview_moveto(0)
-        highlight_enabled = _variable_to_bool(self._highlight_locked_secrets_var)
-        for secret_id, info in manager.records.items():
-            self._apply_secret_highlight(
-                tree,
-                secret_id,
-                bool(info.get("unlock")),
-                enabled=highlight_enabled,
-            )
+        self._apply_highlight_tags(
+            tree,
+            manager.records,
+            _variable_to_bool(self._highlight_locked_secrets_var),
+            LOCKED_SECRET_TAG,
+            UNLOCKED_SECRET_TAG,
+        )
 
     @staticmethod
     def _normalize_search_text(value: str) -> str:
         if not value:
             return ""
-        return re.sub(r"\s+", "", value).casefold()
+        return value.translate(_WHITESPACE_DELETE_TABLE).casefold()
 
     def _update_secrets_with_overrides(
         self, data: bytes, secret_ids: Iterable[object]
@@ -3214,23 +3885,24 @@ class IsaacSaveEditor(tk.Tk):
             return
         current_secret_ids = self._collect_unlocked_secrets()
         related_secrets, related_challenges = self._expand_secret_relations(selected)
-        new_secret_ids = current_secret_ids | related_secrets
         current_challenge_ids = self._collect_unlocked_challenges()
-        new_challenge_ids = current_challenge_ids | related_challenges
-        if new_secret_ids == current_secret_ids and new_challenge_ids == current_challenge_ids:
+        secrets_changed = not related_secrets.issubset(current_secret_ids)
+        challenges_changed = not related_challenges.issubset(current_challenge_ids)
+        if not secrets_changed and not challenges_changed:
             return
-        secret_list = sorted(new_secret_ids, key=lambda value: int(value))
-        challenge_list = sorted(new_challenge_ids, key=lambda value: int(value))
+        secret_list = _sorted_int_ids(current_secret_ids | related_secrets)
+        challenge_list = _sorted_int_ids(current_challenge_ids | related_challenges)
 
         def updater(data: bytes) -> bytes:
             result = self._update_secrets_with_overrides(data, secret_list)
-            if new_challenge_ids != current_challenge_ids:
+            if challenges_changed:
                 result = script.updateChallenges(result, challenge_list)
             return result
 
         self._apply_update(
             updater,
             self._text("비밀을 업데이트하지 못했습니다.", "Failed to update secrets."),
+            refresh=self._SECRET_REFRESH_SECTIONS,
         )
 
     def _lock_selected_secrets(self, secret_type: str) -> None:
@@ -3245,71 +3917,62 @@ class IsaacSaveEditor(tk.Tk):
             return
         current_secret_ids = self._collect_unlocked_secrets()
         related_secrets, related_challenges = self._expand_secret_relations(selected)
-        new_secret_ids = current_secret_ids.difference(related_secrets)
         current_challenge_ids = self._collect_unlocked_challenges()
-        new_challenge_ids = current_challenge_ids.difference(related_challenges)
-        if new_secret_ids == current_secret_ids and new_challenge_ids == current_challenge_ids:
+        secrets_changed = not current_secret_ids.isdisjoint(related_secrets)
+        challenges_changed = not current_challenge_ids.isdisjoint(related_challenges)
+        if not secrets_changed and not challenges_changed:
             return
-        secret_list = sorted(new_secret_ids, key=lambda value: int(value))
-        challenge_list = sorted(new_challenge_ids, key=lambda value: int(value))
+        secret_list = _sorted_int_ids(current_secret_ids.difference(related_secrets))
+        challenge_list = _sorted_int_ids(current_challenge_ids.difference(related_challenges))
 
         def updater(data: bytes) -> bytes:
             result = self._update_secrets_with_overrides(data, secret_list)
-            if new_challenge_ids != current_challenge_ids:
+            if challenges_changed:
                 result = script.updateChallenges(result, challenge_list)
             return result
 
         self._apply_update(
             updater,
             self._text("비밀을 업데이트하지 못했습니다.", "Failed to update secrets."),
+            refresh=self._SECRET_REFRESH_SECTIONS,
         )
 
     def _collect_unlocked_secrets(self) -> Set[str]:
-        unlocked: Set[str] = set()
-        for manager in self._secret_managers.values():
-            for secret_id, info in manager.records.items():
-                if info.get("unlock"):
-                    unlocked.add(secret_id)
-        return unlocked
+        # Secret tabs are built lazily, so read the unlock state captured at the
+        # last refresh instead of the (possibly missing) tree managers.
+        return set(self._unlocked_secret_ids)
 
-    def _apply_secret_highlight(
-        self,
+    @staticmethod
+    def _apply_highlight_tags(
         tree: IconCheckboxTreeview,
-        secret_id: str,
-        unlocked: bool,
-        *,
-        enabled: Optional[bool] = None,
+        records: Dict[str, TreeRecord],
+        enabled: bool,
+        locked_tag: str,
+        unlocked_tag: str,
     ) -> None:
-        if enabled is None:
-            enabled = _variable_to_bool(self._highlight_locked_secrets_var)
-        tags = set(tree.item(secret_id, "tags"))
-        if enabled:
-            if unlocked:
-                tags.discard(LOCKED_SECRET_TAG)
-                tags.add(UNLOCKED_SECRET_TAG)
-            else:
-                tags.discard(UNLOCKED_SECRET_TAG)
-                tags.add(LOCKED_SECRET_TAG)
-        else:
-            tags.discard(LOCKED_SECRET_TAG)
-            tags.discard(UNLOCKED_SECRET_TAG)
-        tree.item(secret_id, tags=tuple(tags))
+        tree.tag_remove_items(locked_tag, records)
+        tree.tag_remove_items(unlocked_tag, records)
+        if not enabled:
+            return
+        tree.tag_add_items(locked_tag, (iid for iid, info in records.items() if not info.unlock))
+        tree.tag_add_items(unlocked_tag, (iid for iid, info in records.items() if info.unlock))
 
-    def _update_secret_highlighting(self) -> None:
+    def _update_secret_highlighting(self, secret_types: Optional[Iterable[str]] = None) -> None:
         enabled = _variable_to_bool(self._highlight_locked_secrets_var)
-        for secret_type, tree in self._secret_trees.items():
+        if secret_types is None:
+            secret_types = list(self._secret_trees)
+        for secret_type in secret_types:
+            tree = self._secret_trees.get(secret_type)
+            if tree is None:
+                continue
             tree.tag_configure(LOCKED_SECRET_TAG, background=LOCKED_SECRET_BACKGROUND)
             tree.tag_configure(UNLOCKED_SECRET_TAG, background=UNLOCKED_SECRET_BACKGROUND)
             manager = self._secret_managers.get(secret_type)
             if manager is None:
                 continue
-            for secret_id, info in manager.records.items():
-                self._apply_secret_highlight(
-                    tree,
-                    secret_id,
-                    bool(info.get("unlock")),
-                    enabled=enabled,
-                )
+            self._apply_highlight_tags(
+                tree, manager.records, enabled, LOCKED_SECRET_TAG, UNLOCKED_SECRET_TAG
+            )
 
     def _on_highlight_locked_secrets_toggle(self) -> None:
         enabled = _variable_to_bool(self._highlight_locked_secrets_var)
@@ -3317,44 +3980,22 @@ class IsaacSaveEditor(tk.Tk):
         self._save_settings()
         self._update_secret_highlighting()
 
-    def _apply_item_highlight(
-        self,
-        tree: IconCheckboxTreeview,
-        item_id: str,
-        unlocked: bool,
-        *,
-        enabled: Optional[bool] = None,
-    ) -> None:
-        if enabled is None:
-            enabled = _variable_to_bool(self._highlight_locked_items_var)
-        tags = set(tree.item(item_id, "tags"))
-        if enabled:
-            if unlocked:
-                tags.discard(LOCKED_ITEM_TAG)
-                tags.add(UNLOCKED_ITEM_TAG)
-            else:
-                tags.discard(UNLOCKED_ITEM_TAG)
-                tags.add(LOCKED_ITEM_TAG)
-        else:
-            tags.discard(LOCKED_ITEM_TAG)
-            tags.discard(UNLOCKED_ITEM_TAG)
-        tree.item(item_id, tags=tuple(tags))
-
-    def _update_item_highlighting(self) -> None:
+    def _update_item_highlighting(self, item_types: Optional[Iterable[str]] = None) -> None:
         enabled = _variable_to_bool(self._highlight_locked_items_var)
-        for item_type, tree in self._item_trees.items():
+        if item_types is None:
+            item_types = list(self._item_trees)
+        for item_type in item_types:
+            tree = self._item_trees.get(item_type)
+            if tree is None:
+                continue
             tree.tag_configure(LOCKED_ITEM_TAG, background=LOCKED_ITEM_BACKGROUND)
             tree.tag_configure(UNLOCKED_ITEM_TAG, background=UNLOCKED_ITEM_BACKGROUND)
             manager = self._item_managers.get(item_type)
             if manager is None:
                 continue
-            for item_id, info in manager.records.items():
-                self._apply_item_highlight(
-                    tree,
-                    item_id,
-                    bool(info.get("unlock")),
-                    enabled=enabled,
-                )
+            self._apply_highlight_tags(
+                tree, manager.records, enabled, LOCKED_ITEM_TAG, UNLOCKED_ITEM_TAG
+            )
 
     def _on_highlight_locked_items_toggle(self) -> None:
         enabled = _variable_to_bool(self._highlight_locked_items_var)
@@ -3368,8 +4009,7 @@ class IsaacSaveEditor(tk.Tk):
             return
         self._lock_tree(tree)
         try:
-            for item_id in self._item_ids_by_type.get(item_type, []):
-                tree.change_state(item_id, "checked")
+            tree.change_states(self._item_ids_by_type.get(item_type, []), "checked")
         finally:
             self._unlock_tree(tree)
 
@@ -3379,8 +4019,7 @@ class IsaacSaveEditor(tk.Tk):
             return
         self._lock_tree(tree)
         try:
-            for item_id in self._item_ids_by_type.get(item_type, []):
-                tree.change_state(item_id, "unchecked")
+            tree.change_states(self._item_ids_by_type.get(item_type, []), "unchecked")
         finally:
             self._unlock_tree(tree)
 
@@ -3391,18 +4030,17 @@ class IsaacSaveEditor(tk.Tk):
             return
         new_state = not self._item_alphabetical.get(item_type, False)
         self._item_alphabetical[item_type] = new_state
+        manager.invalidate_name_order()
+        texts: Dict[str, str] = {}
         for item_id, manager_record in manager.records.items():
-            key = "sort_english" if new_state else "sort_default"
-            if key in manager_record:
-                manager_record["name_sort"] = manager_record.get(key, manager_record.get("name_sort"))
-            record = self._item_records.get(item_type, {}).get(item_id, {})
-            tree.item(
-                item_id,
-                text=self._format_display_name(
-                    record.get("translations", {}),
-                    english_first=new_state,
-                ),
+            manager_record.name_sort = (
+                manager_record.sort_english if new_state else manager_record.sort_default
             )
+            record = self._item_records.get(item_type, {}).get(item_id)
+            if record is None:
+                continue
+            texts[item_id] = self._record_display_name(record, english_first=new_state)
+        tree.set_item_texts(texts)
         manager.sort("name", ascending=True, update_toggle=False)
         tree.yview_moveto(0)
 
@@ -3418,10 +4056,11 @@ class IsaacSaveEditor(tk.Tk):
             return
         unlocked_ids = self._collect_unlocked_items()
         unlocked_ids.update(selected)
-        ids_sorted = sorted(unlocked_ids, key=lambda value: int(value))
+        ids_sorted = _sorted_int_ids(unlocked_ids)
         self._apply_update(
             lambda data: script.updateItems(data, ids_sorted),
             self._text("아이템을 업데이트하지 못했습니다.", "Failed to update items."),
+            refresh=("items",),
         )
 
     def _lock_selected_items(self, item_type: str) -> None:
@@ -3436,10 +4075,11 @@ class IsaacSaveEditor(tk.Tk):
             return
         unlocked_ids = self._collect_unlocked_items()
         unlocked_ids.difference_update(selected)
-        ids_sorted = sorted(unlocked_ids, key=lambda value: int(value))
+        ids_sorted = _sorted_int_ids(unlocked_ids)
         self._apply_update(
             lambda data: script.updateItems(data, ids_sorted),
             self._text("아이템을 업데이트하지 못했습니다.", "Failed to update items."),
+            refresh=("items",),
         )
 
     def _mark_selected_items_seen(self, item_type: str) -> None:
@@ -3452,17 +4092,18 @@ class IsaacSaveEditor(tk.Tk):
         selected = self._get_checked_or_warn(tree)
         if not selected:
             return
-        ids_sorted = sorted(selected, key=lambda value: int(value))
+        ids_sorted = _sorted_int_ids(selected)
         self._apply_update(
             lambda data: script.markItemsSeen(data, ids_sorted),
             self._text("아이템을 업데이트하지 못했습니다.", "Failed to update items."),
+            refresh=("items",),
         )
 
     def _collect_unlocked_items(self) -> Set[str]:
         unlocked: Set[str] = set()
         for manager in self._item_managers.values():
             for item_id, info in manager.records.items():
-                if info.get("unlock"):
+                if info.unlock:
                     unlocked.add(item_id)
         return unlocked
 
@@ -3471,8 +4112,7 @@ class IsaacSaveEditor(tk.Tk):
             return
         self._lock_tree(self._challenge_tree)
         try:
-            for challenge_id in self._challenge_ids:
-                self._challenge_tree.change_state(challenge_id, "checked")
+            self._challenge_tree.set_all_states("checked")
         finally:
             self._unlock_tree(self._challenge_tree)
 
@@ -3481,8 +4121,7 @@ class IsaacSaveEditor(tk.Tk):
             return
         self._lock_tree(self._challenge_tree)
         try:
-            for challenge_id in self._challenge_ids:
-                self._challenge_tree.change_state(challenge_id, "unchecked")
+            self._challenge_tree.set_all_states("unchecked")
         finally:
             self._unlock_tree(self._challenge_tree)
 
@@ -3496,23 +4135,24 @@ class IsaacSaveEditor(tk.Tk):
             return
         current_challenge_ids = self._collect_unlocked_challenges()
         related_challenges, related_secrets = self._expand_challenge_relations(selected)
-        new_challenge_ids = current_challenge_ids | related_challenges
         current_secret_ids = self._collect_unlocked_secrets()
-        new_secret_ids = current_secret_ids | related_secrets
-        if new_challenge_ids == current_challenge_ids and new_secret_ids == current_secret_ids:
+        challenges_changed = not related_challenges.issubset(current_challenge_ids)
+        secrets_changed = not related_secrets.issubset(current_secret_ids)
+        if not challenges_changed and not secrets_changed:
             return
-        challenge_list = sorted(new_challenge_ids, key=lambda value: int(value))
-        secret_list = sorted(new_secret_ids, key=lambda value: int(value))
+        challenge_list = _sorted_int_ids(current_challenge_ids | related_challenges)
+        secret_list = _sorted_int_ids(current_secret_ids | related_secrets)
 
         def updater(data: bytes) -> bytes:
             result = script.updateChallenges(data, challenge_list)
-            if new_secret_ids != current_secret_ids:
+            if secrets_changed:
                 result = self._update_secrets_with_overrides(result, secret_list)
             return result
 
         self._apply_update(
             updater,
             self._text("도전과제를 업데이트하지 못했습니다.", "Failed to update challenges."),
+            refresh=self._SECRET_REFRESH_SECTIONS,
         )
 
     def _lock_selected_challenges(self) -> None:
@@ -3525,23 +4165,24 @@ class IsaacSaveEditor(tk.Tk):
             return
         current_challenge_ids = self._collect_unlocked_challenges()
         related_challenges, related_secrets = self._expand_challenge_relations(selected)
-        new_challenge_ids = current_challenge_ids.difference(related_challenges)
         current_secret_ids = self._collect_unlocked_secrets()
-        new_secret_ids = current_secret_ids.difference(related_secrets)
-        if new_challenge_ids == current_challenge_ids and new_secret_ids == current_secret_ids:
+        challenges_changed = not current_challenge_ids.isdisjoint(related_challenges)
+        secrets_changed = not current_secret_ids.isdisjoint(related_secrets)
+        if not challenges_changed and not secrets_changed:
             return
-        challenge_list = sorted(new_challenge_ids, key=lambda value: int(value))
-        secret_list = sorted(new_secret_ids, key=lambda value: int(value))
+        challenge_list = _sorted_int_ids(current_challenge_ids.difference(related_challenges))
+        secret_list = _sorted_int_ids(current_secret_ids.difference(related_secrets))
 
         def updater(data: bytes) -> bytes:
             result = script.updateChallenges(data, challenge_list)
-            if new_secret_ids != current_secret_ids:
+            if secrets_changed:
                 result = self._update_secrets_with_overrides(result, secret_list)
             return result
 
         self._apply_update(
             updater,
             self._text("도전과제를 업데이트하지 못했습니다.", "Failed to update challenges."),
+            refresh=self._SECRET_REFRESH_SECTIONS,
         )
 
     def _unlock_all_challenges(self) -> None:
@@ -3549,49 +4190,65 @@ class IsaacSaveEditor(tk.Tk):
             return
         if not self._challenge_ids:
             return
-        challenge_list = sorted(self._challenge_ids, key=lambda value: int(value))
-
         def updater(data: bytes) -> bytes:
-            return script.updateChallenges(data, challenge_list)
+            return script.updateChallenges(data, self._challenge_ids_sorted)
 
         if self._apply_update(
             updater,
             self._text("도전과제를 업데이트하지 못했습니다.", "Failed to update challenges."),
+            refresh=("challenges",),
         ):
             messagebox.showinfo(
                 self._text("완료", "Done"),
                 self._text("모든 도전과제를 완료했습니다.", "All challenges have been marked as complete."),
             )
 
+    def _parse_data(self, parser: Callable[[bytes], Any]) -> Any:
+        # ``self.data`` is immutable bytes that is replaced on every load/apply,
+        # so identity is enough to tell whether a parsed result is still valid.
+        if self._parsed_data_source is not self.data:
+            self._parsed_data_source = self.data
+            self._parsed_data_cache = {}
+        try:
+            return self._parsed_data_cache[parser]
+        except KeyError:
+            value = self._parsed_data_cache[parser] = parser(self.data)
+            return value
+
     def _collect_unlocked_challenges(self) -> Set[str]:
-        if self._challenge_manager is None:
-            return set()
-        return {
-            challenge_id
-            for challenge_id, info in self._challenge_manager.records.items()
-            if info.get("unlock")
-        }
+        return set(self._unlocked_challenge_ids)
+
+    def _expand_secret_relations(
+        self, secret_ids: Set[str]
+    ) -> tuple[frozenset[str], frozenset[str]]:
+        key = ("secret", frozenset(secret_ids))
+        cached = self._relation_cache.get(key)
+        if cached is not None:
+            return cached
+        mapping = self._secret_to_challenges
+        closure = self._secret_closure
+        related_challenges = frozenset().union(
+            *[mapping[secret_id] for secret_id in secret_ids if secret_id in mapping]
+        )
+        related_secrets = key[1].union(
+            *[closure[secret_id] for secret_id in secret_ids if secret_id in closure]
+        )
+        result = self._relation_cache[key] = (related_secrets, related_challenges)
+        return result
 
-    def _expand_secret_relations(self, secret_ids: Set[str]) -> tuple[Set[str], Set[str]]:
-        related_secrets: Set[str] = set()
-        related_challenges: Set[str] = set()
-        mapping = getattr(self, "_secret_to_challenges", {})
-        inverse = getattr(self, "_challenge_to_secrets", {})
-        for secret_id in secret_ids:
-            related_secrets.add(secret_id)
-            for challenge_id in mapping.get(secret_id, set()):
-                related_challenges.add(challenge_id)
-                related_secrets.update(inverse.get(challenge_id, set()))
-        return related_secrets, related_challenges
-
-    def _expand_challenge_relations(self, challenge_ids: Set[str]) -> tuple[Set[str], Set[str]]:
-        related_challenges: Set[str] = set()
-        related_secrets: Set[str] = set()
-        inverse = getattr(self, "_challenge_to_secrets", {})
-        for challenge_id in challenge_ids:
-            related_challenges.add(challenge_id)
-            related_secrets.update(inverse.get(challenge_id, set()))
-        return related_challenges, related_secrets
+    def _expand_challenge_relations(
+        self, challenge_ids: Set[str]
+    ) -> tuple[frozenset[str], frozenset[str]]:
+        key = ("challenge", frozenset(challenge_ids))
+        cached = self._relation_cache.get(key)
+        if cached is not None:
+            return cached
+        inverse = self._challenge_to_secrets
+        related_secrets = frozenset().union(
+            *[inverse[challenge_id] for challenge_id in challenge_ids if challenge_id in inverse]
+        )
+        result = self._relation_cache[key] = (key[1], related_secrets)
+        return result
 
     def _ensure_data_loaded(self) -> bool:
         if self.data is None or not self.filename:
@@ -3602,7 +4259,13 @@ class IsaacSaveEditor(tk.Tk):
             return False
         return True
 
-    def _apply_update(self, updater: Callable[[bytes], bytes], error_message: str) -> bool:
+    def _apply_update(
+        self,
+        updater: Callable[[bytes], bytes],
+        error_message: str,
+        *,
+        refresh: Optional[Iterable[str]] = None,
+    ) -> bool:
         if self.data is None or not self.filename:
             messagebox.showwarning(
                 self._text("파일 없음", "No File"),
@@ -3617,20 +4280,69 @@ class IsaacSaveEditor(tk.Tk):
                 f"{error_message}\n{exc}",
             )
             return False
-        updated_with_checksum = script.updateChecksum(new_data)
-        try:
-            with open(self.filename, "wb") as file:
-                file.write(updated_with_checksum)
-        except OSError as exc:
-            messagebox.showerror(
-                self._text("저장 실패", "Save Failed"),
-                self._text("세이브 파일을 저장하지 못했습니다.", "Could not save the file.")
-                + f"\n{exc}",
-            )
-            return False
-        self.data = updated_with_checksum
-        self.refresh_current_values()
+        new_data = script.updateChecksum(new_data, self._checksummed_data)
+        self._checksummed_data = new_data
+        # An edit that changes nothing (e.g. unlocking what is already unlocked)
+        # leaves the file on disk as it is.
+        if new_data != self.data:
+            self.data = new_data
+            self._queue_save(self.filename, self.data)
+        self.refresh_current_values(sections=refresh)
         return True
+
+    def _queue_save(self, path: str, data: bytes) -> None:
+        future = self._save_executor.submit(_write_file_atomic, path, data)
+        self._pending_save = future
+        self._unreported_saves[future] = path
+        self.after(self._SAVE_POLL_MS, self._poll_save, future)
+
+    def _poll_save(self, future: Future[None]) -> None:
+        # Checked from the Tk thread: calling into Tk from the worker would
+        # block it on the main loop, which can itself be waiting on the worker.
+        if not future.done():
+            self.after(self._SAVE_POLL_MS, self._poll_save, future)
+            return
+        path = self._unreported_saves.pop(future, None)
+        if path is None:
+            # Already reported by _flush_pending_saves.
+            return
+        exc = future.exception()
+        if exc is not None:
+            self._handle_save_failure(path, exc)
+
+    def _handle_save_failure(self, path: str, exc: BaseException) -> None:
+        messagebox.showerror(
+            self._text("저장 실패", "Save Failed"),
+            self._text("세이브 파일을 저장하지 못했습니다.", "Could not save the file.")
+            + f"\n{exc}",
+        )
+        # The atomic write left the previous file intact; resync with it.
+        if path == self.filename:
+            self._load_file(path, show_errors=False)
+
+    def _flush_pending_saves(self) -> bool:
+        """Wait for queued saves and report any that failed.
+
+        Returns ``False`` when a save failed, so callers can stop before
+        acting on a file that does not hold what the editor shows.
+        """
+
+        future = self._pending_save
+        if future is not None:
+            self._pending_save = None
+            # The single worker runs saves in order, so the tail finishing
+            # means every earlier save has finished too.
+            future.exception()
+        succeeded = True
+        for future in list(self._unreported_saves):
+            path = self._unreported_saves.pop(future, None)
+            if path is None:
+                continue
+            exc = future.exception()
+            if exc is not None:
+                succeeded = False
+                self._handle_save_failure(path, exc)
+        return succeeded
     # ------------------------------------------------------------------
     # Tree refresh helpers
     # ------------------------------------------------------------------
@@ -3645,8 +4357,7 @@ class IsaacSaveEditor(tk.Tk):
             tree.state(("disabled",))
             self._lock_tree(tree)
             try:
-                for mark_id in self._completion_current_mark_ids:
-                    tree.change_state(mark_id, "unchecked")
+                tree.set_all_states("unchecked")
             finally:
                 self._unlock_tree(tree)
             return
@@ -3654,8 +4365,7 @@ class IsaacSaveEditor(tk.Tk):
             tree.state(("disabled",))
             self._lock_tree(tree)
             try:
-                for mark_id in self._completion_current_mark_ids:
-                    tree.change_state(mark_id, "unchecked")
+                tree.set_all_states("unchecked")
             finally:
                 self._unlock_tree(tree)
             return
@@ -3665,52 +4375,64 @@ class IsaacSaveEditor(tk.Tk):
             values = script.getChecklistUnlocks(self.data, char_index)
         except Exception:
             values = []
-        unlocked_ids = {}
-        for index, value in enumerate(values):
-            mask = self._completion_mask_for_mark(index, char_index)
-            if value & mask:
-                unlocked_ids[str(index)] = True
+        masks = self._completion_mask_table(char_index, len(values))
+        unlocked_ids = set(map(str, compress(count(), map(operator.and_, values, masks))))
         self._lock_tree(tree)
         try:
-            for mark_id in self._completion_current_mark_ids:
-                if unlocked_ids.get(mark_id):
-                    tree.change_state(mark_id, "checked")
-                else:
-                    tree.change_state(mark_id, "unchecked")
+            mark_ids = self._completion_current_mark_ids
+            tree.change_states([mark_id for mark_id in mark_ids if mark_id in unlocked_ids], "checked")
+            tree.change_states(
+                [mark_id for mark_id in mark_ids if mark_id not in unlocked_ids], "unchecked"
+            )
         finally:
             self._unlock_tree(tree)
 
     def _refresh_secrets_tab(self) -> None:
-        if not self._secret_managers:
-            return
         if self.data is None:
             unlocked_ids: Set[str] = set()
         else:
             try:
-                secrets = script.getSecrets(self.data)
+                secrets = self._parse_data(script.getSecrets)
             except Exception:
                 secrets = []
-            unlocked_ids = {str(index + 1) for index, value in enumerate(secrets) if value != 0}
-        highlight_enabled = _variable_to_bool(self._highlight_locked_secrets_var)
-        for secret_type, manager in self._secret_managers.items():
-            tree = self._secret_trees.get(secret_type)
-            if tree is None:
-                continue
-            self._lock_tree(tree)
-            try:
-                for secret_id in manager.records:
-                    unlocked = secret_id in unlocked_ids
-                    manager.set_unlock(secret_id, unlocked)
-                    tree.change_state(secret_id, "unchecked")
-                    self._apply_secret_highlight(
-                        tree,
-                        secret_id,
-                        unlocked,
-                        enabled=highlight_enabled,
-                    )
-            finally:
-                self._unlock_tree(tree)
-            manager.resort()
+            unlocked_ids = _flagged_ids(secrets)
+            unlocked_ids &= self._known_secret_ids
+        self._unlocked_secret_ids = unlocked_ids
+        if not self._secret_managers:
+            return
+        for secret_type in self._secret_managers:
+            self._refresh_when_visible(
+                self._secret_tab_ids.get(secret_type),
+                partial(self._refresh_secret_tree_from_state, secret_type),
+            )
+
+    def _refresh_secret_tree_from_state(self, secret_type: str) -> None:
+        self._refresh_secret_tree(
+            secret_type,
+            self._unlocked_secret_ids,
+            _variable_to_bool(self._highlight_locked_secrets_var),
+        )
+
+    def _refresh_secret_tree(
+        self, secret_type: str, unlocked_ids: Set[str], highlight_enabled: bool
+    ) -> None:
+        manager = self._secret_managers.get(secret_type)
+        tree = self._secret_trees.get(secret_type)
+        if manager is None or tree is None:
+            return
+        if self._skip_unchanged_tree_refresh(tree, highlight_enabled):
+            return
+        self._lock_tree(tree)
+        try:
+            for secret_id in manager.records:
+                manager.set_unlock(secret_id, secret_id in unlocked_ids)
+            tree.change_states(manager.records, "unchecked")
+            self._apply_highlight_tags(
+                tree, manager.records, highlight_enabled, LOCKED_SECRET_TAG, UNLOCKED_SECRET_TAG
+            )
+        finally:
+            self._unlock_tree(tree)
+        manager.resort()
 
     def _refresh_items_tab(self) -> None:
         if not self._item_managers:
@@ -3719,52 +4441,50 @@ class IsaacSaveEditor(tk.Tk):
             unlocked_ids: Set[str] = set()
         else:
             try:
-                items = script.getItems(self.data)
+                items = self._parse_data(script.getItems)
             except Exception:
                 items = []
-            unlocked_ids = {
-                str(index + 1)
-                for index, value in enumerate(items)
-                if value & ITEM_UNLOCK_MASK
-            }
+            unlocked_ids = _flagged_ids(items, ITEM_UNLOCK_MASK)
         highlight_enabled = _variable_to_bool(self._highlight_locked_items_var)
         for item_type, tree in self._item_trees.items():
             manager = self._item_managers.get(item_type)
             if manager is None:
                 continue
+            if self._skip_unchanged_tree_refresh(tree, highlight_enabled):
+                continue
             self._lock_tree(tree)
             try:
                 for item_id in manager.records:
-                    unlocked = item_id in unlocked_ids
-                    manager.set_unlock(item_id, unlocked)
-                    tree.change_state(item_id, "unchecked")
-                    self._apply_item_highlight(
-                        tree,
-                        item_id,
-                        unlocked,
-                        enabled=highlight_enabled,
-                    )
+                    manager.set_unlock(item_id, item_id in unlocked_ids)
+                tree.change_states(manager.records, "unchecked")
+                self._apply_highlight_tags(
+                    tree, manager.records, highlight_enabled, LOCKED_ITEM_TAG, UNLOCKED_ITEM_TAG
+                )
             finally:
                 self._unlock_tree(tree)
             manager.resort()
 
     def _refresh_challenges_tab(self) -> None:
-        if self._challenge_tree is None or self._challenge_manager is None:
-            return
         if self.data is None:
             unlocked_ids: Set[str] = set()
         else:
             try:
-                challenges = script.getChallenges(self.data)
+                challenges = self._parse_data(script.getChallenges)
             except Exception:
                 challenges = []
-            unlocked_ids = {str(index + 1) for index, value in enumerate(challenges) if value != 0}
+            unlocked_ids = _flagged_ids(challenges)
+            unlocked_ids.intersection_update(self._challenge_ids)
+        self._unlocked_challenge_ids = unlocked_ids
+        if self._challenge_tree is None or self._challenge_manager is None:
+            return
+        if self._skip_unchanged_tree_refresh(self._challenge_tree):
+            return
         self._lock_tree(self._challenge_tree)
         try:
             for challenge_id in self._challenge_manager.records:
                 unlocked = challenge_id in unlocked_ids
                 self._challenge_manager.set_unlock(challenge_id, unlocked)
-                self._challenge_tree.change_state(challenge_id, "unchecked")
+            self._challenge_tree.change_states(self._challenge_manager.records, "unchecked")
         finally:
             self._unlock_tree(self._challenge_tree)
         self._challenge_manager.resort()
@@ -3776,7 +4496,7 @@ class IsaacSaveEditor(tk.Tk):
         container: ttk.Frame,
         row: int,
         title: str,
-        current_var: tk.StringVar,
+        current_var: tk.Variable,
         entry_var: tk.StringVar,
         command: Callable[[], None],
         *,
@@ -3935,6 +4655,8 @@ class IsaacSaveEditor(tk.Tk):
                 ),
             )
             return False
+        if not self._flush_pending_saves():
+            return False
         try:
             shutil.copyfile(source, target)
         except OSError as exc:
@@ -4008,10 +4730,11 @@ class IsaacSaveEditor(tk.Tk):
         return self._get_initial_directory()
 
     def _load_file(self, filename: str, *, show_errors: bool = True) -> bool:
+        self._flush_pending_saves()
+        self._related_paths_cache = None
         normalized = os.path.abspath(filename)
         try:
-            with open(normalized, "rb") as file:
-                data = file.read()
+            data = _read_file_exact(normalized)
         except OSError as exc:
             if show_errors:
                 messagebox.showerror(
@@ -4154,6 +4877,15 @@ class IsaacSaveEditor(tk.Tk):
         return settings
 
     def _save_settings(self) -> None:
+        # Bursts of toggles and path changes collapse into one write.
+        if self._settings_after_id is not None:
+            self.after_cancel(self._settings_after_id)
+        self._settings_after_id = self.after(250, self._flush_settings)
+
+    def _flush_settings(self) -> None:
+        if self._settings_after_id is not None:
+            self.after_cancel(self._settings_after_id)
+            self._settings_after_id = None
         settings_to_save = DEFAULT_SETTINGS.copy()
         try:
             current_width = int(self.winfo_width())
@@ -4165,7 +4897,7 @@ class IsaacSaveEditor(tk.Tk):
         if current_width > 1 and current_height > 1:
             width_setting = current_width
             height_setting = current_height
-        settings_to_save["remember_path"] = _variable_to_bool(self.remember_path_var)
+        settings_to_save["remember_path"] = bool(self.settings.get("remember_path", False))
         last_path_setting = self.settings.get("last_path")
         if isinstance(last_path_setting, str):
             settings_to_save["last_path"] = last_path_setting
@@ -4174,12 +4906,8 @@ class IsaacSaveEditor(tk.Tk):
         language_code = getattr(self, "_language_code", "ko_kr")
         settings_to_save["english_ui"] = localization.is_english(language_code)
         settings_to_save["language"] = language_code
-        highlight_var = getattr(self, "_highlight_locked_items_var", None)
-        settings_to_save["highlight_locked_items"] = _variable_to_bool(highlight_var)
-        highlight_secret_var = getattr(self, "_highlight_locked_secrets_var", None)
-        settings_to_save["highlight_locked_secrets"] = _variable_to_bool(
-            highlight_secret_var
-        )
+        for key in ("highlight_locked_items", "highlight_locked_secrets"):
+            settings_to_save[key] = bool(self.settings.get(key, False))
         if (
             isinstance(width_setting, int)
             and width_setting > 0
@@ -4189,41 +4917,16 @@ class IsaacSaveEditor(tk.Tk):
             settings_to_save["window_width"] = width_setting
             settings_to_save["window_height"] = height_setting
         self.settings = settings_to_save
-        try:
-            with self.settings_path.open("w", encoding="utf-8") as file:
-                json.dump(settings_to_save, file, ensure_ascii=False, indent=2)
-        except OSError:
-            pass
+        payload = json.dumps(settings_to_save, ensure_ascii=False, indent=2)
+        if payload != self._settings_written:
+            try:
+                _write_file_atomic(self.settings_path, payload.encode("utf-8"))
+            except OSError:
+                pass
+            else:
+                self._settings_written = payload
         self._geometry_dirty = False
 
-    def _read_numeric_value(self, key: str) -> Optional[int]:
-        if self.data is None:
-            return None
-        config = self._numeric_config.get(key)
-        if config is None:
-            return None
-        try:
-            section_offsets = script.getSectionOffsets(self.data)
-        except Exception:
-            return None
-        try:
-            num_bytes = int(config.get("num_bytes", 2))
-        except (TypeError, ValueError):
-            num_bytes = 2
-        signed = bool(config.get("signed", False))
-        is_absolute = bool(config.get("offset_is_absolute", False))
-        try:
-            base_offset = int(config["offset"])
-            if not is_absolute:
-                base_offset += section_offsets[1] + 0x4
-            return int(
-                script.getInt(
-                    self.data, base_offset, num_bytes=num_bytes, signed=signed
-                )
-            )
-        except Exception:
-            return None
-
     def apply_field(
         self,
         key: str,
@@ -4232,7 +4935,7 @@ class IsaacSaveEditor(tk.Tk):
         preserve_entry: bool = False,
         reload_before_apply: bool = True,
     ) -> bool:
-        if key not in self._numeric_config:
+        if key not in self._numeric_fields:
             return False
 
         vars_map = self._numeric_vars.get(key)
@@ -4261,13 +4964,7 @@ class IsaacSaveEditor(tk.Tk):
             )
             return False
 
-        config = self._numeric_config[key]
-        description_value = config.get("description")
-        if isinstance(description_value, tuple):
-            description_ko, description_en = description_value
-        else:
-            description_ko = description_en = str(description_value)
-
+        description_ko, description_en = self._numeric_field_description(key)
         try:
             new_value = int(raw_value)
         except (TypeError, ValueError):
@@ -4280,55 +4977,96 @@ class IsaacSaveEditor(tk.Tk):
             )
             return False
 
-        min_value = config.get("min_value")
-        if isinstance(min_value, int) and new_value < min_value:
-            new_value = min_value
+        new_value = self._clamp_numeric_value(key, new_value)
+        entry_var.set(str(new_value))
+        return self._apply_numeric_values({key: new_value}, preserve_entry=preserve_entry)
 
-        max_value = config.get("max_value")
-        if isinstance(max_value, int) and new_value > max_value:
-            new_value = max_value
+    def apply_fields(
+        self,
+        values: Dict[str, int],
+        *,
+        preserve_entry: bool = False,
+        keep: Iterable[str] = (),
+    ) -> bool:
+        """Write several numeric fields with one checksum pass and one save.
 
-        entry_var.set(str(new_value))
+        Fields named in ``keep`` are written back to their pre-edit values if
+        the batch changed them.
+        """
 
+        if self.data is None or not self.filename:
+            return False
+        values = {
+            key: self._clamp_numeric_value(key, value)
+            for key, value in values.items()
+            if key in self._numeric_fields
+        }
+        if not values:
+            return False
+        return self._apply_numeric_values(values, preserve_entry=preserve_entry, keep=keep)
+
+    def _clamp_numeric_value(self, key: str, value: int) -> int:
+        field = self._numeric_fields[key]
+        if field.min_value is not None and value < field.min_value:
+            value = field.min_value
+        if field.max_value is not None and value > field.max_value:
+            value = field.max_value
+        return value
+
+    def _numeric_field_description(self, key: str) -> tuple[str, str]:
+        return self._numeric_fields[key].description
+
+    def _write_numeric_field(
+        self, data: bytes, key: str, value: int, section_base: int
+    ) -> bytes:
+        field = self._numeric_fields[key]
+        base = 0 if field.is_absolute else section_base
         try:
-            num_bytes = int(config.get("num_bytes", 2))
-        except (TypeError, ValueError):
-            num_bytes = 2
-        signed = bool(config.get("signed", False))
-        is_absolute = bool(config.get("offset_is_absolute", False))
-        try:
-            section_offsets = script.getSectionOffsets(self.data)
-            base_offset = int(config["offset"])
-            if not is_absolute:
-                base_offset += section_offsets[1] + 0x4
-            updated = script.alterInt(
-                self.data,
-                base_offset,
-                new_value,
-                num_bytes=num_bytes,
-                signed=signed,
+            encoded = value.to_bytes(field.num_bytes, "little", signed=field.signed)
+        except OverflowError:
+            encoded = None
+        buffer = None
+        for offset in field.offsets:
+            start = base + offset
+            if data[start:start + field.num_bytes] == encoded:
+                continue
+            if buffer is None:
+                buffer = bytearray(data)
+            script.alterIntInPlace(
+                buffer, start, value, num_bytes=field.num_bytes, signed=field.signed
             )
-            mirror_offsets = config.get("mirror_offsets")
-            if isinstance(mirror_offsets, Iterable) and not isinstance(
-                mirror_offsets, (str, bytes)
-            ):
-                for extra_offset in mirror_offsets:
-                    try:
-                        mirror_offset = int(extra_offset)
-                    except (TypeError, ValueError):
-                        continue
-                    extra_base = mirror_offset
-                    if not is_absolute:
-                        extra_base += section_offsets[1] + 0x4
-                    updated = script.alterInt(
-                        updated,
-                        extra_base,
-                        new_value,
-                        num_bytes=num_bytes,
-                        signed=signed,
-                    )
-            updated_with_checksum = script.updateChecksum(updated)
+        return data if buffer is None else bytes(buffer)
+
+    def _read_numeric_field(self, data: bytes, key: str, section_base: int) -> int:
+        field = self._numeric_fields[key]
+        start = field.offsets[0] + (0 if field.is_absolute else section_base)
+        return int.from_bytes(data[start:start + field.num_bytes], "little", signed=field.signed)
+
+    def _apply_numeric_values(
+        self,
+        values: Dict[str, int],
+        *,
+        preserve_entry: bool,
+        keep: Iterable[str] = (),
+    ) -> bool:
+        current_key = next(iter(values))
+        try:
+            section_base = self._parse_data(script.getSectionOffsets)[1] + 0x4
+            kept = {key: self._read_numeric_field(self.data, key, section_base) for key in keep}
+            updated = self.data
+            for current_key, new_value in values.items():
+                updated = self._write_numeric_field(updated, current_key, new_value, section_base)
+            for current_key, old_value in kept.items():
+                if self._read_numeric_field(updated, current_key, section_base) != old_value:
+                    updated = self._write_numeric_field(updated, current_key, old_value, section_base)
+            unchanged = updated is self.data
+            if unchanged:
+                updated_with_checksum = self.data
+            else:
+                updated_with_checksum = script.updateChecksum(updated, self._checksummed_data)
+                self._checksummed_data = updated_with_checksum
         except Exception as exc:  # pragma: no cover - defensive UI feedback
+            description_ko, description_en = self._numeric_field_description(current_key)
             messagebox.showerror(
                 self._text("업데이트 실패", "Update Failed"),
                 self._text(
@@ -4339,10 +5077,12 @@ class IsaacSaveEditor(tk.Tk):
             )
             return False
 
+        if not self._flush_pending_saves():
+            return False
         self.data = updated_with_checksum
         try:
-            with open(self.filename, "wb") as file:
-                file.write(self.data)
+            if not unchanged:
+                _write_file_atomic(self.filename, self.data)
         except OSError as exc:
             messagebox.showerror(
                 self._text("저장 실패", "Save Failed"),
@@ -4352,12 +5092,13 @@ class IsaacSaveEditor(tk.Tk):
             return False
 
         multi_success = True
-        if key == "eden_blessing_multi":
-            multi_success = self._apply_multi_eden_mirror(new_value)
+        if "eden_blessing_multi" in values:
+            multi_success = self._apply_multi_eden_mirror(values["eden_blessing_multi"])
 
-        self._propagate_numeric_update(key, new_value, num_bytes)
+        if not unchanged:
+            self._propagate_numeric_update()
         self.refresh_current_values(update_entry=not preserve_entry)
-        if key == "eden_blessing_multi" and not multi_success:
+        if not multi_success:
             messagebox.showwarning(
                 self._text("멀티 에덴 업데이트 실패", "Multi Eden Update Failed"),
                 self._text(
@@ -4371,7 +5112,7 @@ class IsaacSaveEditor(tk.Tk):
         if not self.filename:
             return None
         base_name = Path(self.filename).name
-        match = re.search(r"(\d+)(?=\.dat$)", base_name)
+        match = _SAVE_SLOT_RE.search(base_name)
         if not match:
             return None
         try:
@@ -4408,7 +5149,7 @@ class IsaacSaveEditor(tk.Tk):
             if self.data is None:
                 return False
             try:
-                section_offsets = script.getSectionOffsets(self.data)
+                section_offsets = self._parse_data(script.getSectionOffsets)
                 for offset in _MULTI_EDEN_STACK_OFFSETS:
                     if _MULTI_EDEN_OFFSETS_ARE_ABSOLUTE:
                         target_offset = offset
@@ -4479,9 +5220,7 @@ class IsaacSaveEditor(tk.Tk):
 
         return any_success
 
-    def _propagate_numeric_update(
-        self, key: str, value: int, num_bytes: int
-    ) -> None:
+    def _propagate_numeric_update(self) -> None:
         if not self.filename:
             return
 
@@ -4492,51 +5231,78 @@ class IsaacSaveEditor(tk.Tk):
         if not related_paths:
             return
 
-        for path in related_paths:
+        # Mirrors are best effort, so they ride the save queue without error
+        # reporting; waiting on the queue tail still covers them.
+        self._pending_save = self._save_executor.submit(
+            self._write_bytes_to_paths, self.data, related_paths, self.filename
+        )
+
+    @staticmethod
+    def _write_bytes_to_paths(
+        data: bytes,
+        paths: Iterable[str | os.PathLike[str]],
+        source: str | os.PathLike[str] | None = None,
+    ) -> List[Path]:
+        """Write one in-memory buffer to every path; return the paths that failed.
+
+        ``source`` names a file already holding ``data``; where the platform
+        offers ``copy_file_range`` the copies are made from it in the kernel.
+        """
+
+        clone = source is not None and hasattr(os, "copy_file_range")
+        failed: List[Path] = []
+        for path in paths:
+            if clone:
+                try:
+                    _copy_file_atomic(source, path, len(data))
+                    continue
+                except OSError:
+                    clone = False
             try:
-                path.write_bytes(self.data)
+                _write_file_atomic(path, data)
             except OSError:
-                continue
+                failed.append(Path(path))
+        return failed
 
     def _related_save_paths(self) -> list[Path]:
         if not self.filename:
             return []
+        cached = self._related_paths_cache
+        if cached is not None and cached[0] == self.filename:
+            return list(cached[1])
 
         current_path = Path(self.filename)
+        try:
+            with os.scandir(current_path.parent) as entries:
+                existing_names = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            existing_names = set()
         candidates: set[Path] = set()
 
-        def _maybe_add(path: Path, *, require_exists: bool = True) -> None:
-            if path == current_path:
+        def _maybe_add(name: str, *, require_exists: bool = True) -> None:
+            if name == current_path.name:
                 return
-            if require_exists and not path.exists():
+            if require_exists and os.path.normcase(name) not in existing_names:
                 return
-            candidates.add(path)
+            candidates.add(current_path.with_name(name))
 
         # Include backup for the currently loaded file if present.
-        current_backup = current_path.with_name(current_path.name + ".backup")
-        _maybe_add(current_backup)
+        _maybe_add(current_path.name + ".backup")
 
         base_name = current_path.name
-        for source in SAVE_FILENAME_VARIANTS:
+        for source, replacements in _SAVE_VARIANT_REPLACEMENTS.items():
             if source not in base_name:
                 continue
-            for replacement in SAVE_FILENAME_VARIANTS:
-                if replacement == source:
-                    continue
-                alt_name = base_name.replace(source, replacement, 1)
-                _maybe_add(current_path.with_name(alt_name), require_exists=False)
+            for replacement in replacements:
+                _maybe_add(base_name.replace(source, replacement, 1), require_exists=False)
 
         # Also check backup for any alternate path we have already gathered.
-        additional_backups: list[Path] = []
         for path in list(candidates):
-            backup_path = path.with_name(path.name + ".backup")
-            if backup_path.exists():
-                additional_backups.append(backup_path)
+            _maybe_add(path.name + ".backup")
 
-        for backup in additional_backups:
-            _maybe_add(backup)
-
-        return sorted(candidates)
+        related = tuple(sorted(candidates))
+        self._related_paths_cache = (self.filename, related)
+        return list(related)
 
     @staticmethod
     def _decode_u32_from_chunk(chunk: bytes) -> int:
@@ -4707,39 +5473,26 @@ class IsaacSaveEditor(tk.Tk):
                     self._text("먼저 세이브 파일을 열어주세요.", "Please open a save file first."),
                 )
             return
-        original_streak = self._read_numeric_value("streak")
-
-        updated_fields: list[str] = []
         if not auto_trigger and not self._reload_save_file_if_enabled():
             return
 
-        for field_key in ("donation", "greed", "eden"):
-            if not self.apply_field(
-                field_key,
-                preset=999,
-                preserve_entry=not auto_trigger,
-                reload_before_apply=False,
-            ):
-                break
-            updated_fields.append(field_key)
-
-        if not auto_trigger:
-            for field_key in updated_fields:
-                entry_var = self._numeric_vars.get(field_key, {}).get("entry")
-                if entry_var is not None:
-                    entry_var.set("999")
-
-        if original_streak is None:
+        field_keys = ("donation", "greed", "eden")
+        if not self.apply_fields(
+            dict.fromkeys(field_keys, 999),
+            preserve_entry=not auto_trigger,
+            keep=("streak",),
+        ):
             return
 
-        current_streak = self._read_numeric_value("streak")
-        if current_streak is not None and current_streak != original_streak:
-            self.apply_field(
-                "streak",
-                preset=original_streak,
-                preserve_entry=not auto_trigger,
-                reload_before_apply=False,
-            )
+        if not auto_trigger:
+            entry_vars = [
+                entry_var
+                for field_key in field_keys
+                if (entry_var := self._numeric_vars.get(field_key, {}).get("entry")) is not None
+            ]
+            if entry_vars:
+                # One Tcl evaluation instead of a round trip per variable.
+                self.tk.eval("\n".join(f"set {{{entry_var}}} 999" for entry_var in entry_vars))
 
     def set_bestiary_encounters_to_one(self) -> None:
         if not self._ensure_data_loaded():
@@ -4769,23 +5522,76 @@ class IsaacSaveEditor(tk.Tk):
                 ),
             )
 
-    def refresh_current_values(self, *, update_entry: bool = True) -> None:
+    def refresh_current_values(
+        self, *, update_entry: bool = True, sections: Optional[Iterable[str]] = None
+    ) -> None:
+        selected = self._REFRESH_SECTIONS if sections is None else frozenset(sections)
+        if "numeric" in selected and not self._refresh_numeric_values(update_entry):
+            return
+        if "bestiary" in selected:
+            if self.data is None:
+                self._bestiary_positions = {}
+            else:
+                self._bestiary_positions = self._collect_bestiary_positions(self.data)
+            self._refresh_bestiary_tab(update_entry=update_entry)
+        if "completion" in selected:
+            self._refresh_completion_tab()
+        if "secrets" in selected:
+            self._refresh_secrets_tab()
+        if "items" in selected:
+            self._refresh_items_tab()
+        if "challenges" in selected:
+            self._refresh_challenges_tab()
+
+    def _build_numeric_fields(self) -> Dict[str, NumericField]:
+        fields: Dict[str, NumericField] = {}
+        for key in self._numeric_order:
+            config = self._numeric_config[key]
+            try:
+                num_bytes = int(config.get("num_bytes", 2))
+            except (TypeError, ValueError):
+                num_bytes = 2
+            try:
+                offsets = [int(config.get("offset"))]
+            except (TypeError, ValueError):
+                offsets = [0]
+            mirror_offsets = config.get("mirror_offsets")
+            if isinstance(mirror_offsets, Iterable) and not isinstance(
+                mirror_offsets, (str, bytes)
+            ):
+                for extra_offset in mirror_offsets:
+                    try:
+                        offsets.append(int(extra_offset))
+                    except (TypeError, ValueError):
+                        continue
+            min_value = config.get("min_value")
+            max_value = config.get("max_value")
+            description = config.get("description")
+            if not isinstance(description, tuple):
+                description = (str(description), str(description))
+            fields[key] = NumericField(
+                key=key,
+                offsets=tuple(offsets),
+                is_absolute=bool(config.get("offset_is_absolute", False)),
+                num_bytes=num_bytes,
+                signed=bool(config.get("signed", False)),
+                min_value=min_value if isinstance(min_value, int) else None,
+                max_value=max_value if isinstance(max_value, int) else None,
+                description=description,
+            )
+        return fields
+
+    def _refresh_numeric_values(self, update_entry: bool) -> bool:
         if self.data is None:
             for key in self._numeric_order:
                 vars_map = self._numeric_vars[key]
-                vars_map["current"].set("0")
+                vars_map["current"].set(0)
                 if update_entry:
                     vars_map["entry"].set("0")
-            self._refresh_completion_tab()
-            self._refresh_secrets_tab()
-            self._refresh_items_tab()
-            self._refresh_challenges_tab()
-            self._bestiary_positions = {}
-            self._refresh_bestiary_tab(update_entry=update_entry)
-            return
+            return True
 
         try:
-            section_offsets = script.getSectionOffsets(self.data)
+            section_offsets = self._parse_data(script.getSectionOffsets)
             section_base = section_offsets[1] + 0x4
         except Exception as exc:  # pragma: no cover - defensive UI feedback
             messagebox.showerror(
@@ -4793,44 +5599,15 @@ class IsaacSaveEditor(tk.Tk):
                 self._text("값을 불러오지 못했습니다.", "Could not read the requested values.")
                 + f"\n{exc}",
             )
-            return
+            return False
 
-        for key in self._numeric_order:
-            config = self._numeric_config[key]
+        for key in self._numeric_fields:
+            value = self._read_numeric_field(self.data, key, section_base)
             vars_map = self._numeric_vars[key]
-            try:
-                num_bytes = int(config.get("num_bytes", 2))
-            except (TypeError, ValueError):
-                num_bytes = 2
-            signed = bool(config.get("signed", False))
-            offset_value = config.get("offset")
-            try:
-                base_offset = int(offset_value)
-            except (TypeError, ValueError):
-                base_offset = 0
-            is_absolute = bool(config.get("offset_is_absolute", False))
-            if not is_absolute:
-                base_offset += section_base
-            try:
-                value = script.getInt(
-                    self.data,
-                    base_offset,
-                    num_bytes=num_bytes,
-                    signed=signed,
-                )
-            except Exception:
-                value = 0
-            value_str = str(value)
-            vars_map["current"].set(value_str)
+            vars_map["current"].set(value)
             if update_entry:
-                vars_map["entry"].set(value_str)
-
-        self._bestiary_positions = self._collect_bestiary_positions(self.data)
-        self._refresh_bestiary_tab(update_entry=update_entry)
-        self._refresh_completion_tab()
-        self._refresh_secrets_tab()
-        self._refresh_items_tab()
-        self._refresh_challenges_tab()
+                vars_map["entry"].set(str(value))
+        return True
 
 def main() -> None:
     app = IsaacSaveEditor()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+import string
+import threading
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional, Tuple
 
 _DATA_DIR = Path(__file__).resolve().parent
 _I18N_DIR = _DATA_DIR / "i18n"
@@ -86,15 +88,26 @@ _LANGUAGE_DISPLAY_NAMES: Dict[str, str] = {
 }
 
 
+_LANGUAGE_CODE_TABLE = str.maketrans(string.ascii_uppercase + "-", string.ascii_lowercase + "_")
+
+
+@lru_cache(maxsize=64)
 def _normalize_language_code(code: str) -> str:
-    return str(code or "").strip().lower().replace("-", "_")
+    # Language codes are ASCII, so one translate pass lowercases and swaps "-".
+    return str(code or "").strip().translate(_LANGUAGE_CODE_TABLE)
 
 
+@lru_cache(maxsize=128)
 def _canonicalize_language_code(code: str) -> str:
     normalized = _normalize_language_code(code)
     return _LANGUAGE_CANONICAL_MAP.get(normalized, normalized)
 
 
+@lru_cache(maxsize=64)
+def _language_candidates(code: str) -> Tuple[str, ...]:
+    return tuple(_iter_language_candidates(code))
+
+
 def _iter_language_candidates(code: str) -> Iterable[str]:
     normalized = _normalize_language_code(code)
     candidates = [normalized]
@@ -119,47 +132,77 @@ def _iter_language_candidates(code: str) -> Iterable[str]:
 
 
 @lru_cache(maxsize=1)
-def _load_ui_translations() -> Dict[str, Dict[str, str]]:
+def _load_ui_translations() -> Dict[Tuple[str, str], str]:
+    """Return translations keyed by ``(english, canonical language code)``."""
+
     try:
         raw = json.loads(_UI_TRANSLATIONS_PATH.read_text(encoding="utf-8"))
     except (OSError, json.JSONDecodeError):
         return {}
-    translations: Dict[str, Dict[str, str]] = {}
-    for english_text, mapping in raw.items():
-        if not isinstance(english_text, str) or not isinstance(mapping, dict):
-            continue
-        normalized_map = {
-            _canonicalize_language_code(key): str(value)
-            for key, value in mapping.items()
-            if isinstance(value, str) and value.strip()
-        }
-        if normalized_map:
-            translations[english_text] = normalized_map
-    return translations
+    if not isinstance(raw, dict):
+        return {}
+    return {
+        (english_text, _canonicalize_language_code(key)): value
+        for english_text, mapping in raw.items()
+        if isinstance(mapping, dict)
+        for key, value in mapping.items()
+        if isinstance(value, str) and value.strip()
+    }
+
+
+_preload_thread: Optional[threading.Thread] = None
+
+
+def preload_ui_translations() -> None:
+    """Start parsing the UI translation table in the background."""
 
+    global _preload_thread
+    if _preload_thread is None:
+        _preload_thread = threading.Thread(target=_load_ui_translations, daemon=True)
+        _preload_thread.start()
 
+
+def _ui_translations() -> Dict[Tuple[str, str], str]:
+    thread = _preload_thread
+    if thread is not None and thread.is_alive():
+        thread.join()
+    return _load_ui_translations()
+
+
+@lru_cache(maxsize=4096)
 def translate_ui_string(language_code: str, english: str, korean: str) -> str:
     english = english or ""
     if not english:
         return ""
-    mapping = _load_ui_translations().get(english)
-    if not mapping:
-        return ""
-    for candidate in _iter_language_candidates(language_code):
-        translated = mapping.get(candidate)
+    translations = _ui_translations()
+    for candidate in _language_candidates(language_code):
+        translated = translations.get((english, candidate))
         if translated:
             return translated
     return ""
 
 
-def get_language_display_name(code: str, default: str) -> str:
+def _lookup_language_display_name(code: str) -> Optional[str]:
     canonical = _canonicalize_language_code(code)
     if canonical in _LANGUAGE_DISPLAY_NAMES:
         return _LANGUAGE_DISPLAY_NAMES[canonical]
     base = canonical.split("_", 1)[0]
-    if base in _LANGUAGE_DISPLAY_NAMES:
-        return _LANGUAGE_DISPLAY_NAMES[base]
-    return default
+    return _LANGUAGE_DISPLAY_NAMES.get(base)
+
+
+# Every known spelling maps straight to its display name.
+_LANGUAGE_DISPLAY_NAMES_BY_CODE: Dict[str, str] = {
+    code: name
+    for code in (*_LANGUAGE_CANONICAL_MAP, *_LANGUAGE_DISPLAY_NAMES)
+    if (name := _lookup_language_display_name(code)) is not None
+}
+
+
+def get_language_display_name(code: str, default: str) -> str:
+    name = _LANGUAGE_DISPLAY_NAMES_BY_CODE.get(_normalize_language_code(code))
+    if name is None:
+        name = _lookup_language_display_name(code)
+    return default if name is None else name
 
 
 def is_english(code: str) -> bool:
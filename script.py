@@ -1,66 +1,72 @@
-import base64
+import binascii
+import struct
+import sys
+import zlib
+from array import array
+from functools import lru_cache
+from itertools import chain
 from typing import Dict
 
 filename = r""
 
 """
-item start offset (no base): 0xAB8
-item end offset (no base): 0xD97?
-base offset: 0x2AE
-some useful data offsets: (not tested, thank you afterbirth save editor)
-"0x4", "Mom Kills",
-"0x8", "Broken Rocks",
-"0xC", "Broken Tinted Rocks",
-"0x10", "Poop Destroyed",
-// "0x14",   "???", Blank
-"0x18", "Death Cards Used?", //?
-"0x1C", "??? (0x1C)", //?
-"0x20", "Arcades Visited?", //?
-"0x24", "Deaths",
-"0x28", "Isaac Kills?",
-"0x2C", "Shop Keepers Destroyed",
-"0x30", "Satan Kills?",
-"0x34", "Shell Game Playcount",
-"0x38", "Angel Items Taken?",
-"0x3C", "Devil Deals Taken?",
-"0x40", "Blood Donations?",
-"0x44", "Slots Destroyed",
-"0x48", "??? (0x48)",
-"0x4C", "Pennies Donated",✅
-"0x50", "Eden Tokens",✅
-"0x54", "Win Streak", 
-"0x58", "Best Streak", ✅
-"0x5C", "??? Kills?",
-"0x60", "Lamb Kills?",
-"0x64", "??? (0x64)",
-"0x1A8", "Loss Streak", 
+item start offset (no base): 0xAB8
+item end offset (no base): 0xD97?
+base offset: 0x2AE
+some useful data offsets: (not tested, thank you afterbirth save editor)
+"0x4", "Mom Kills",
+"0x8", "Broken Rocks",
+"0xC", "Broken Tinted Rocks",
+"0x10", "Poop Destroyed",
+// "0x14",   "???", Blank
+"0x18", "Death Cards Used?", //?
+"0x1C", "??? (0x1C)", //?
+"0x20", "Arcades Visited?", //?
+"0x24", "Deaths",
+"0x28", "Isaac Kills?",
+"0x2C", "Shop Keepers Destroyed",
+"0x30", "Satan Kills?",
+"0x34", "Shell Game Playcount",
+"0x38", "Angel Items Taken?",
+"0x3C", "Devil Deals Taken?",
+"0x40", "Blood Donations?",
+"0x44", "Slots Destroyed",
+"0x48", "??? (0x48)",
+"0x4C", "Pennies Donated",✅
+"0x50", "Eden Tokens",✅
+"0x54", "Win Streak", 
+"0x58", "Best Streak", ✅
+"0x5C", "??? Kills?",
+"0x60", "Lamb Kills?",
+"0x64", "??? (0x64)",
+"0x1A8", "Loss Streak", 
 "0x1B0", "??? (0x1B0)",
 "0x1B4", "??? (0x1B4)",
 "0x1B8", "Pennies Donated (Greed)",
-"0x254", "Greed Donations (Isaac)",
-"0x258", "Greed Donations (Maggy)",
-"0x25C", "Greed Donations (Cain)",
-"0x260", "Greed Donations (Judas)",
-"0x264", "Greed Donations (???)",
-"0x268", "Greed Donations (Eve)",
-"0x26C", "Greed Donations (Samson)",
-"0x270", "Greed Donations (Azazel)",
-"0x274", "Greed Donations (Lazarus)",
-"0x278", "Greed Donations (Eden)",
-"0x27C", "Greed Donations (The Lost)",
-"0x280", "Greed Donations (Lilith)",
-"0x284", "Greed Donations (Keeper)",
-"0x298", "Caves Cleared",
-"0x29C", "Basements Cleared",
-"0x2A0", "??? (0x2A0)",
-"0x2A4", "Depths Cleared"
-"""
-
-characters = ["Isaac", "Maggy", "Cain", "Judas", "???", "Eve", "Samson", "Azazel", 
-              "Lazarus", "Eden", "The Lost", "Lilith", "Keeper", "Apollyon", "Forgotten", "Bethany",
-              "Jacob & Esau", "T Isaac", "T Maggy", "T Cain", "T Judas", "T ???", "T Eve", "T Samson", "T Azazel", 
-              "T Lazarus", "T Eden", "T Lost", "T Lilith", "T Keeper", "T Apollyon", "T Forgotten", "T Bethany",
-              "T Jacob"]
+"0x254", "Greed Donations (Isaac)",
+"0x258", "Greed Donations (Maggy)",
+"0x25C", "Greed Donations (Cain)",
+"0x260", "Greed Donations (Judas)",
+"0x264", "Greed Donations (???)",
+"0x268", "Greed Donations (Eve)",
+"0x26C", "Greed Donations (Samson)",
+"0x270", "Greed Donations (Azazel)",
+"0x274", "Greed Donations (Lazarus)",
+"0x278", "Greed Donations (Eden)",
+"0x27C", "Greed Donations (The Lost)",
+"0x280", "Greed Donations (Lilith)",
+"0x284", "Greed Donations (Keeper)",
+"0x298", "Caves Cleared",
+"0x29C", "Basements Cleared",
+"0x2A0", "??? (0x2A0)",
+"0x2A4", "Depths Cleared"
+"""
+
+characters = ["Isaac", "Maggy", "Cain", "Judas", "???", "Eve", "Samson", "Azazel", 
+              "Lazarus", "Eden", "The Lost", "Lilith", "Keeper", "Apollyon", "Forgotten", "Bethany",
+              "Jacob & Esau", "T Isaac", "T Maggy", "T Cain", "T Judas", "T ???", "T Eve", "T Samson", "T Azazel", 
+              "T Lazarus", "T Eden", "T Lost", "T Lilith", "T Keeper", "T Apollyon", "T Forgotten", "T Bethany",
+              "T Jacob"]
 checklist_order = ["Isaac's Heart", "Isaac", "Satan", "Boss Rush", "Chest", "Dark Room", "Mega Satan", "Hush", "Greed", "Delirium", "Mother", "Beast"]
 
 
@@ -82,265 +88,169 @@ _BESTIARY_SECTION_INDEX = 10
 _BESTIARY_GROUP_COUNT = 4
 _BESTIARY_HEADER_SIZE = 8
 _BESTIARY_ENTRY_SIZE = 8
-
-DEAD_GOD_BESTIARY_SECTION_BASE64 = (
-    "BAAAAIwDAAAAAKAACAAAAAABoAADAAAAAAKgAAQAAAAAALAABQAAAAABsAADAAAAAADAAAYAAAAA"
-    "AOAABQAAAAAB4AABAAAAAADwAAQAAAAAAfAAAQAAAAABAAECAAAAAAIAAQIAAAAAACABEAAAAAAA"
-    "MAEGAAAAAAEwAQIAAAAAAEABBwAAAAAAUAEBAAAAAABwAQQAAAAAAXABAwAAAAACcAEFAAAAAACA"
-    "AQUAAAAAAYABAQAAAAACgAECAAAAAACQAQgAAAAAApABAwAAAAADkAEBAAAAAACgAQMAAAAAAaAB"
-    "BwAAAAAAsAECAAAAAADAAQIAAAAAANABAwAAAAAB0AEHAAAAAAPQAQEAAAAAAOABAQAAAAAAAAIC"
-    "AAAAAAAgAgQAAAAAADACAgAAAAACMAIDAAAAAABAAgEAAAAAAWACAgAAAAAAcAIBAAAAAAFwAgEA"
-    "AAAAAJACAQAAAAACkAIBAAAAAACgAgIAAAAAAaACAQAAAAAAsAIDAAAAAAGwAgEAAAAAAcACAQAA"
-    "AAAA0AICAAAAAADgAgEAAAAAAeACAgAAAAAA8AIBAAAAAAHwAgIAAAAAAAADAQAAAAABAAMEAAAA"
-    "AAAQAwMAAAAAARADAQAAAAAAIAMCAAAAAAEgAwIAAAAAADADAQAAAAAVMAMDAAAAAB8wAwMAAAAA"
-    "AEADAgAAAAABQAMBAAAAAABQAwEAAAAAAGADCgAAAAABcAMCAAAAAAJwAwIAAAAAAIADAQAAAAAA"
-    "oAMBAAAAAAGgAwMAAAAAAMADAgAAAAAA0AMGAAAAAALQAwIAAAAAA9ADAQAAAAAA4AMBAAAAAALg"
-    "AwEAAAAAAPADBQAAAAAAAAQCAAAAAAAQBAEAAAAAARAEAQAAAAAAMAQBAAAAAAFABAIAAAAAAFAE"
-    "AwAAAAAAcAQBAAAAAADQBAEAAAAAAOAEAQAAAAAB4AQFAAAAAArwBAIAAAAAAAAFAgAAAAAAEAUL"
-    "AAAAAAEQBQIAAAAAAEAFAgAAAAAAUAUYAAAAAABwBQIAAAAAAIAFAQAAAAABwAUBAAAAAADQBQEA"
-    "AAAAAOAFAgAAAAAAAAYDAAAAAAAQBgEAAAAAADAGBAAAAAAAQAYBAAAAAAFABgQAAAAAAFAGAwAA"
-    "AAAAYAYDAAAAAAFgBgIAAAAACqAMBAAAAAAAwAwBAAAAAADgDAEAAAAAAPAMAgAAAAAB8AwBAAAA"
-    "AAAADQQAAAAAAgANAgAAAAAAQA0CAAAAAANADQEAAAAAAGANAQAAAAAAcA0EAAAAAACQDQUAAAAA"
-    "ApANBAAAAAADkA0BAAAAAACgDQQAAAAAALANBQAAAAAAwA0EAAAAAAHADQEAAAAAAOANAgAAAAAA"
-    "8A0BAAAAAAAgDgMAAAAAAiAOBAAAAAAAMA4PAAAAAABADgEAAAAAAFAOAgAAAAABUA4BAAAAAABg"
-    "DgEAAAAAANAOAQAAAAAB0A4FAAAAAALQDgIAAAAAAOAOAQAAAAAAAA8CAAAAAAAQDwEAAAAAACAP"
-    "AQAAAAAAQA8GAAAAAAFADwIAAAAAAHAPAQAAAAAAgA8BAAAAAACQDwIAAAAAAKAPAgAAAAAAwA8F"
-    "AAAAAADQDwIAAAAAAOAPAgAAAAAA8A8CAAAAAAAAEAUAAAAAACAQAQAAAAAAMBABAAAAAABAEAQA"
-    "AAAACkAQBAAAAAAAUBACAAAAAAFQEAEAAAAAAGAQAgAAAAAAgBADAAAAAACQEAgAAAAAALAQCAAA"
-    "AAAAwBAKAAAAAADQEAIAAAAAAdAQAQAAAAAA8BADAAAAAAAQEQoAAAAAACARAQAAAAAAQBEBAAAA"
-    "AABQEQIAAAAAAMARAwAAAAAAEBIBAAAAAACAEgEAAAAAAKASAgAAAAAA8BICAAAAAAAAEwEAAAAA"
-    "ABATAgAAAAAAMBMIAAAAAAFgEwQAAAAAAHATAwAAAAAAEBkDAAAAAABAGQQAAAAAAFAZAgAAAAAB"
-    "YBkCAAAAAABwGRYAAAAAAKAZAQAAAAAAsBkBAAAAAADAGQIAAAAAANAZAgAAAAAAYDIBAAAAAABw"
-    "MgEAAAAAAIAyAgAAAAAA0DIBAAAAAADwMgEAAAAAAAAzAQAAAAAAMDMBAAAAAABAMwEAAAAAAKAz"
-    "AQAAAAAAEDQBAAAAAAAwNQEAAAAAAEA1AQAAAAAAUDUBAAAAAADgNQIAAAAAADA2AQAAAAAAQDYE"
-    "AAAAAABgNgEAAAAAAHA2AgAAAAAAEDcCAAAAAAEQNwIAAAAAAGA3AgAAAAABYDcCAAAAAABAOAEA"
-    "AAAAAFA4AgAAAAAAYDgFAAAAAACQOAIAAAAAAKA4AgAAAAAAwDgDAAAAAADQOAMAAAAAAAA5CAAA"
-    "AAAAEDkBAAAAAAAgOQEAAAAAAEA5AQAAAAAAUDkCAAAAAABgOwEAAAAAAHA7BAAAAAAocDsBAAAA"
-    "AgAAAEgHAAAAAKAATgkAAAABoADEBAAAAAKgAK4DAAAAA6AAMwAAAAAAsADtFgAAAAGwAEAKAAAA"
-    "AMAA9Q4AAAAA0ACfJQAAAADgAJ4hAAAAAeAAcAQAAAAC4AAmAAAAAADwAD8QAAAAAfAAXQ0AAAAC"
-    "8AA5AgAAAAPwAJUAAAAAAAABbgYAAAABAAGsAgAAAAIAAbgCAAAAACABMnsAAAAAMAE8CAAAAAEw"
-    "AYIFAAAAAjABYwAAAAADMAFZAAAAAABAARoFAAAAAFAByAcAAAAAYAFUCAAAAAFgAboCAAAAAmAB"
-    "FgAAAAADYAEqAAAAAABwAcM4AAAAAXABHA8AAAACcAF9BwAAAANwAT4AAAAAAIABvBAAAAABgAES"
-    "BgAAAAKAAVIDAAAAA4ABDQYAAAAAkAFvGgAAAAGQASIFAAAAApABxgUAAAADkAHEAAAAAASQAXYA"
-    "AAAABZABjAAAAAAGkAFMAAAAAACgAa4OAAAAAaAB5ggAAAACoAH0BQAAAACwASYNAAAAAbABwQIA"
-    "AAADsAGLAAAAAADAAWcOAAAAAcABkAMAAAACwAEFAQAAAADQAXsNAAAAAdAB2gkAAAAC0AHoAAAA"
-    "AAPQAS8AAAAAAOABRQ0AAAAB4AHYAQAAAALgAVcPAAAAAPAB5gcAAAAB8AE/AAAAAAAAAmoOAAAA"
-    "ACACwAgAAAABIAK5AAAAAABAAksBAAAAAGACxQgAAAABYAKVCAAAAAJgAiUAAAAAA2ACxgAAAAAA"
-    "cALPCAAAAAFwAowCAAAAAnACeQYAAAADcAIcAgAAAACAAuMLAAAAAYAC5QEAAAACgAJnAAAAAACQ"
-    "AgMNAAAAAZACtAAAAAADkAKIAAAAAASQAnYAAAAAAKACSgAAAAABoAINAAAAAAKgAhEAAAAAALAC"
-    "zAEAAAABsAKGAAAAAADAAoYAAAAAAcACXAAAAAAA4AIAAgAAAAHgAmQBAAAAAuACRgAAAAAA8AI0"
-    "AgAAAAHwAk0BAAAAAAADxgIAAAABAAO4AQAAAAAQA68BAAAAARADYAEAAAAAIANlBAAAAAEgA1EC"
-    "AAAAADAD/AAAAAABMAOPAQAAAAowA44BAAAACzADdwQAAAAUMAMcAwAAABUwAwYLAAAAHjADOAYA"
-    "AAAfMAP5FQAAAABAA+gAAAAAAUADsQAAAAAAUANBAQAAAAFQAyYAAAAAAGAD7wMAAAAAcANaCAAA"
-    "AAFwA68CAAAAAnADsAYAAAAAgAPfCQAAAACQA1cDAAAAAZADJgEAAAACkAMlAAAAAACgA2oOAAAA"
-    "AaADhwQAAAAAsAPbBQAAAADAA88LAAAAAcAD1wAAAAACwAMbAAAAAADQA1UTAAAAAdADgwQAAAAC"
-    "0APJAAAAAAPQA6gBAAAABNADOQAAAAAF0AOWAgAAAAbQAyIAAAAAB9ADRwAAAAAA4AP1DAAAAAHg"
-    "A2ADAAAAAuADowMAAAAD4AO2AAAAAADwAy0CAAAAAAAEUwIAAAAAEAQZAAAAAAEQBAIBAAAAACAE"
-    "qgAAAAAAMAREAQAAAAEwBKsBAAAAAEAE0gAAAAABQASpAAAAAABQBLADAAAAAVAEwgAAAAAAcATc"
-    "AQAAAAFwBIkAAAAAAKAEcgAAAAAA0AQsDgAAAADgBEEAAAAAAeAEMAIAAAAA8ATrAAAAAAHwBE4A"
-    "AAAAAvAElQAAAAAK8AT9AAAAAAvwBFMAAAAADPAEmwAAAAAAAAUXBgAAAAAQBUQDAAAAARAFGgEA"
-    "AAAAIAWWAAAAAAAwBYECAAAAAEAFEAAAAAAAUAWPbAAAAABgBcAHAAAAAHAF8AQAAAABcAVyAAAA"
-    "AACABQ0FAAAAAYAFJAIAAAACgAVQAQAAAACQBXUDAAAAAKAFbgMAAAAAsAWrAQAAAADABR4EAAAA"
-    "AcAFrgAAAAAA0AWSAwAAAAHQBVEAAAAAAOAFnQoAAAAAAAZNAAAAAAAQBokAAAAAACAGiQAAAAAA"
-    "MAaYAgAAAABABqQCAAAAAUAGWQEAAAAAUAbVAAAAAAFQBkAAAAAAAGAGpQEAAAABYAaMAQAAAACQ"
-    "DAEAAAAAAKAMQgAAAAAKoAwqAAAAAACwDAYAAAAAAMAMXQQAAAAA0Ay9BQAAAADgDFoBAAAAAeAM"
-    "3wAAAAAA8AzEAwAAAAHwDAUCAAAAAAANGQ0AAAABAA0iCAAAAAIADSMDAAAAABAN6gQAAAAAIA1x"
-    "BQAAAAAwDc8GAAAAAEAN6QAAAAABQA2GBQAAAAJADQkAAAAAA0ANBgAAAAAEQA0PAAAAAABQDdQA"
-    "AAAAAGANtAIAAAAAcA14AwAAAACADSACAAAAAYANVgIAAAAAkA1nVwAAAAGQDTwEAAAAApANrhcA"
-    "AAADkA1DAAAAAACgDUgAAAAAALANugkAAAAAwA1/EQAAAAHADSwDAAAAANANSQEAAAAA4A14CwAA"
-    "AADwDR8EAAAAAAAOoQEAAAAAEA5cAAAAAAAgDmcGAAAAASAO8QEAAAACIA6SBAAAAAAwDr0cAAAA"
-    "ATAODAAAAAAAQA6aBQAAAABQDjQJAAAAAVAOEgAAAAAAYA45AAAAAABwDrURAAAAAXAOxQYAAAAA"
-    "oA7uCwAAAACwDgYAAAAAAMAOIgAAAAAA0A5CBwAAAAHQDmoDAAAAAtAOtgAAAAAA4A4IAwAAAADw"
-    "DkcDAAAAAAAPAwsAAAABAA+RAAAAAAMADwIAAAAAABAPhAYAAAAAIA/oBAAAAAAwD9sDAAAAAEAP"
-    "MBQAAAABQA8ABAAAAAJAD/oAAAAAAGAPBgIAAAAAcA/PAgAAAACAD/MDAAAAAJAPpwEAAAAAoA+g"
-    "AgAAAACwD98AAAAAAMAP9AgAAAAA0A+XAgAAAADgD9gOAAAAAPAPmwQAAAAAABDCCgAAAAAQEMcB"
-    "AAAAARAQHAAAAAAAIBDsBgAAAAAwEPUAAAAAAEAQeQEAAAAKQBCGCwAAAABQEFICAAAAAVAQUAEA"
-    "AAAAYBDfAQAAAABwECgBAAAAAIAQ7QEAAAAAkBCBAQAAAACgEDgAAAAAALAQ4QEAAAAAwBA/AQAA"
-    "AADQEO8CAAAAAdAQIAAAAAAA4BA3AAAAAADwEOsAAAAAAfAQXwAAAAAAABHWAAAAAAEAEV8AAAAA"
-    "ABARNgAAAAAAIBF+AAAAAAAwEWQAAAAAAEAR2AEAAAAAUBFMBwAAAABgETQAAAAAAHAR7wEAAAAA"
-    "gBHfBgAAAACQEWMQAAAAAKAR1wMAAAAAsBGZAAAAAADAEdoHAAAAANARsAEAAAAA4BGDAwAAAADw"
-    "EVEAAAAAAAASAQMAAAAAEBLEAwAAAAAgEt0FAAAAAHASFwIAAAAAgBKaLgAAAACQElEBAAAAA5AS"
-    "KhYAAAAAoBLNBQAAAACwEvUDAAAAAMASlgkAAAAA0BIaBAAAAADgEpgCAAAAAPASLAoAAAAAABNO"
-    "BQAAAAAQEwkLAAAAACATrhoAAAABIBO5AAAAAAAwEyECAAAAAEATtQIAAAAAUBPFAQAAAABgE/UB"
-    "AAAAAWATTAcAAAAAcBMaBAAAAAAQGdcBAAAAACAZGAAAAAAAMBlvAQAAAABAGU8DAAAAAFAZeAMA"
-    "AAAAYBkZAAAAAAFgGRcAAAAAAHAZIAEAAAAAkBmWAAAAAACgGRECAAAAALAZlQAAAAAAwBm0AAAA"
-    "AABAMgIAAAAAAFAyzgAAAAAAYDLgAAAAAABwMucAAAAAAIAyTQMAAAAAkDIRAAAAAACgMmYFAAAA"
-    "ALAyYQAAAAAAwDLwAAAAAAHAMgcAAAAAANAyrwAAAAAA4DKYAQAAAADwMrsAAAAAAAAzYgAAAAAB"
-    "ADOWAAAAAAAQM8EAAAAAARAzGwAAAAAAIDMCAAAAAAEgMwkAAAAAAiAzdQAAAAAAMDOnAQAAAABA"
-    "M34AAAAAAUAzOQAAAAAAUDOTAAAAAABgM2UAAAAAAHAzUwAAAAAAgDNcAAAAAAGAMxAAAAAAAJAz"
-    "fgAAAAAAoDNdAAAAAACwM4cAAAAAAbAzAQAAAAAAwDNQAAAAAADQM5AAAAAAAdAzAgAAAAAA4DN3"
-    "AAAAAADwMzgAAAAAFPAzcgAAAAABADQiAAAAAAAQNEkBAAAAACA0LgIAAAABIDSfAQAAAAIgNAYA"
-    "AAAAADA0GgAAAAAAQDTSAAAAAABgNC4AAAAAAIA0yAAAAAAAkDSwAAAAAAGQNB4AAAAAAMA0CwAA"
-    "AAABIDWrAAAAAAIgNUoAAAAAADA1nQAAAAAAQDUFAQAAAABQNaEEAAAAAGA1FAAAAAAAcDUHAQAA"
-    "AAFwNQoAAAAAAIA1JAAAAAAAkDUvAAAAAACwNTUAAAAAAMA1RwAAAAAA0DXNAAAAAADgNcIAAAAA"
-    "APA1VwAAAAAAADatAAAAAAAQNkAAAAAAACA2BwAAAAAAMDYCAAAAAABANtYJAAAAAFA2swAAAAAA"
-    "YDY3AgAAAABwNmkAAAAAAIA2WAAAAAAAkDZaAAAAAACgNiEAAAAAALA2DwAAAAAAwDYDAAAAAAHA"
-    "Nm4AAAAAANA2CQAAAAAA4DbpAAAAAADwNpQAAAAAAAA3rgAAAAAAEDc3AwAAAAEQN0kAAAAAACA3"
-    "eQAAAAAAMDf5AAAAAABANzEQAAAAAFA3UgAAAAABUDezAAAAAABgN8cAAAAAAWA34QAAAAAAcDeM"
-    "AAAAAACANxUAAAAAAJA3TwAAAAAAoDcEAQAAAACwNzoCAAAAAbA3RAAAAAAAwDczAAAAAABAOBQA"
-    "AAAAAFA4JwAAAAAAYDglAAAAAABwOBMAAAAAAIA4CwAAAAAAkDgKAAAAAACgOAUAAAAAAMA4cgAA"
-    "AAAA0DgXAAAAAADgOAcAAAAAAPA4CQAAAAAAADlJAAAAABQAOTMAAAAAABA5FgAAAAAAIDkNAAAA"
-    "AAAwOQsAAAAAAEA5HgAAAAAAUDkHAAAAAABgOUAAAAAAAIA5DAAAAAAAYDsBAAAAAABwOycAAAAA"
-    "CnA7MAAAAAAUcDswAAAAAB5wOzAAAAAAKHA7LwAAAAMAAADcBQAAAACgAFIAAAAAAaAAGQAAAAAC"
-    "oAArAAAAAACwAC0AAAAAAbAAGQAAAAAAwAAQAAAAAADgAAEAAAAAAPAAEAAAAAAB8AAMAAAAAAPw"
-    "AAIAAAAAAAABAwAAAAABAAEBAAAAAAIAASQAAAAAACABwQAAAAAAMAFcAAAAAAEwASIAAAAAAEAB"
-    "VAAAAAAAUAEPAAAAAABgAQEAAAAAAHABwQAAAAABcAE0AAAAAAJwAVQAAAAAA3ABAQAAAAAAgAFJ"
-    "AAAAAAGAATQAAAAAAoABHAAAAAADgAELAAAAAACQAacAAAAAAZABDAAAAAACkAEXAAAAAAOQAQQA"
-    "AAAABZABAgAAAAAGkAEBAAAAAACgAQ4AAAAAAaABGAAAAAAAsAEDAAAAAAOwAQMAAAAAAMABPQAA"
-    "AAABwAEPAAAAAALAAQMAAAAAANABMwAAAAAB0AFLAAAAAALQAQIAAAAAA9ABAQAAAAAA4AEGAAAA"
-    "AAHgAQQAAAAAAuABAwAAAAAA8AEEAAAAAAAAAhMAAAAAACACLwAAAAABIAIEAAAAAAAwAg0AAAAA"
-    "ATACHwAAAAACMAIDAAAAAAMwAhEAAAAAAEACDwAAAAAAYAIHAAAAAAFgAhIAAAAAA2ACAwAAAAAA"
-    "cAIwAAAAAAFwAgoAAAAAAnACCAAAAAADcAIkAAAAAACAAh0AAAAAAYACBwAAAAACgAIFAAAAAACQ"
-    "AjQAAAAAAZACEAAAAAACkAICAAAAAAOQAgMAAAAABJACAQAAAAAAsAIuAAAAAAGwAhQAAAAAAMAC"
-    "NgAAAAABwAJqAAAAAADQAjUAAAAAAOACCQAAAAAB4AISAAAAAADwAioAAAAAAfACDgAAAAAAAAMM"
-    "AAAAAAEAAw0AAAAAABADDQAAAAABEAMKAAAAAAAgAw0AAAAAASADBgAAAAAAMAMIAAAAAAEwAwYA"
-    "AAAACzADBgAAAAAUMAMFAAAAABUwAw0AAAAAHjADCAAAAAAfMAMPAAAAAABAAxIAAAAAAUADBwAA"
-    "AAAAYANBAAAAAABwAzUAAAAAAXADIwAAAAACcANCAAAAAACAAwcAAAAAAJADBgAAAAAAoAM6AAAA"
-    "AAGgAxoAAAAAALADBwAAAAAAwANRAAAAAAHAAxAAAAAAANADGQAAAAAB0AMCAAAAAAPQAwIAAAAA"
-    "BtADAwAAAAAA4AMTAAAAAAHgAwQAAAAAAuADFgAAAAAD4AMJAAAAAADwAyUAAAAAAAAEHAAAAAAA"
-    "EAQRAAAAAAEQBAsAAAAAACAECwAAAAAAMAQDAAAAAAEwBAgAAAAAAEAEBwAAAAABQARBAAAAAABQ"
-    "BBgAAAAAAVAEBQAAAAAAcAQJAAAAAAFwBAEAAAAAAKAEBAAAAAAA0AQQAAAAAAHgBBwAAAAAAPAE"
-    "BAAAAAAB8AQBAAAAAALwBAcAAAAACvAEDAAAAAAL8AQGAAAAAAzwBAUAAAAAAAAFEwAAAAAAEAUr"
-    "AAAAAAEQBU0AAAAAACAFBAAAAAAAMAUHAAAAAABABQUAAAAAAFAF6wEAAAAAYAUVAAAAAABwBSoA"
-    "AAAAAIAFAQAAAAABgAUGAAAAAAKABQMAAAAAAJAFHwAAAAAAsAUBAAAAAADQBUYAAAAAAdAFAQAA"
-    "AAAA4AU+AAAAAAAABlgAAAAAABAGGQAAAAAAIAYDAAAAAAAwBkoAAAAAAEAGFAAAAAABQAYUAAAA"
-    "AABQBhcAAAAAAVAGCwAAAAAAYAYwAAAAAAFgBicAAAAAAJAMAwAAAAAAsAwDAAAAAADADAcAAAAA"
-    "ANAMAQAAAAAA4AwKAAAAAAHgDAUAAAAAAPAMOAAAAAAB8AwfAAAAAAAADR4AAAAAAQANFwAAAAAC"
-    "AA0JAAAAAAAQDQgAAAAAACANDAAAAAAAMA0GAAAAAABADVMAAAAAAUANCQAAAAACQA0DAAAAAANA"
-    "DQsAAAAAAFANMQAAAAAAYA0JAAAAAABwDSIAAAAAAIANAQAAAAABgA0DAAAAAACQDWcAAAAAAZAN"
-    "BwAAAAACkA0xAAAAAACgDVMAAAAAALANRgAAAAAAwA1kAAAAAAHADRYAAAAAANANAQAAAAAA4A0m"
-    "AAAAAADwDQsAAAAAAAAOBwAAAAAAEA4FAAAAAAAgDhsAAAAAASAOAwAAAAACIA4mAAAAAAAwDh0A"
-    "AAAAAEAOCQAAAAAAUA4HAAAAAABgDgMAAAAAAHAODAAAAAABcA4VAAAAAACgDkgAAAAAANAOGAAA"
-    "AAAB0A4lAAAAAALQDggAAAAAAPAOFAAAAAAAAA8IAAAAAAEADwEAAAAAABAPNQAAAAAAMA8BAAAA"
-    "AABADxcAAAAAAUAPBQAAAAAAYA8MAAAAAABwDwEAAAAAAIAPBAAAAAAAkA8OAAAAAACgDx0AAAAA"
-    "ALAPBgAAAAAAwA84AAAAAADQDwUAAAAAAOAPNgAAAAAA8A8VAAAAAAAAEEIAAAAAABAQBAAAAAAA"
-    "IBALAAAAAAAwEAEAAAAAAEAQJgAAAAAKQBA9AAAAAABQECQAAAAAAVAQEgAAAAAAYBAGAAAAAABw"
-    "EAkAAAAAAIAQTAAAAAAAkBA2AAAAAACwEEYAAAAAAMAQWAAAAAAA0BAeAAAAAAHQEAQAAAAAAPAQ"
-    "HwAAAAAB8BAGAAAAAAAAET8AAAAAAQAREAAAAAAAEBEQAAAAAAAgEQ8AAAAAADARAQAAAAAAQBEO"
-    "AAAAAABQERcAAAAAAGARAQAAAAAAcBECAAAAAACAEQUAAAAAAJARHAAAAAAAoBEBAAAAAACwEQEA"
-    "AAAAAMAREwAAAAAA0BEaAAAAAADgEQgAAAAAAPAREgAAAAAAABIFAAAAAAAQEg0AAAAAACASBgAA"
-    "AAAAgBJFAAAAAACQEgMAAAAAA5ASHQAAAAAAsBIKAAAAAADAEg4AAAAAANASBgAAAAAA8BIZAAAA"
-    "AAAAEw4AAAAAABATHQAAAAAAMBMYAAAAAABAEwIAAAAAAFATAQAAAAAAYBMCAAAAAAFgEwcAAAAA"
-    "AHATJgAAAAAAEBklAAAAAAAgGQ0AAAAAADAZDQAAAAAAQBkSAAAAAABQGRcAAAAAAGAZCAAAAAAB"
-    "YBkSAAAAAABwGZ0AAAAAAJAZBQAAAAAAoBk1AAAAAACwGQsAAAAAAMAZYwAAAAAA0BkBAAAAAABA"
-    "MgEAAAAAAGAyAQAAAAAAcDIHAAAAAACgMg4AAAAAANAyAwAAAAAA4DIHAAAAAADwMgYAAAAAAQAz"
-    "BQAAAAAAIDMGAAAAAAIgMwgAAAAAADAzBwAAAAAAQDMCAAAAAAFAMwEAAAAAAGAzAgAAAAAAcDMB"
-    "AAAAAACAMwEAAAAAAKAzBQAAAAAAsDMCAAAAABTwMwEAAAAAAQA0AQAAAAAAEDQEAAAAAAAgNA8A"
-    "AAAAASA0KAAAAAAAQDQNAAAAAACANAMAAAAAASA1AQAAAAAAMDUKAAAAAABANQcAAAAAAFA1BAAA"
-    "AAAAYDUCAAAAAABwNQEAAAAAAJA1AgAAAAAAwDUCAAAAAADwNQQAAAAAAAA2DAAAAAAAMDYHAAAA"
-    "AABANhMAAAAAAFA2BAAAAAAAYDYDAAAAAABwNgoAAAAAAcA2BQAAAAAA0DYHAAAAAADgNgMAAAAA"
-    "APA2AgAAAAAAADcJAAAAAAAQNx8AAAAAARA3BQAAAAAAMDcPAAAAAABANxQAAAAAAVA3AgAAAAAA"
-    "YDcOAAAAAAFgNw8AAAAAAHA3BQAAAAAAgDcDAAAAAACQNwIAAAAAAKA3AQAAAAAAsDcIAAAAAAGw"
-    "NwcAAAAAAMA3AQAAAAAA0DcHAAAAAABAOAcAAAAAAFA4AwAAAAAAcDgEAAAAAACQOA4AAAAAAKA4"
-    "BQAAAAAAwDgOAAAAAADQOAEAAAAAAOA4AQAAAAAAADkEAAAAABQAOQQAAAAAABA5AgAAAAAAMDkG"
-    "AAAAAABAOQgAAAAAAFA5AwAAAAAAYDkBAAAAAABgOy4AAAAAAHA7HgAAAAAKcDsGAAAAABRwOwsA"
-    "AAAAHnA7FAAAAAAocDsQAAAAAQAAAHwHAAAAAKAAphAAAAABoAB8CAAAAAKgAOEGAAAAA6AAMwAA"
-    "AAAAsACLHAAAAAGwACEKAAAAAMAA4w4AAAAA0AB2JAAAAADgABghAAAAAeAAYwQAAAAC4AAmAAAA"
-    "AADwAEEQAAAAAfAAOA0AAAAC8ABWAgAAAAPwAJkAAAAAAAABdAYAAAABAAGmAgAAAAIAAb0CAAAA"
-    "ACABRX0AAAAAMAGMHAAAAAEwAbkSAAAAAjABYwAAAAADMAFLAAAAAABAASsFAAAAAFABuQcAAAAA"
-    "YAFRCAAAAAFgAc0CAAAAAmABHwAAAAADYAEpAAAAAABwAY81AAAAAXABHA8AAAACcAGgBwAAAANw"
-    "ATwAAAAAAIABuhAAAAABgAEQBgAAAAKAAVADAAAAA4AB2gUAAAAAkAHdGQAAAAGQARwFAAAAApAB"
-    "wwUAAAADkAGkAAAAAASQAWkAAAAABZABjgAAAAAGkAFKAAAAAACgAWcTAAAAAaABggsAAAACoAHz"
-    "BQAAAACwASkQAAAAAbABvQIAAAADsAF3AAAAAADAAfUOAAAAAcABxAMAAAACwAELAQAAAADQAecN"
-    "AAAAAdAB0QkAAAAC0AH5AAAAAAPQATEAAAAAAOABWQ0AAAAB4AHVAQAAAALgAWQPAAAAAPAB/gcA"
-    "AAAB8AE/AAAAAAAAAooOAAAAACACvAgAAAABIAKyAAAAAAAwAq8IAAAAATACvwQAAAACMALvBwAA"
-    "AAMwAkMFAAAAAEACTgEAAAABQAIDAAAAAABgArgIAAAAAWACvggAAAACYAIkAAAAAANgAsEAAAAA"
-    "AHAC2wgAAAABcAKTAgAAAAJwApcGAAAAA3ACGwIAAAAAgAK6CwAAAAGAAuoBAAAAAoACZQAAAAAA"
-    "kAIeDQAAAAGQArIAAAAAApACWAAAAAADkAKLAAAAAASQAnEAAAAAAKACDgwAAAABoAKwAgAAAAKg"
-    "ApwCAAAAALAC6wEAAAABsAKLAAAAAADAAs4EAAAAAcACChMAAAAA0AJiDAAAAADgAgcCAAAAAeAC"
-    "bAEAAAAC4AJFAAAAAADwAjICAAAAAfACUgEAAAAAAAPWAgAAAAEAA7wBAAAAABADsgEAAAABEANn"
-    "AQAAAAAgA1sEAAAAASADUgIAAAAAMAMFAQAAAAEwA5QBAAAACjADSAEAAAALMANNBAAAABQwA5AC"
-    "AAAAFTADoQoAAAAeMAMgBQAAAB8wAxgVAAAAAEAD7gAAAAABQAOwAAAAAABQA0cBAAAAAVADJQAA"
-    "AAAAYAPwAwAAAABwA4QIAAAAAXAD9QIAAAACcAO+BgAAAACAA/sJAAAAAJADZQMAAAABkAMnAQAA"
-    "AAKQAyUAAAAAAKADiQ4AAAABoAOBBAAAAACwA94FAAAAAMADwAsAAAABwAPWAAAAAALAAzkAAAAA"
-    "ANAD8hIAAAAB0ANnBAAAAALQA7YAAAAAA9ADjAEAAAAE0AM5AAAAAAXQA6sCAAAABtADIgAAAAAH"
-    "0ANGAAAAAADgA5APAAAAAeAD0QMAAAAC4AOdBAAAAAPgA6EAAAAAAPADRwIAAAAAAARUAgAAAAAQ"
-    "BAACAAAAARAE7AEAAAAAIASYAQAAAAAwBEMBAAAAATAEswEAAAAAQATXAAAAAAFABKwAAAAAAFAE"
-    "3gMAAAABUATPAAAAAABwBOwBAAAAAXAEigAAAAAAoAR1AAAAAADQBPkNAAAAAOAEQAAAAAAB4AQ3"
-    "AgAAAArgBMsCAAAAAPAE7AAAAAAB8ARQAAAAAALwBJUAAAAACvAE+wAAAAAL8ARVAAAAAAzwBJwA"
-    "AAAAAAAFGAYAAAAAEAVcAwAAAAEQBRsBAAAAACAFmAAAAAAAMAV7AgAAAABABUsAAAAAAFAFDm0A"
-    "AAAAYAXMBwAAAABwBbwFAAAAAXAFZgAAAAAAgAX+BAAAAAGABSMCAAAAAoAFTAEAAAAAkAVqDAAA"
-    "AACgBXIDAAAAALAFoQEAAAAAwAUyBAAAAAHABaIAAAAAANAFmAMAAAAB0AVMAAAAAADgBZwKAAAA"
-    "AAAGJiQAAAAAEAaIAAAAAAAgBogAAAAAADAGlwIAAAAAQAabAgAAAAFABmMBAAAAAFAGnQIAAAAB"
-    "UAaRAAAAAABgBrEBAAAAAWAGkQEAAAAAkAwdAAAAAACgDPwdAAAACqAMkgkAAAAAsAxZAAAAAADA"
-    "DGoEAAAAANAMxgUAAAAA4AxdAQAAAAHgDOAAAAAAAPAMzAMAAAAB8AwEAgAAAAAADRcNAAAAAQAN"
-    "KA4AAAACAA0hAwAAAAAQDekGAAAAACAN9gkAAAAAMA29BgAAAABADToWAAAAAUAN5gUAAAACQA2m"
-    "AAAAAANADVAAAAAABEANJAAAAAAAUA1lBgAAAABgDccCAAAAAHANcgMAAAAAgA3cBQAAAAGADQgF"
-    "AAAAAJANDVcAAAABkA0dBAAAAAKQDTEWAAAAA5ANQgAAAAAAoA3aFQAAAACwDSgKAAAAAMANgREA"
-    "AAABwA0lAwAAAADQDVEBAAAAAOANtgsAAAAA8A0gBAAAAAAADqUBAAAAABAObgAAAAAAIA5WBgAA"
-    "AAEgDrwDAAAAAiAOdQQAAAAAMA6mHAAAAAEwDgoAAAAAAEAOkwUAAAAAUA5HCQAAAAFQDhIAAAAA"
-    "AGAOOQAAAAAAcA7qEQAAAAFwDtkGAAAAAKAOwAsAAAAAsA6NBQAAAADADn0KAAAAANAORQcAAAAB"
-    "0A5rAwAAAALQDrwAAAAAAOAO+gIAAAAA8A75BwAAAAAADwELAAAAAQAPkQAAAAADAA8CAAAAAAAQ"
-    "D4EGAAAAACAP1QQAAAAAMA/gAwAAAABADxIUAAAAAUAP+wMAAAACQA/8AAAAAABgD/UBAAAAAHAP"
-    "0AIAAAAAgA/mAwAAAACQD8IBAAAAAKAPkwIAAAAAsA/SAAAAAADAD0wJAAAAANAPnQIAAAAA4A8k"
-    "DwAAAADwD6IEAAAAAAAQwAoAAAAAEBAuAwAAAAEQEBgAAAAAACAQ7wYAAAAAMBD0AAAAAABAEIQB"
-    "AAAACkAQmgsAAAAAUBBdAgAAAAFQEF0BAAAAAGAQ8AEAAAAAcBAuAQAAAACAEPkBAAAAAJAQlQEA"
-    "AAAAoBA5AAAAAACwEO0BAAAAAMAQUQEAAAAA0BD6AgAAAAHQEB0AAAAAAOAQOAAAAAAA8BDyAAAA"
-    "AAHwEF8AAAAAAAAR1gAAAAABABFfAAAAAAAQEUMAAAAAACARhQAAAAAAMBF0AAAAAABAEcwBAAAA"
-    "AFARYgcAAAAAYBE3AAAAAABwEfcBAAAAAIAR0QYAAAAAkBFPEAAAAACgEdEDAAAAALARjQAAAAAA"
-    "wBHBBwAAAADQEa8BAAAAAOARbAUAAAAA8BEmAQAAAAAAEgUDAAAAABASxgMAAAAAIBJ6BgAAAABw"
-    "EhACAAAAAIAS2jkAAAAAkBKQAQAAAAOQEkAWAAAAAKAS6QUAAAAAsBL7AwAAAADAEs0JAAAAANAS"
-    "GgQAAAAA4BKPCQAAAADwEjMKAAAAAAATRQUAAAAAEBMDCwAAAAAgE9EkAAAAASATsQAAAAAAMBMz"
-    "AgAAAABAE8YCAAAAAFAT0AEAAAAAYBMgAQAAAAFgE0YHAAAAAHATGwQAAAAAEBnaAQAAAAAgGT4B"
-    "AAAAASAZAQAAAAAAMBlwAQAAAABAGXADAAAAAFAZdQMAAAAAYBkpAAAAAAFgGSYAAAAAAHAZNQEA"
-    "AAAAkBmbAAAAAACgGQMCAAAAALAZmQAAAAAAwBmzCQAAAADQGUcAAAAAAEAyeQAAAAAAUDLsAAAA"
-    "AABgMs0AAAAAAHAyxwAAAAAAgDJ9BAAAAACQMmoBAAAAAKAyBQUAAAAAsDJWAAAAAADAMt8AAAAA"
-    "AcAyBAAAAAAA0DJZAQAAAADgMo0BAAAAAPAy0wIAAAAAADNiAAAAAAEAM40AAAAAABAzrwAAAAAB"
-    "EDMZAAAAAAAgM5gBAAAAASAzBgAAAAACIDNpAAAAAAAwM3EBAAAAAEAzcgAAAAABQDMxAAAAAABQ"
-    "M4QAAAAAAGAzVwAAAAAAcDNMAAAAAACAM1MAAAAAAYAzEAAAAAAAkDNyAAAAAACgM1gAAAAAALAz"
-    "6QAAAAABsDMBAAAAAADAM0gAAAAAANAzhAAAAAAB0DMCAAAAAADgM2gAAAAAAPAzNgAAAAAU8DNw"
-    "AAAAAAEANDcAAAAAABA0SwEAAAAAIDQQAgAAAAEgNI4BAAAAAiA0BgAAAAAAMDQYAAAAAABANNQA"
-    "AAAAAGA0LgAAAAAAgDTMAAAAAACQNJ4AAAAAAZA0HAAAAAAAwDQHAAAAAAAgNTcAAAAAASA1qQAA"
-    "AAACIDVJAAAAAAAwNZcAAAAAAEA1jwEAAAAAUDUqBwAAAABgNRYAAAAAAHA1AwEAAAABcDUHAAAA"
-    "AACANSUAAAAAAJA1LAAAAAAAsDU1AAAAAADANUMAAAAAANA1zQAAAAAA4DXDAAAAAADwNVQAAAAA"
-    "AAA2qAAAAAAAEDY9AAAAAAAgNhwAAAAAADA2GgAAAAAAQDaBCQAAAABQNq8AAAAAAGA2NwIAAAAA"
-    "cDZlAAAAAACANlAAAAAAAJA2VgAAAAAAoDYfAAAAAACwNg8AAAAAAMA2SgAAAAABwDZoAAAAAADQ"
-    "NhADAAAAAOA23wAAAAAA8DaSAAAAAAAAN5sAAAAAABA3JQMAAAABEDc/AAAAAAAgN20AAAAAADA3"
-    "8wAAAAAAQDe7DwAAAABQN1AAAAAAAVA3rgAAAAAAYDfJAAAAAAFgN9wAAAAAAHA3uAEAAAAAgDcW"
-    "AAAAAACQN0UAAAAAAKA3+gAAAAAAsDcyAgAAAAGwN0UAAAAAAMA3MQAAAAAA0Dc1AgAAAABAOBMA"
-    "AAAAAFA4KAAAAAAAYDgpAAAAAABwOBcAAAAAAIA4CgAAAAAAkDgqAAAAAACgOAkAAAAAALA4NgAA"
-    "AAAAwDhuAAAAAADQOBgAAAAAAOA4DwAAAAAA8DgSAAAAAAAAOfAAAAAAFAA5ZgAAAAAAEDkfAAAA"
-    "AAAgOQ4AAAAAADA5CQAAAAAAQDkbAAAAAABQOQkAAAAAAGA5RgAAAAAAgDkMAAAAAABgOzMAAAAA"
-    "AHA7LQAAAAAKcDstAAAAABRwOy0AAAAAHnA7LQAAAAAocDstAAAA"
+# Section headers are three u16 fields at a 4-byte stride; only the last one,
+# the entry count, is needed.
+_SECTION_HEADER = struct.Struct("<8xH2x")
+_BESTIARY_HEADER = struct.Struct("<4xI")
+_BESTIARY_COUNT = struct.Struct("<I")
+_BESTIARY_ENTRY = struct.Struct("<4s4s")
+# An entry's u32 encounter count, after its 4-byte id and HP fields.
+_BESTIARY_ENTRY_COUNT = struct.Struct("<4xI")
+_CHECKLIST_VALUE = struct.Struct("<H")
+# getInt reads the common widths in place instead of slicing a temporary copy.
+_INT_UNPACKERS = {
+    (num_bytes, signed): struct.Struct("<" + (code.lower() if signed else code)).unpack_from
+    for num_bytes, code in ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+    for signed in (False, True)
+}
+# ...and alterIntInPlace writes them straight into a bytearray.
+_INT_PACKERS = {
+    (num_bytes, signed): struct.Struct("<" + (code.lower() if signed else code)).pack_into
+    for num_bytes, code in ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+    for signed in (False, True)
+}
+_CHECKSUM_VALUE = struct.Struct("<I")
+
+# zlib-compressed, then base64-encoded.
+DEAD_GOD_BESTIARY_SECTION_ZLIB_BASE64 = (
+    "eNqFmnmwW+V5xs+io7tKOpKuF+FNGNsxBhv5ar2sMmAbjAHZJmzFExUwDi4hwhMglJDKCSUkGBAQ"
+    "A2FJRJqQpKS2WMIAManMYpIpBEHDUkNiMZkS1qAG3I6BZqr7PT9fgmYy/cN+5zvn6Dvf+dbneX83"
+    "YFnWZrf7n1W3+seDXbdM0albgfFoNSzPXG/outW0gia2ud62bFPu6Hm7o7Jt2Y6ph2glbd/ElG1+"
+    "b6e4XrT7TCzZqqdiq56KrXZUbPMeq6poV/WcU+X3Ndu026npebdGPXWV7Tr1N3i+SWxxv6X7bovf"
+    "tYmWQ7sd9UNKZSflqB+Kjr6zzHMVykSrpugQrbqes+uUG6rHbvC7Jtdb1Nfmeptyh3KHsuXSz67a"
+    "57uqz9d1K+nqfUQrpeuTUnpuFtEq8lyR35WIZXdQ36P7DtGqcr/O++vU0+R+yzXj67RUdls831Z0"
+    "iFbH1bhaAf3OD6g+opWiXOR+KaD3VLjfIrZ5rh0w9Q12eN7yqNcbUr2Ui8SSN1X1Ua56jINH/cQ2"
+    "962g3u8HaV9Q/V4M0k7KJZ4rK9rloPn9YH1Y95vD1EvsDKv/O5StUEDrJkR7Fd1iiHEhVvScVQt5"
+    "mmcquzXu17nf0H2rqbLd5H6b+juUk2Gtt2SY+R6O6P1h5kVY7SxRLhNbinYrrHa0wsxf7lsRxiHC"
+    "e4jFiPaBIvcrXK8Sa1yvE5sRfUeLcpvYIXYHWvX7jA+x6JvvGSRaJZ/v4H7ZZ/x9jVvN71e/EZv+"
+    "oN7L71r8rsPzflT3k1HeRyxFaXeU52J8H7Eeo/1EK67rfpz1Gtd+XI6r3ZU49SRYtwm+J6F2lRP0"
+    "Y2Ky6k+wzxCb3G8Ry6PMI2J1lPuUO0QrTX8Si8Q60c9wP8t9YonYzvI9Oe7n1O4y5UqO+ZHXdxCt"
+    "MmWiVSxQb4H7BY13jXKd2Cyof1pEa0zj6I8x/4hFYmmM+g6jPYeZ9s2vmPL4veP6dD6eNKDz8YmA"
+    "zset4y9w61aac/LdyToni4M6J/eETTus783Vefnd/XVeVszv29Y8zs2jfJ2ba0Pj1zuWaZDbsbao"
+    "/faFQZ2nP3V0nj7k6DwdvVzn6eH9Ok+/5pnzyT7H7AMp+wzO1/08na+/NN9Rtk8xz5ftR0x9ZdvM"
+    "F7dsL+D8fbyg83d6ROfvFeO/cyv2kZzD232dw7GgzuHVph+qdiio8/iL+43fr9mzPZ3LOz2dy0+Y"
+    "3b5mX2J255q92eyqNXsl5/XWsM7r1/tN/9ofeDq354VMv9o7TL807Gs4x9eb55t2bfz9TtPWht2y"
+    "Lw/pXN81YPYj+w3O90M435ea+237ZTPAbfs0s9F17Nf7zDjYR3H+bwjr/G+a/ko6D3Pun2DeU3ae"
+    "VD86W0x7y85c9aOzEz3wbL/0wGbTzxXnsqDpR2e6Gb+q8/sh04/Of5p2VJ316AbXtK/mPKD93Lla"
+    "/eZcgo5YgY4ISac5UfTE07b0xFXqH8WurjgLPWEmc1dPnKvvdpahKzKOdMWJWgDuTke64iFbumKb"
+    "LV1RtqUr1gWkK1Y50hUfS8+514/fH0y5143HoZR76fhzIyl3uivdERz/3pkptxCU/tg7SfrjDfTH"
+    "veiPJeZ9JXceOuQ9s5Ar7pnqT3eb+tNtBKVHdg+YfnNPc02/ufPM99XcueiUDZpX7jfMwm64r3jS"
+    "K8+a/m+6L5l+bLrT0C+fjZv54349IB3zK3TMj8frDbTcMTN/W+7N4+0IttzZ4+W+lrscnbNn2PSz"
+    "W3ald/7JrI+2+yC6Z6E2nMAaR7onge6RwEsG/hn9c6zph1TgHnO9GHgePfQT9FDDfG8p8Bi66FXz"
+    "fCXwTX13YCM66eCwdNISdFLKvLcTeFu6I3CS+f5OYAv66X/H41AnsGY8DncCt6OnpgR1zB7rSk/t"
+    "p/Z6N6u93iZH+spHX11/gRk/r9knndUx86bibURvGWFiV705ZjyrXsnUV/Mulh/xLjSx4en7m97M"
+    "gPTZVvTZjaYdLW8VOu1OHcTBE9Fp6ockMRW8Ve0L/sCRXjvDll57QXogWES3/dCWbtus9qDL6sNH"
+    "o+O0TzaGg+i5tWZetYYf9aTrzjS/bw/vRt894UrfISRDCbO+rdDsfum8A8x3+qG3TD3J0EWmnlTo"
+    "2aD035sa99BVZj8thgbQg+Z2oBiSTiuFfoM+fMCRPvyyqbcaSprvrYZOdaQX159m1kno8IB049Yp"
+    "0o3HoBuPQzc+MiDd+A9R6caDTX2t0PG29OOXh6QfZ+lAD9+l/SJ8FnpyvTm3kuH/sqUrbwxIVz46"
+    "3czr8DD68jadT+HMgPRlDH05pnkd/pl5fyX8pPngeviP5r2NMP0fno0OPbpPOnSDKx36IDq037S7"
+    "E14uQRBxzbq3IjeYfvxEn14ZlD59Q+2MvOJKp6ZGpFONwXWKkQ/VvoiEfSXyrPbzyPuudOuPbOnW"
+    "urneiOxGv37QL/16iyP9+nJY+vV2DNxjZv76/lPab/3p6Nl3gtKze9Czl9nSs1cNSc+udqRntX7K"
+    "/m4TK/58W7r2Xc1jf5Pa5RfQt69pXflH6dz033Okb5PqNz+PzmWf8D+nfSD6onxn9HPo3xz696ta"
+    "Z9Fz0cEva31FV0p3RDMaz+h7ald0t/RC9ByzYdSjL2m9R7+Dbt5lfteKNjTfol/XOEa13q2YDLwf"
+    "M+vLSsZ+a+ZRJTZF4xG7bZGpP7bKNvM7tmCydPcz0hWxPeZ3zdjNZp63YvuZcWjHtE90YgdrP4mf"
+    "5EmXD5j+Tsa3Gn2TjD+MTt9f+0r8ZyaW4k9qHOJ7tI/E9f2VuOr3Ey9p30zIf6YSX9T+njjZlZ7X"
+    "ui0nEuj6Kej6pMYxcTP6XgajkdiCvn9A/Y6OL43+Gp3fRuf/AZ1/oubpqHRDffQ89cfo36qe0Y50"
+    "w2gffmCb5sPorbZ8wc/xBWdrHqTVHj+9Q+dYWudoMk3+IT0gX5m+GB+h9VFMf1X7WlrrvJS+Se1N"
+    "r1N702vU3vRZyvukda7U9Luu/1ireZz+hvIo+JFmuqR2p2vya2n8YvpSzee0mf8jnfRGtT8zGx+j"
+    "fS2ZWWTWQTLzPe1bGe0zqcx+6t/M82pnZpHal/ml2pVpmPpqmZlqR0Z5h2T2Hn1/dgU+6U58kvRq"
+    "KXuXmRfl7Ii+O9unczyr6VfNzlH9WenXRjar+rPSG63sM/gs6YBO9jSNT+5f9F05nWvJXB8+DD+V"
+    "e9EMTCl3P35MRquSO1/vzZ2u9+bOVH/n9tf7czpvmjnlN5q5C9WO3IDakXtT7ch9W+3Ib8Xf5aUb"
+    "8serPfnL1J78XrUnv9gMcCm/Wudxnnbln8IHvqb+yW9W+/KT1L78yWpfXomgRv5QM36N/LFqZz6N"
+    "fxzBP34G/yh9WCnEVV9hCD85iJ8kb1JARxW0DtsF9WOnMIC/NN8zYo2l8ZmT8Zkhfd/YEH5zJn5T"
+    "vy+PaVyqY8M9/tO0b7ByWMrUS5xJ7PrSQ8yxZVmvevKlq8nbJsjbHoQfXUjeNkHe1idvuy9f65Ov"
+    "Ne/v+k3yEORFLfKslj2H/O0O8rdnkb+djb88hfyt5kV5Io+7gzxuhjyuea7rI8k32MeTz82QzzXn"
+    "XddHMg72j7Se7GHyu1PI7wbwjw7+cV++N0y+dyr5XuWDiV2/eITmq9rZ9YvkCew0eeATlL+ynZ58"
+    "sPJUbb236xf1u47K3Stx8sSHaL1P5ItD6idn1l/mjd0Ufq3o0F9OH3nkGP6RPKeTIp88qP5z+tV/"
+    "jsaj6sxQ/+n3Xf9IPsTJqN8cn/yzg4908ZH78s+LyD+P4Bdz+MUN5KGz+MYB8tAx/OIC8tBh8tDD"
+    "5KFD5KFD5KHJi1FOuuyjbj9+0ZSHiF2f6JGfNs/P5LmuTyQP6cbwiawfd4n6yc2Spz6APPXR5Kn1"
+    "XI331t1DyVdrH29wv+mu0ne7Pv5P5+4n+WvNsxZ57rYbV3+4zAdX+ZO2O4C/m0teezp57Sj+TvM6"
+    "SUwpn931d8pPFQN9+Lsl+Lup2geV1+76O43Dvvx3PRDA3/n4Or2vE4DD6Lmur+vD1w3j64L4OvLv"
+    "Xpz06UHkyeWfkh7z2Osjb+7h696WvvEmkT9f8Kn8edVT/r/qkU/1Zqm/J/Lqy9S/E/n1I8mvn45v"
+    "S+DbXHzbCvLsI+TZ2ceDU/BtQ/i2FPl27e+1YRefxvofRs9M5N/FN9rDHj6tQB5+Fnn4mZrXoSnk"
+    "4zW+fkjjlQxp307Jh3V92hp8mvROMeTi04bwZ4vxZwPk77V/VkP0W4j+Cq3X+g31kddfjC9bgy9b"
+    "Rj7/XPL5Om9aE3l98oq81wrru/0w+fHwNK3HiXz/PPL9M/BjA+T7WWdh9iP5ta4P07jXw8fhu6aS"
+    "/59L/l/90wmPkP/XerfI6/sR7SupCQ4wBQ7g4auGe3gAnCMShgeonY0I/i9SgAt4cIEcXGASXED7"
+    "gU/+P+kP9fCBefCBI+ADc+AD+FBf76n4A3CClXCCHD6K8fBPhxPMhBME8E+z8E9B/NNR+Ccf/+Tj"
+    "nyL4p30cIQxHkO4oc70CV6hG2e+jWvd17jeIzajWdSuq/a4dZVyiMfyTB5fQvp2MBeETS1VvDJ4a"
+    "o79j2s+bMbWrxfOdWAJ+EYZfzMAX6RwuwjNK8I1ynLx+vA+uMQ+uoX0zmUA3EYuJGJyDfkjARbhe"
+    "SUhP1xIevigL9xjCF50D96Bf4Rqf8I8+fBDfNco+z/XOaBCfw/pJB/Ez/fgZ9kf8zj4+UsZ3VChX"
+    "J7iJh29x8CFw3Mw+nsI8zUS0TjPz8R0h/IaLr9jHXQbxE3D0LHwF7lLhuRrlJrHDc1aOfQx/UMxp"
+    "3pQmOA3rPzeI3ofD8Xyb+x18hZVnn8zPgud46HzO8fwI+n4f5wmj7yPoe3h/nv2Q5+p55nde49/I"
+    "c35zvUW5iD4vwX8qBfaPQrhH1zPecKU20RoLoOdJy8CHUmPs8/Ck0hicF45UPmwR+n0m+j2Ifh9C"
+    "v4+g3w0+6f77Clzpbl/6/SviHtZrwU9zpWumS8fvD1f6PVzpkjnS81PhSuf0cKUlcKUCXOlUuNJ3"
+    "0PlfgivdDVd6FK609Arp/M3K09kPxz7NlU5A9x8EV3oYrrQKrvQMXGkWXOlA/MD12U9zpTpc6XD8"
+    "wCNwJR+uVIIr7fLkB36bkB+YDld6HK70A7jS+fiC6/AFK/AF6+PyBV8bEld6H650oC+u9Chc6VJ8"
+    "wh640hNwpSG40h/gSs/BlfbiExbjE86AK70AVzoXrvTnHq70LbjSdrjSffiFbeJ4zr8G5Bfe65Nf"
+    "OMaTXzjJ5AWK+IOy8xD86Rfwpzn4hx34h1fgTzfBn26BP02DPz0Cf3oL/rQO/zAT/nQf/uF0/MM1"
+    "+IeL4FBGENh1p+GIQ92hfJTzNhwKTuf8Wnl7ZzAuX3H2sHxFHzzqAnjUUvzFKDxqNTzqRXjUdnjU"
+    "ffCo9fCov4FHrYZHeeIm7rfhUcfBo06ER9Uc+Yy7BuUzkp58xlR41B/xGQ141HJ41Fx8RwcedSU8"
+    "ag886hfwqI/gUevgUZ/p4VHfhEdtgkf9Dh7VhEe9CI8aw4/8KSY/sh4e9SC+ZHMPj7qnh0ctw6/U"
+    "IvIrz8Gj7gzIr9yFX1kOjzoFHiVO6AfegUcp75cKHAOPuh8e9RJ+5af4ld/Bo57Fr7wDj/oWfuVi"
+    "/MrekHhUEd9iNvjBduDf4FLv4F9KPVzqI/zLZ/Evd+BfpsKlzoJLTYNL3Yp/uRwudQL+JfwF+Zen"
+    "4VLbPXGp8/Axfw7IxxwAl1oJl9owLC61ES51F1xqFC71ffzNrXCplfibO+BS8+bI31yNv7kaf3ML"
+    "XOp2uNQ5cKk7ldcP3oC/uRcudQNcagZc6uMZ4lI3DsjvnIHf2QCX2gmXWguXauN3noZL8QdToSlw"
+    "qflh+Z394VJviouE/ntAfudRuNShk+V3XodL3Y3fKcGl5uB71gXle56CS22ES70q/hfq1/4eCsGl"
+    "ZsClFk8Wlzoa/7NrkvzPfJ2DoU1wqblwqVVwqQfhUkm41A/hUhfif06FS2135X8uhkvdDZdCT4Vv"
+    "gkst/ytc6i241H/ApZpwqWu1nsNXDMofLYVL/R1cajtc6kPN9/BeCZaI/Ve41Ca41AtwqTZcKgaX"
+    "+sgVl/oY/7RH/CfSgku9Dpd6DC51E1zqefzTSvGPyJ1wqTk6tyLfRwA14VKLtL78qfio9+BSH+Cj"
+    "roRL3QaXWguXWguX6sClFsGl9sKltsClxvBT78KlVsGlPoRLzYBLFfBVf/p/uNQx+Kp/xFd9CV/1"
+    "NFzqbLhUHl/1P3Cp5+BSJ8OlnoNLXYuv2gGX2gaXusCTr5pn46vgUjvhUn8fFJfy4VK7xuSvanCp"
+    "IlzqTbjUR3CpZ3q41PUD8ltpuNRSuJQLl3pujrjUvfivNFxqJ1yqBZdKwqWWwaWmwaV2waWONPeT"
+    "+KVUogKfqsCnLoZPHYgPm4cPy8KnbseHufApeF7ifn1PYjk+7DI41Tv4sWfwY0/Bqa4IiFNt0PwY"
+    "9eBUp8KpdsOpyIONiue3R6+FU/2782lOdS2cahucijxT+lZ974SvOx9fdxGcaiO+bjGc6kr83Wn4"
+    "u5X4uzU9nGojfu90/N6bPZyK/Inq+wtO9Xk4VQ5/WMEf5vGHJ8CpfDjVdT2cCt+d+U0Pp3oaTvVd"
+    "ONV0OJW2n2Q2j6/8CbzqePzlLfjL6+FVC7RuspPxly68qg9eNRe/eXAPrzqmh1c9jg89BR/6Y3jV"
+    "EfCq6fhSuFtuE7xqWw+vWgevKsGrToVXzerhVSvwr5/Hv+oPONs5/k4jdyP+9Xb861x41VHwqi/g"
+    "Y9/Hx/48Il5Vws9uxc/+Cj/7Kn5Wf0dVzU/Gzy7Fz36Inx2FVy3Fzy7Gz8qoF+FTpcJ8uBV+Ch5V"
+    "hVfVCgvwt/LfjUIOnwufK0zF50bgV+SBxjr43fPwu7PgV2F87wC+dxq+dwDfu6yHX6Xxvwvxvwvx"
+    "vwvxvwvxv+Px/wAWxiw0"
 )
 
-try:
-    _DEAD_GOD_BESTIARY_SECTION = base64.b64decode(
-        DEAD_GOD_BESTIARY_SECTION_BASE64
-    )
-except Exception:
-    _DEAD_GOD_BESTIARY_SECTION = b""
-
-def rshift(val, n): 
-    return val>>n if val >= 0 else (val+0x100000000)>>n
-
-def getSectionOffsets(data):
+@lru_cache(maxsize=1)
+def _dead_god_bestiary_section():
+    try:
+        return zlib.decompress(binascii.a2b_base64(DEAD_GOD_BESTIARY_SECTION_ZLIB_BASE64))
+    except Exception:
+        return b""
+
+def _scan_section_header(data):
     ofs = 0x14
-    sectData = [-1, -1, -1]
-    sectionOffsets = [0] * len(_ENTRY_LENGTHS)
-    for i in range(len(_ENTRY_LENGTHS)):
-        for j in range(3):
-            sectData[j] = int.from_bytes(data[ofs:ofs+2], 'little', signed=False)
-            ofs += 4
-        if sectionOffsets[i] == 0:
-            sectionOffsets[i] = ofs
-        for j in range(sectData[2]):
-            ofs += _ENTRY_LENGTHS[i]
-    return sectionOffsets
+    offsets = []
+    counts = []
+    end = len(data) - _SECTION_HEADER.size
+    for entry_length in _ENTRY_LENGTHS:
+        if ofs <= end:
+            (count,) = _SECTION_HEADER.unpack_from(data, ofs)
+        else:
+            count = int.from_bytes(data[ofs+8:ofs+10], 'little', signed=False)
+        ofs += 12
+        offsets.append(ofs)
+        counts.append(count)
+        ofs += entry_length * count
+    return tuple(offsets), tuple(counts)
+
+
+# Every edit returns a new ``bytes`` object, so keying on the data itself
+# keeps results valid without explicit invalidation.
+_cached_section_header = lru_cache(maxsize=8)(_scan_section_header)
+
+
+def _section_header(data):
+    if isinstance(data, bytes):
+        return _cached_section_header(data)
+    return _scan_section_header(data)
+
+
+def getSectionOffsets(data):
+    return list(_section_header(data)[0])
 
 
 def _get_section_entry_count(data, section_index):
-    ofs = 0x14
-    sectData = [-1, -1, -1]
-    for i in range(len(_ENTRY_LENGTHS)):
-        for j in range(3):
-            sectData[j] = int.from_bytes(data[ofs:ofs+2], 'little', signed=False)
-            ofs += 4
-        count = sectData[2]
-        if i == section_index:
-            return count
-        ofs += _ENTRY_LENGTHS[i] * count
-    raise IndexError("section_index out of range")
+    counts = _section_header(data)[1]
+    if not 0 <= section_index < len(counts):
+        raise IndexError("section_index out of range")
+    return counts[section_index]
 
 
 def getSecretCount(data):
@@ -358,35 +268,58 @@ def getBestiaryOffsets(data):
         if current + _BESTIARY_HEADER_SIZE > len(data):
             raise ValueError("Bestiary data is truncated")
         offsets.append(current)
-        encoded_count = int.from_bytes(
-            data[current + 4 : current + 8], "little", signed=False
-        )
+        (encoded_count,) = _BESTIARY_HEADER.unpack_from(data, current)
         entry_count = encoded_count // 4
         current += _BESTIARY_HEADER_SIZE + entry_count * _BESTIARY_ENTRY_SIZE
     return offsets
 
 
-def _read_bestiary_groups(data, offsets):
+def _read_bestiary_entries(view, position, entry_count):
+    end = position + entry_count * _BESTIARY_ENTRY_SIZE
+    if end > len(view):
+        return None
+    pairs = list(_BESTIARY_ENTRY.iter_unpack(view[position:end]))
+    mapping = {prefix: prefix + rest for prefix, rest in pairs}
+    order = [prefix for prefix, _ in pairs]
+    return mapping, order
+
+
+def _parse_bestiary(data):
+    section_offsets = getSectionOffsets(data)
+    if len(section_offsets) <= _BESTIARY_SECTION_INDEX:
+        raise IndexError("Bestiary section offset not available")
+    offsets = []
     headers = []
     maps = []
     orders = []
-    for offset in offsets:
-        header = bytearray(data[offset : offset + _BESTIARY_HEADER_SIZE])
-        encoded_count = int.from_bytes(header[4:8], "little", signed=False)
+    view = memoryview(data)
+    offset = section_offsets[_BESTIARY_SECTION_INDEX]
+    for _ in range(_BESTIARY_GROUP_COUNT):
+        if offset + _BESTIARY_HEADER_SIZE > len(data):
+            raise ValueError("Bestiary data is truncated")
+        offsets.append(offset)
+        header = bytearray(view[offset : offset + _BESTIARY_HEADER_SIZE])
+        (encoded_count,) = _BESTIARY_HEADER.unpack_from(header)
         entry_count = encoded_count // 4
-        mapping = {}
-        order = []
         position = offset + _BESTIARY_HEADER_SIZE
-        for _ in range(entry_count):
-            chunk = bytes(data[position : position + _BESTIARY_ENTRY_SIZE])
-            prefix = chunk[:4]
-            mapping[prefix] = chunk
-            order.append(prefix)
-            position += _BESTIARY_ENTRY_SIZE
+        entries = _read_bestiary_entries(view, position, entry_count)
+        if entries is not None:
+            mapping, order = entries
+        else:
+            # Truncated group: keep whatever partial entries are present.
+            mapping = {}
+            order = []
+            for _ in range(entry_count):
+                chunk = view[position : position + _BESTIARY_ENTRY_SIZE].tobytes()
+                prefix = chunk[:4]
+                mapping[prefix] = chunk
+                order.append(prefix)
+                position += _BESTIARY_ENTRY_SIZE
         headers.append(header)
         maps.append(mapping)
         orders.append(order)
-    return headers, maps, orders
+        offset += _BESTIARY_HEADER_SIZE + entry_count * _BESTIARY_ENTRY_SIZE
+    return offsets, (headers, maps, orders)
 
 
 def _read_bestiary_section_from_bytes(data: bytes):
@@ -394,222 +327,269 @@ def _read_bestiary_section_from_bytes(data: bytes):
     maps = []
     orders = []
     position = 0
+    view = memoryview(data)
     for _ in range(_BESTIARY_GROUP_COUNT):
         if position + _BESTIARY_HEADER_SIZE > len(data):
             return None
-        header = bytes(data[position : position + _BESTIARY_HEADER_SIZE])
-        encoded_count = int.from_bytes(header[4:8], "little", signed=False)
+        header = view[position : position + _BESTIARY_HEADER_SIZE].tobytes()
+        (encoded_count,) = _BESTIARY_HEADER.unpack_from(view, position)
         entry_count = encoded_count // 4
         position += _BESTIARY_HEADER_SIZE
 
-        mapping = {}
-        order = []
-        for _ in range(entry_count):
-            if position + _BESTIARY_ENTRY_SIZE > len(data):
-                return None
-            chunk = bytes(data[position : position + _BESTIARY_ENTRY_SIZE])
-            prefix = chunk[:4]
-            mapping[prefix] = chunk
-            order.append(prefix)
-            position += _BESTIARY_ENTRY_SIZE
+        entries = _read_bestiary_entries(view, position, entry_count)
+        if entries is None:
+            return None
+        mapping, order = entries
+        position += entry_count * _BESTIARY_ENTRY_SIZE
 
         headers.append(header)
         maps.append(mapping)
         orders.append(order)
 
-    if position < len(data) and any(data[position:]):
+    if data.count(0, position) != len(data) - position:
         return None
 
     return headers, maps, orders
 
 
-def _load_reference_bestiary(reference_data):
-    candidates = []
-    if reference_data:
-        candidates.append(reference_data)
-    if _DEAD_GOD_BESTIARY_SECTION:
-        candidates.append(_DEAD_GOD_BESTIARY_SECTION)
+def _parse_reference_bestiary(candidate):
+    try:
+        return _parse_bestiary(candidate)[1]
+    except (IndexError, ValueError):
+        return _read_bestiary_section_from_bytes(candidate)
+
+
+@lru_cache(maxsize=1)
+def _dead_god_bestiary():
+    # Callers only read the reference groups, so one parse can be shared.
+    dead_god_section = _dead_god_bestiary_section()
+    if not dead_god_section:
+        return None
+    return _parse_reference_bestiary(dead_god_section)
 
-    for candidate in candidates:
-        try:
-            offsets = getBestiaryOffsets(candidate)
-        except (IndexError, ValueError):
-            parsed = _read_bestiary_section_from_bytes(candidate)
-        else:
-            parsed = _read_bestiary_groups(candidate, offsets)
 
+def _load_reference_bestiary(reference_data):
+    if reference_data:
+        parsed = _parse_reference_bestiary(reference_data)
         if parsed:
             return parsed
+    return _dead_god_bestiary() or None
+
+
+def _checklist_offset_table(char_index, count=len(checklist_order)):
+    # Offsets of the checklist marks relative to section 1. Each mark is a row
+    # with one slot per character, and a few rows are separated by gaps.
+    if char_index == 14:
+        ofs, stride, gaps = 0x32C, 4, {8: 0x4, 9: 0x37C, 10: 0x84}
+    elif char_index > 14:
+        ofs, stride, gaps = 0x31C + char_index * 4, 19 * 4, {8: 0x4C, 9: 0x3C, 10: 0x3C}
+    else:
+        ofs, stride, gaps = 0x6C + char_index * 4, 14 * 4, {5: 0x14, 8: 0x3C, 9: 0x3B0, 10: 0x50}
+    offsets = []
+    for i in range(count):
+        offsets.append(ofs + i * stride)
+        ofs += gaps.get(i, 0)
+    return tuple(offsets)
+
 
-    return None
+_CHECKLIST_OFFSETS = tuple(_checklist_offset_table(i) for i in range(len(characters)))
+
+
+def _checklist_offsets(char_index, count=len(checklist_order)):
+    if 0 <= char_index < len(_CHECKLIST_OFFSETS) and count <= len(checklist_order):
+        return _CHECKLIST_OFFSETS[char_index][:count]
+    return _checklist_offset_table(char_index, count)
 
 
 def updateCheckListUnlocks(data, char_index, new_checklist_data):
-    if char_index == 14:
-        clu_ofs = getSectionOffsets(data)[1] + 0x32C
-        for i in range(len(new_checklist_data)):
-            current_ofs = clu_ofs + i * 4
-            data = alterInt(data, current_ofs, new_checklist_data[i])
-            if i == 8:
-                clu_ofs += 0x4
-            if i == 9:
-                clu_ofs += 0x37C
-            if i == 10:
-                clu_ofs += 0x84
-    elif char_index > 14:
-        clu_ofs = getSectionOffsets(data)[1] + 0x31C
-        for i in range(len(new_checklist_data)):
-            current_ofs = clu_ofs + char_index * 4 + i * 19 * 4
-            data = alterInt(data, current_ofs, new_checklist_data[i])
-            if i == 8:
-                clu_ofs += 0x4C
-            if i == 9:
-                clu_ofs += 0x3C
-            if i == 10:
-                clu_ofs += 0x3C
-    else:
-        clu_ofs = getSectionOffsets(data)[1] + 0x6C
-        for i in range(len(new_checklist_data)):
-            current_ofs = clu_ofs + char_index * 4 + i * 14 * 4
-            data = alterInt(data, current_ofs, new_checklist_data[i])
-            if i == 5:
-                clu_ofs += 0x14
-            if i == 8:
-                clu_ofs += 0x3C
-            if i == 9:
-                clu_ofs += 0x3B0
-            if i == 10:
-                clu_ofs += 0x50
-    return data
-
-def getChecklistUnlocks(data, char_index):
-    checklist_data = []
-    if char_index == 14:
-        clu_ofs = getSectionOffsets(data)[1] + 0x32C
-        for i in range(12):
-            current_ofs = clu_ofs + i * 4
-            checklist_data.append(getInt(data, current_ofs))
-            if i == 8:
-                clu_ofs += 0x4
-            if i == 9:
-                clu_ofs += 0x37C
-            if i == 10:
-                clu_ofs += 0x84
-    elif char_index > 14:
-        clu_ofs = getSectionOffsets(data)[1] + 0x31C
-        for i in range(12):
-            current_ofs = clu_ofs + char_index * 4 + i * 19 * 4
-            checklist_data.append(getInt(data, current_ofs))
-            if i == 8:
-                clu_ofs += 0x4C
-            if i == 9:
-                clu_ofs += 0x3C
-            if i == 10:
-                clu_ofs += 0x3C
-    else:
-        clu_ofs = getSectionOffsets(data)[1] + 0x6C
-        for i in range(12):
-            current_ofs = clu_ofs + char_index * 4 + i * 14 * 4
-            checklist_data.append(getInt(data, current_ofs))
-            if i == 5:
-                clu_ofs += 0x14
-            if i == 8:
-                clu_ofs += 0x3C
-            if i == 9:
-                clu_ofs += 0x3B0
-            if i == 10:
-                clu_ofs += 0x50
-    return checklist_data
-
+    base = getSectionOffsets(data)[1]
+    buffer = bytearray(data)
+    offsets = _checklist_offsets(char_index, len(new_checklist_data))
+    for offset, value in zip(offsets, new_checklist_data):
+        alterIntInPlace(buffer, base + offset, value)
+    return bytes(buffer)
+
+def getChecklistUnlocks(data, char_index):
+    base = getSectionOffsets(data)[1]
+    offsets = _checklist_offsets(char_index)
+    if base + max(offsets) + _CHECKLIST_VALUE.size > len(data):
+        return [getInt(data, base + offset) for offset in offsets]
+    unpack_from = _CHECKLIST_VALUE.unpack_from
+    return [unpack_from(data, base + offset)[0] for offset in offsets]
+
+def _read_byte_flags(data, start, count, stride=1):
+    # Bytes past the end of the data read as 0, like getInt on a short slice.
+    values = array("B", data[start : start + count * stride : stride])
+    if len(values) < count:
+        values.frombytes(bytes(count - len(values)))
+    return values
+
 def getItems(data):
-    item_data = []
     offs = getSectionOffsets(data)[3]
-    for i in range(1, 733):
-        entry_offset = offs + (i - 1) * _ITEM_ENTRY_STRIDE + 1
-        item_data.append(getInt(data, entry_offset, num_bytes=1))
-    return item_data
+    return _read_byte_flags(data, offs + 1, 732, _ITEM_ENTRY_STRIDE)
 
 def getChallenges(data):
-    challenge_data = []
     offs = getSectionOffsets(data)[6]
-    for i in range(1, 46):
-        challenge_data.append(getInt(data, offs+i, num_bytes=1))
-    return challenge_data
+    return _read_byte_flags(data, offs + 1, 45)
 
 def getSecrets(data):
-    secrets_data = []
     offs = getSectionOffsets(data)[_SECRET_SECTION_INDEX]
-    secret_count = getSecretCount(data)
-    for i in range(1, secret_count + 1):
-        secrets_data.append(getInt(data, offs+i, num_bytes=1))
-    return secrets_data
-
-
-def calcAfterbirthChecksum(data, ofs, length):
-    CrcTable = [
-        0x00000000, 0x09073096, 0x120E612C, 0x1B0951BA, 0xFF6DC419, 0xF66AF48F, 0xED63A535, 0xE46495A3, 
-        0xFEDB8832, 0xF7DCB8A4, 0xECD5E91E, 0xE5D2D988, 0x01B64C2B, 0x08B17CBD, 0x13B82D07, 0x1ABF1D91, 
-        0xFDB71064, 0xF4B020F2, 0xEFB97148, 0xE6BE41DE, 0x02DAD47D, 0x0BDDE4EB, 0x10D4B551, 0x19D385C7, 
-        0x036C9856, 0x0A6BA8C0, 0x1162F97A, 0x1865C9EC, 0xFC015C4F, 0xF5066CD9, 0xEE0F3D63, 0xE7080DF5, 
-        0xFB6E20C8, 0xF269105E, 0xE96041E4, 0xE0677172, 0x0403E4D1, 0x0D04D447, 0x160D85FD, 0x1F0AB56B, 
-        0x05B5A8FA, 0x0CB2986C, 0x17BBC9D6, 0x1EBCF940, 0xFAD86CE3, 0xF3DF5C75, 0xE8D60DCF, 0xE1D13D59, 
-        0x06D930AC, 0x0FDE003A, 0x14D75180, 0x1DD06116, 0xF9B4F4B5, 0xF0B3C423, 0xEBBA9599, 0xE2BDA50F, 
-        0xF802B89E, 0xF1058808, 0xEA0CD9B2, 0xE30BE924, 0x076F7C87, 0x0E684C11, 0x15611DAB, 0x1C662D3D, 
-        0xF6DC4190, 0xFFDB7106, 0xE4D220BC, 0xEDD5102A, 0x09B18589, 0x00B6B51F, 0x1BBFE4A5, 0x12B8D433, 
-        0x0807C9A2, 0x0100F934, 0x1A09A88E, 0x130E9818, 0xF76A0DBB, 0xFE6D3D2D, 0xE5646C97, 0xEC635C01,
-        0x0B6B51F4, 0x026C6162, 0x196530D8, 0x1062004E, 0xF40695ED, 0xFD01A57B, 0xE608F4C1, 0xEF0FC457, 
-        0xF5B0D9C6, 0xFCB7E950, 0xE7BEB8EA, 0xEEB9887C, 0x0ADD1DDF, 0x03DA2D49, 0x18D37CF3, 0x11D44C65, 
-        0x0DB26158, 0x04B551CE, 0x1FBC0074, 0x16BB30E2, 0xF2DFA541, 0xFBD895D7, 0xE0D1C46D, 0xE9D6F4FB, 
-        0xF369E96A, 0xFA6ED9FC, 0xE1678846, 0xE860B8D0, 0x0C042D73, 0x05031DE5, 0x1E0A4C5F, 0x170D7CC9, 
-        0xF005713C, 0xF90241AA, 0xE20B1010, 0xEB0C2086, 0x0F68B525, 0x066F85B3, 0x1D66D409, 0x1461E49F, 
-        0x0EDEF90E, 0x07D9C998, 0x1CD09822, 0x15D7A8B4, 0xF1B33D17, 0xF8B40D81, 0xE3BD5C3B, 0xEABA6CAD, 
-        0xEDB88320, 0xE4BFB3B6, 0xFFB6E20C, 0xF6B1D29A, 0x12D54739, 0x1BD277AF, 0x00DB2615, 0x09DC1683, 
-        0x13630B12, 0x1A643B84, 0x016D6A3E, 0x086A5AA8, 0xEC0ECF0B, 0xE509FF9D, 0xFE00AE27, 0xF7079EB1, 
-        0x100F9344, 0x1908A3D2, 0x0201F268, 0x0B06C2FE, 0xEF62575D, 0xE66567CB, 0xFD6C3671, 0xF46B06E7, 
-        0xEED41B76, 0xE7D32BE0, 0xFCDA7A5A, 0xF5DD4ACC, 0x11B9DF6F, 0x18BEEFF9, 0x03B7BE43, 0x0AB08ED5, 
-        0x16D6A3E8, 0x1FD1937E, 0x04D8C2C4, 0x0DDFF252, 0xE9BB67F1, 0xE0BC5767, 0xFBB506DD, 0xF2B2364B, 
-        0xE80D2BDA, 0xE10A1B4C, 0xFA034AF6, 0xF3047A60, 0x1760EFC3, 0x1E67DF55, 0x056E8EEF, 0x0C69BE79, 
-        0xEB61B38C, 0xE266831A, 0xF96FD2A0, 0xF068E236, 0x140C7795, 0x1D0B4703, 0x060216B9, 0x0F05262F, 
-        0x15BA3BBE, 0x1CBD0B28, 0x07B45A92, 0x0EB36A04, 0xEAD7FFA7, 0xE3D0CF31, 0xF8D99E8B, 0xF1DEAE1D, 
-        0x1B64C2B0, 0x1263F226, 0x096AA39C, 0x006D930A, 0xE40906A9, 0xED0E363F, 0xF6076785, 0xFF005713, 
-        0xE5BF4A82, 0xECB87A14, 0xF7B12BAE, 0xFEB61B38, 0x1AD28E9B, 0x13D5BE0D, 0x08DCEFB7, 0x01DBDF21, 
-        0xE6D3D2D4, 0xEFD4E242, 0xF4DDB3F8, 0xFDDA836E, 0x19BE16CD, 0x10B9265B, 0x0BB077E1, 0x02B74777, 
-        0x18085AE6, 0x110F6A70, 0x0A063BCA, 0x03010B5C, 0xE7659EFF, 0xEE62AE69, 0xF56BFFD3, 0xFC6CCF45, 
-        0xE00AE278, 0xE90DD2EE, 0xF2048354, 0xFB03B3C2, 0x1F672661, 0x166016F7, 0x0D69474D, 0x046E77DB, 
-        0x1ED16A4A, 0x17D65ADC, 0x0CDF0B66, 0x05D83BF0, 0xE1BCAE53, 0xE8BB9EC5, 0xF3B2CF7F, 0xFAB5FFE9, 
-        0x1DBDF21C, 0x14BAC28A, 0x0FB39330, 0x06B4A3A6, 0xE2D03605, 0xEBD70693, 0xF0DE5729, 0xF9D967BF, 
-        0xE3667A2E, 0xEA614AB8, 0xF1681B02, 0xF86F2B94, 0x1C0BBE37, 0x150C8EA1, 0x0E05DF1B, 0x0702EF8D
-    ]
-    checksum = 0xFEDCBA76
-    checksum = ~checksum
-
-    for i in range(ofs, ofs+length):
-        checksum = CrcTable[((checksum & 0xFF)) ^ data[i]] ^ (rshift(checksum, 8))
-
-    return ~checksum + 2 ** 32
-
-def alterSecret(data, achievement, unlock=True):
-    offs = getSectionOffsets(data)[0]
-    new_data = b'\x00'
-    if unlock:
-        new_data = b'\x01'
-    new_data = data[:offs + achievement] + new_data + data[offs + achievement + 1:] 
-    return new_data
-
-def alterChallenge(data, challenge_index, unlock=True):
-    if unlock:
-        val = 1
-    else:
-        val = 0
-    return alterInt(data, getSectionOffsets(data)[6]+challenge_index, val, num_bytes=1)
-
-def alterItem(data, item_index, unlock=True):
-    if unlock:
-        val = 1
-    else:
-        val = 0
-    return alterInt(data, getSectionOffsets(data)[3]+item_index, val, num_bytes=1)
-
+    return _read_byte_flags(data, offs + 1, getSecretCount(data))
+
+
+# The table is not the standard reflected CRC-32 table: only 2 of its 256
+# entries match zlib's (entry 1 is 0x09073096, not 0x77073096), so
+# zlib.crc32 cannot stand in for it even with a custom seed. It is not a
+# clean table for any polynomial either (entry 128 is 0xEDB88320, yet the
+# rest do not follow from it), so carry-less-multiply folding as done by
+# fastcrc/crc32c has no constants that would reproduce it.
+_AFTERBIRTH_CRC_TABLE = array("I", (
+    0x00000000, 0x09073096, 0x120E612C, 0x1B0951BA, 0xFF6DC419, 0xF66AF48F, 0xED63A535, 0xE46495A3,
+    0xFEDB8832, 0xF7DCB8A4, 0xECD5E91E, 0xE5D2D988, 0x01B64C2B, 0x08B17CBD, 0x13B82D07, 0x1ABF1D91,
+    0xFDB71064, 0xF4B020F2, 0xEFB97148, 0xE6BE41DE, 0x02DAD47D, 0x0BDDE4EB, 0x10D4B551, 0x19D385C7,
+    0x036C9856, 0x0A6BA8C0, 0x1162F97A, 0x1865C9EC, 0xFC015C4F, 0xF5066CD9, 0xEE0F3D63, 0xE7080DF5,
+    0xFB6E20C8, 0xF269105E, 0xE96041E4, 0xE0677172, 0x0403E4D1, 0x0D04D447, 0x160D85FD, 0x1F0AB56B,
+    0x05B5A8FA, 0x0CB2986C, 0x17BBC9D6, 0x1EBCF940, 0xFAD86CE3, 0xF3DF5C75, 0xE8D60DCF, 0xE1D13D59,
+    0x06D930AC, 0x0FDE003A, 0x14D75180, 0x1DD06116, 0xF9B4F4B5, 0xF0B3C423, 0xEBBA9599, 0xE2BDA50F,
+    0xF802B89E, 0xF1058808, 0xEA0CD9B2, 0xE30BE924, 0x076F7C87, 0x0E684C11, 0x15611DAB, 0x1C662D3D,
+    0xF6DC4190, 0xFFDB7106, 0xE4D220BC, 0xEDD5102A, 0x09B18589, 0x00B6B51F, 0x1BBFE4A5, 0x12B8D433,
+    0x0807C9A2, 0x0100F934, 0x1A09A88E, 0x130E9818, 0xF76A0DBB, 0xFE6D3D2D, 0xE5646C97, 0xEC635C01,
+    0x0B6B51F4, 0x026C6162, 0x196530D8, 0x1062004E, 0xF40695ED, 0xFD01A57B, 0xE608F4C1, 0xEF0FC457,
+    0xF5B0D9C6, 0xFCB7E950, 0xE7BEB8EA, 0xEEB9887C, 0x0ADD1DDF, 0x03DA2D49, 0x18D37CF3, 0x11D44C65,
+    0x0DB26158, 0x04B551CE, 0x1FBC0074, 0x16BB30E2, 0xF2DFA541, 0xFBD895D7, 0xE0D1C46D, 0xE9D6F4FB,
+    0xF369E96A, 0xFA6ED9FC, 0xE1678846, 0xE860B8D0, 0x0C042D73, 0x05031DE5, 0x1E0A4C5F, 0x170D7CC9,
+    0xF005713C, 0xF90241AA, 0xE20B1010, 0xEB0C2086, 0x0F68B525, 0x066F85B3, 0x1D66D409, 0x1461E49F,
+    0x0EDEF90E, 0x07D9C998, 0x1CD09822, 0x15D7A8B4, 0xF1B33D17, 0xF8B40D81, 0xE3BD5C3B, 0xEABA6CAD,
+    0xEDB88320, 0xE4BFB3B6, 0xFFB6E20C, 0xF6B1D29A, 0x12D54739, 0x1BD277AF, 0x00DB2615, 0x09DC1683,
+    0x13630B12, 0x1A643B84, 0x016D6A3E, 0x086A5AA8, 0xEC0ECF0B, 0xE509FF9D, 0xFE00AE27, 0xF7079EB1,
+    0x100F9344, 0x1908A3D2, 0x0201F268, 0x0B06C2FE, 0xEF62575D, 0xE66567CB, 0xFD6C3671, 0xF46B06E7,
+    0xEED41B76, 0xE7D32BE0, 0xFCDA7A5A, 0xF5DD4ACC, 0x11B9DF6F, 0x18BEEFF9, 0x03B7BE43, 0x0AB08ED5,
+    0x16D6A3E8, 0x1FD1937E, 0x04D8C2C4, 0x0DDFF252, 0xE9BB67F1, 0xE0BC5767, 0xFBB506DD, 0xF2B2364B,
+    0xE80D2BDA, 0xE10A1B4C, 0xFA034AF6, 0xF3047A60, 0x1760EFC3, 0x1E67DF55, 0x056E8EEF, 0x0C69BE79,
+    0xEB61B38C, 0xE266831A, 0xF96FD2A0, 0xF068E236, 0x140C7795, 0x1D0B4703, 0x060216B9, 0x0F05262F,
+    0x15BA3BBE, 0x1CBD0B28, 0x07B45A92, 0x0EB36A04, 0xEAD7FFA7, 0xE3D0CF31, 0xF8D99E8B, 0xF1DEAE1D,
+    0x1B64C2B0, 0x1263F226, 0x096AA39C, 0x006D930A, 0xE40906A9, 0xED0E363F, 0xF6076785, 0xFF005713,
+    0xE5BF4A82, 0xECB87A14, 0xF7B12BAE, 0xFEB61B38, 0x1AD28E9B, 0x13D5BE0D, 0x08DCEFB7, 0x01DBDF21,
+    0xE6D3D2D4, 0xEFD4E242, 0xF4DDB3F8, 0xFDDA836E, 0x19BE16CD, 0x10B9265B, 0x0BB077E1, 0x02B74777,
+    0x18085AE6, 0x110F6A70, 0x0A063BCA, 0x03010B5C, 0xE7659EFF, 0xEE62AE69, 0xF56BFFD3, 0xFC6CCF45,
+    0xE00AE278, 0xE90DD2EE, 0xF2048354, 0xFB03B3C2, 0x1F672661, 0x166016F7, 0x0D69474D, 0x046E77DB,
+    0x1ED16A4A, 0x17D65ADC, 0x0CDF0B66, 0x05D83BF0, 0xE1BCAE53, 0xE8BB9EC5, 0xF3B2CF7F, 0xFAB5FFE9,
+    0x1DBDF21C, 0x14BAC28A, 0x0FB39330, 0x06B4A3A6, 0xE2D03605, 0xEBD70693, 0xF0DE5729, 0xF9D967BF,
+    0xE3667A2E, 0xEA614AB8, 0xF1681B02, 0xF86F2B94, 0x1C0BBE37, 0x150C8EA1, 0x0E05DF1B, 0x0702EF8D
+))
+
+
+@lru_cache(maxsize=1)
+def _afterbirth_crc_pair_table():
+    # Two table steps folded into one lookup keyed by the low 16 bits of
+    # ``checksum ^ word``; what is left of ``checksum`` just shifts by 16.
+    # Kept as a tuple: the hot loop indexes it and array lookups box a new
+    # int every time. Slicing by 4 (two 64K tables over u32 words) was only
+    # about 20% faster again while doubling the table memory.
+    table = _AFTERBIRTH_CRC_TABLE
+    return tuple(
+        table[(table[low] & 0xFF) ^ high] ^ (table[low] >> 8)
+        for high in range(256)
+        for low in range(256)
+    )
+
+
+def prepareChecksumTables():
+    _afterbirth_crc_pair_table()
+
+
+def _afterbirth_crc_run(checksum, view):
+    if sys.byteorder == "little" and len(view) >= 2:
+        pair_table = _afterbirth_crc_pair_table()
+        paired = len(view) & ~1
+        for word in view[:paired].cast("H"):
+            checksum = pair_table[(checksum ^ word) & 0xFFFF] ^ (checksum >> 16)
+        view = view[paired:]
+    table = _AFTERBIRTH_CRC_TABLE
+    for byte in view:
+        checksum = table[(checksum & 0xFF) ^ byte] ^ (checksum >> 8)
+    return checksum
+
+
+def _gf2_apply(columns, state):
+    result = 0
+    bit = 0
+    while state:
+        if state & 1:
+            result ^= columns[bit]
+        state >>= 1
+        bit += 1
+    return result
+
+
+@lru_cache(maxsize=None)
+def _zero_byte_advance(power):
+    # Running the checksum over 2**power zero bytes, as a 32x32 matrix over
+    # GF(2) stored column by column.
+    if power == 0:
+        table = _AFTERBIRTH_CRC_TABLE
+        return tuple(table[(1 << bit) & 0xFF] ^ ((1 << bit) >> 8) for bit in range(32))
+    half = _zero_byte_advance(power - 1)
+    return tuple(_gf2_apply(half, column) for column in half)
+
+
+def _advance_over_zeros(checksum, count):
+    power = 0
+    while count:
+        if count & 1:
+            checksum = _gf2_apply(_zero_byte_advance(power), checksum)
+        count >>= 1
+        power += 1
+    return checksum
+
+
+# The table is linear over XOR (table[a ^ b] == table[a] ^ table[b]), so for
+# equal-length inputs the raw states differ by the checksum of the XOR of the
+# inputs, run from a zero state. An edit then only costs its changed span plus
+# a matrix walk over the bytes after it.
+def calcAfterbirthChecksum(data, ofs, length, previous=None):
+    # ``previous`` is an optional (region, checksum) pair from an earlier call;
+    # when its region has the same length only the changed bytes are rehashed.
+    region = memoryview(data)[ofs:ofs+length]
+    if previous is not None and len(previous[0]) == len(region):
+        old_region, old_checksum = previous
+        # Keep the running value as an unsigned 32-bit int so the shift needs
+        # no sign handling.
+        checksum = ~old_checksum & 0xFFFFFFFF
+        delta = int.from_bytes(old_region, "little") ^ int.from_bytes(region, "little")
+        if delta:
+            start = ((delta & -delta).bit_length() - 1) // 8
+            end = (delta.bit_length() + 7) // 8
+            changed = (delta >> (start * 8)).to_bytes(end - start, "little")
+            step = _afterbirth_crc_run(0, memoryview(changed))
+            checksum ^= _advance_over_zeros(step, len(region) - end)
+    else:
+        checksum = _afterbirth_crc_run(~0xFEDCBA76 & 0xFFFFFFFF, region)
+
+    return ~checksum + 2 ** 32
+
+def alterSecret(data, achievement, unlock=True):
+    offs = getSectionOffsets(data)[0]
+    new_data = b'\x00'
+    if unlock:
+        new_data = b'\x01'
+    new_data = data[:offs + achievement] + new_data + data[offs + achievement + 1:] 
+    return new_data
+
+def alterChallenge(data, challenge_index, unlock=True):
+    if unlock:
+        val = 1
+    else:
+        val = 0
+    return alterInt(data, getSectionOffsets(data)[6]+challenge_index, val, num_bytes=1)
+
+def alterItem(data, item_index, unlock=True):
+    if unlock:
+        val = 1
+    else:
+        val = 0
+    return alterInt(data, getSectionOffsets(data)[3]+item_index, val, num_bytes=1)
+
 def alterInt(data, offset, new_val, debug=False, num_bytes=2, signed=False):
     if debug:
         current_val = int.from_bytes(
@@ -619,14 +599,29 @@ def alterInt(data, offset, new_val, debug=False, num_bytes=2, signed=False):
         print(f"new value: {new_val}")
     return data[:offset] + int(new_val).to_bytes(num_bytes, 'little', signed=signed) + data[offset + num_bytes:]
 
+def alterIntInPlace(buffer, offset, new_val, num_bytes=2, signed=False):
+    new_val = int(new_val)
+    packer = _INT_PACKERS.get((num_bytes, signed))
+    if packer is not None and 0 <= offset <= len(buffer) - num_bytes:
+        try:
+            packer(buffer, offset, new_val)
+            return
+        except struct.error:
+            pass
+    # Out-of-range values raise OverflowError here, as they do in alterInt.
+    buffer[offset:offset + num_bytes] = new_val.to_bytes(num_bytes, 'little', signed=signed)
+
 def getInt(data, offset, debug=False, num_bytes=2, signed=False):
     if debug:
         current_val = int.from_bytes(
             data[offset:offset+num_bytes], 'little', signed=signed
         )
         print(f"current value: {current_val}")
+    unpack_from = _INT_UNPACKERS.get((num_bytes, signed))
+    if unpack_from is not None and 0 <= offset <= len(data) - num_bytes:
+        return unpack_from(data, offset)[0]
     return int.from_bytes(data[offset:offset+num_bytes], 'little', signed=signed)
-
+
 def _normalize_secret_ids(secret_list):
     normalized = []
     seen = set()
@@ -645,14 +640,10 @@ def _normalize_secret_ids(secret_list):
     return normalized
 
 
-def applySecretOverrides(data, unlocked_ids, overrides=None):
-    if overrides is None:
-        overrides = SECRET_UNLOCK_OVERRIDES
-    if not overrides:
-        return data
-    result = data
-    section_offsets = None
-    unlocked_lookup = {str(value).strip() for value in unlocked_ids if str(value).strip()}
+def _compile_overrides(overrides):
+    # Resolve each override's config once: ids are normalised, offsets are
+    # folded with their base, and both payloads are packed ahead of time.
+    compiled = []
     for secret_id, config in overrides.items():
         normalized_id = str(secret_id).strip()
         if not normalized_id:
@@ -660,75 +651,109 @@ def applySecretOverrides(data, unlocked_ids, overrides=None):
         offsets = config.get("offsets")
         if not offsets:
             continue
-        value_key = "unlock_value" if normalized_id in unlocked_lookup else "lock_value"
-        if value_key not in config:
-            continue
-        try:
-            desired_value = int(config[value_key])
-        except (TypeError, ValueError):
-            continue
         try:
             num_bytes = int(config.get("num_bytes", 1))
         except (TypeError, ValueError):
             num_bytes = 1
         signed = bool(config.get("signed", False))
+        payloads = []
+        for value_key in ("unlock_value", "lock_value"):
+            try:
+                desired_value = int(config[value_key])
+            except (KeyError, TypeError, ValueError):
+                payloads.append(None)
+                continue
+            payloads.append(desired_value.to_bytes(num_bytes, 'little', signed=signed))
         absolute = bool(config.get("absolute", False))
-        section_index = config.get("section_index", 1)
         try:
-            section_index = int(section_index)
+            section_index = int(config.get("section_index", 1))
         except (TypeError, ValueError):
             section_index = 1
         try:
-            offset_base = int(config.get("offset_base", 0))
+            offset_base = 0 if absolute else int(config.get("offset_base", 0))
         except (TypeError, ValueError):
             offset_base = 0
-        if isinstance(offsets, (list, tuple, set)):
-            offset_values = offsets
-        else:
-            offset_values = (offsets,)
-        for raw_offset in offset_values:
+        if not isinstance(offsets, (list, tuple, set)):
+            offsets = (offsets,)
+        targets = []
+        for raw_offset in offsets:
             try:
-                offset_value = int(raw_offset)
+                targets.append(offset_base + int(raw_offset))
             except (TypeError, ValueError):
                 continue
-            target_offset = offset_value
-            if not absolute:
-                if section_offsets is None:
-                    try:
-                        section_offsets = getSectionOffsets(result)
-                    except Exception:
-                        section_offsets = []
-                if section_index < 0 or section_index >= len(section_offsets):
-                    continue
-                target_offset = section_offsets[section_index] + offset_base + offset_value
-            if target_offset < 0 or target_offset + num_bytes > len(result):
+        compiled.append((
+            normalized_id,
+            tuple(targets),
+            None if absolute else section_index,
+            num_bytes,
+            payloads[0],
+            payloads[1],
+        ))
+    return tuple(compiled)
+
+
+def applySecretOverrides(data, unlocked_ids, overrides=None):
+    if overrides is None or overrides == SECRET_UNLOCK_OVERRIDES:
+        compiled = _COMPILED_OVERRIDES
+    else:
+        compiled = _compile_overrides(overrides)
+    if not compiled:
+        return data
+    # A bytearray is patched in place; bytes are copied on the first write.
+    buffer = data if isinstance(data, bytearray) else None
+    section_offsets = None
+    unlocked_lookup = {str(value).strip() for value in unlocked_ids if str(value).strip()}
+    for normalized_id, targets, section_index, num_bytes, unlock_bytes, lock_bytes in compiled:
+        payload = unlock_bytes if normalized_id in unlocked_lookup else lock_bytes
+        if payload is None:
+            continue
+        base = 0
+        if section_index is not None:
+            if section_offsets is None:
+                try:
+                    section_offsets = getSectionOffsets(data)
+                except Exception:
+                    section_offsets = []
+            if section_index < 0 or section_index >= len(section_offsets):
                 continue
-            result = alterInt(
-                result,
-                target_offset,
-                desired_value,
-                num_bytes=num_bytes,
-                signed=signed,
-            )
-    return result
+            base = section_offsets[section_index]
+        for target in targets:
+            target_offset = base + target
+            if target_offset < 0 or target_offset + num_bytes > len(data):
+                continue
+            if buffer is None:
+                buffer = bytearray(data)
+            buffer[target_offset:target_offset + num_bytes] = payload
+    if buffer is not None and buffer is not data:
+        return bytes(buffer)
+    return data
 
 
 def updateSecrets(data, secret_list):
-    secret_count = getSecretCount(data)
-    for i in range(1, secret_count + 1):
-        data = alterSecret(data, i, False)
+    # Edit one mutable copy instead of rebuilding the save for every secret.
+    offs = getSectionOffsets(data)[_SECRET_SECTION_INDEX]
+    buffer = bytearray(data)
+    start = offs + 1
+    end = min(start + getSecretCount(data), len(buffer))
+    buffer[start:end] = bytes(max(0, end - start))
     unlocked_ids = _normalize_secret_ids(secret_list)
     for secret_id in unlocked_ids:
-        data = alterSecret(data, secret_id)
-    return applySecretOverrides(data, unlocked_ids)
-
-def updateChallenges(data, challenge_list):
-    for i in range(1, 46):
-        data = alterChallenge(data, i, False)
-    for i in challenge_list:
-        data = alterChallenge(data, int(i), True)
-    return data
-
+        if offs + secret_id < len(buffer):
+            buffer[offs + secret_id] = 1
+    return bytes(applySecretOverrides(buffer, unlocked_ids))
+
+def updateChallenges(data, challenge_list):
+    offs = getSectionOffsets(data)[6]
+    buffer = bytearray(data)
+    end = min(offs + 46, len(buffer))
+    if end > offs + 1:
+        buffer[offs + 1:end] = bytes(end - offs - 1)
+    for i in challenge_list:
+        index = offs + int(i)
+        if 0 <= index < len(buffer):
+            buffer[index] = 1
+    return bytes(buffer)
+
 # Additional map unlocks require touching other stat counters in the
 # persistent data. ``SECRET_UNLOCK_OVERRIDES`` mirrors the structure used by
 # the GUI so that command line invocations of ``updateSecrets`` behave in the
@@ -753,10 +778,12 @@ SECRET_UNLOCK_OVERRIDES: Dict[str, Dict[str, object]] = {
         "num_bytes": 4,
     }
 }
+_COMPILED_OVERRIDES = _compile_overrides(SECRET_UNLOCK_OVERRIDES)
 
 
 _SKIPPED_ITEM_IDS = {43, 59, 61, 235, 587, 613, 620, 630, 648, 656, 662, 666, 718}
 _ITEM_ENTRY_STRIDE = 4
+_ITEM_CLEAR_TABLE = bytes(value & ~ITEM_UNLOCK_CLEAR_MASK for value in range(256))
 
 
 def _normalize_item_ids(item_list):
@@ -774,21 +801,26 @@ def _normalize_item_ids(item_list):
 def updateItems(data, item_list):
     selected_ids = _normalize_item_ids(item_list)
     offs = getSectionOffsets(data)[3]
-    for item_id in range(1, 733):
-        if item_id in _SKIPPED_ITEM_IDS:
-            continue
-        entry_base = offs + (item_id - 1) * _ITEM_ENTRY_STRIDE
-        unlock = item_id in selected_ids
-        for offset in (entry_base, entry_base + 1):
-            current_val = getInt(data, offset, num_bytes=1)
-            if unlock:
-                new_val = current_val | ITEM_FLAG_SEEN | ITEM_FLAG_TOUCHED | ITEM_FLAG_COLLECTED
-            else:
-                new_val = current_val & ~ITEM_UNLOCK_CLEAR_MASK
-            if new_val != current_val:
-                new_byte = bytes((new_val & 0xFF,))
-                data = data[:offset] + new_byte + data[offset + 1:]
-    return data
+    buffer = bytearray(data)
+    unlock_flags = ITEM_FLAG_SEEN | ITEM_FLAG_TOUCHED | ITEM_FLAG_COLLECTED
+    # One flag byte per item to OR in; both lanes share it.
+    selected_flags = bytearray(732)
+    for item_id in selected_ids:
+        selected_flags[item_id - 1] = unlock_flags
+    # Clear both flag bytes of every entry with one strided translate per
+    # lane, put the skipped entries back, then OR in the selected flags as
+    # whole-lane integers.
+    end = min(offs + 732 * _ITEM_ENTRY_STRIDE, len(buffer))
+    for lane in (offs, offs + 1):
+        original = buffer[lane:end:_ITEM_ENTRY_STRIDE]
+        cleared = original.translate(_ITEM_CLEAR_TABLE)
+        for item_id in _SKIPPED_ITEM_IDS:
+            if item_id <= len(cleared):
+                cleared[item_id - 1] = original[item_id - 1]
+        count = len(cleared)
+        merged = int.from_bytes(cleared, 'little') | int.from_bytes(selected_flags[:count], 'little')
+        buffer[lane:end:_ITEM_ENTRY_STRIDE] = merged.to_bytes(count, 'little')
+    return bytes(buffer)
 
 
 def markItemsSeen(data, item_list):
@@ -796,54 +828,86 @@ def markItemsSeen(data, item_list):
     if not selected_ids:
         return data
     offs = getSectionOffsets(data)[3]
+    buffer = bytearray(data)
     for item_id in selected_ids:
         if item_id in _SKIPPED_ITEM_IDS:
             continue
         entry_base = offs + (item_id - 1) * _ITEM_ENTRY_STRIDE
         for offset in (entry_base, entry_base + 1):
-            current_val = getInt(data, offset, num_bytes=1)
-            new_val = current_val | ITEM_FLAG_SEEN
-            if new_val != current_val:
-                new_byte = bytes((new_val & 0xFF,))
-                data = data[:offset] + new_byte + data[offset + 1:]
-    return data
-
-def updateChecksum(data):
+            if offset < len(buffer):
+                buffer[offset] |= ITEM_FLAG_SEEN
+    return bytes(buffer)
+
+def updateChecksum(data, previous=None):
+    # ``previous`` may be a buffer returned by an earlier updateChecksum call;
+    # its stored checksum is trusted, so never pass data read from disk.
     offset = 0x10
     length = len(data) - offset - 4
-    return data[:offset + length] + calcAfterbirthChecksum(data, offset, length).to_bytes(5, 'little', signed=True)[:4]
+    if previous is not None and length >= 0 and len(previous) == len(data):
+        previous = (
+            memoryview(previous)[offset:offset + length],
+            _CHECKSUM_VALUE.unpack_from(previous, offset + length)[0],
+        )
+    else:
+        previous = None
+    checksum = calcAfterbirthChecksum(data, offset, length, previous) & 0xFFFFFFFF
+    return b"".join((memoryview(data)[:offset + length], _CHECKSUM_VALUE.pack(checksum)))
+
+
+def _bestiary_matches_reference(data, offsets, player_orders, reference, minimum):
+    # When every group's entry block is byte-identical to the reference and
+    # the encounter counts already meet the minimum, nothing would change.
+    _, ref_maps, ref_orders = reference
+    if len(ref_orders) != len(offsets):
+        return False
+    for offset, player_order, ref_map, ref_order in zip(
+        offsets, player_orders, ref_maps, ref_orders
+    ):
+        if len(player_order) != len(ref_order):
+            return False
+        start = offset + _BESTIARY_HEADER_SIZE
+        block = data[start : start + len(player_order) * _BESTIARY_ENTRY_SIZE]
+        if block != b"".join(map(ref_map.__getitem__, ref_order)):
+            return False
+    if minimum > 0:
+        start = offsets[3] + _BESTIARY_HEADER_SIZE
+        block = data[start : start + len(player_orders[3]) * _BESTIARY_ENTRY_SIZE]
+        if any(count < minimum for (count,) in _BESTIARY_ENTRY_COUNT.iter_unpack(block)):
+            return False
+    return True
 
 
 def ensureBestiaryEncounterMinimum(data, minimum=1, reference_data=None):
     try:
-        offsets = getBestiaryOffsets(data)
+        offsets, player_groups = _parse_bestiary(data)
     except (IndexError, ValueError):
         return data
     if minimum < 0:
         minimum = 0
 
-    player_headers, player_maps, player_orders = _read_bestiary_groups(data, offsets)
+    player_headers, player_maps, player_orders = player_groups
 
     ref_headers = ref_maps = ref_orders = None
     reference_sections = _load_reference_bestiary(reference_data)
     if reference_sections:
+        if _bestiary_matches_reference(
+            data, offsets, player_orders, reference_sections, minimum
+        ):
+            return data
         ref_headers, ref_maps, ref_orders = reference_sections
     ref_order = []
     if ref_orders:
         ref_order = ref_orders[3]
 
     player_order = player_orders[3] if player_orders else []
-    final_order = []
-    seen = set()
-    for prefix in ref_order + player_order:
-        if prefix not in seen:
-            final_order.append(prefix)
-            seen.add(prefix)
+    final_order = list(dict.fromkeys(chain(ref_order, player_order)))
     if not final_order:
         return data
 
     changed = False
-    group_chunks = []
+    # The rebuilt section goes straight into one buffer; each group's entry
+    # count is patched into its header once the entries are written.
+    new_section = bytearray()
     for index, offset in enumerate(offsets):
         header = bytearray(player_headers[index])
         if len(header) < _BESTIARY_HEADER_SIZE:
@@ -854,10 +918,28 @@ def ensureBestiaryEncounterMinimum(data, minimum=1, reference_data=None):
         if not any(header[:4]) and ref_headers and index < len(ref_headers):
             header[:4] = ref_headers[index][:4]
 
-        chunks = []
+        header_position = len(new_section)
+        new_section += header
+        entry_count = 0
         for prefix in final_order:
             current_chunk_bytes = player_map.get(prefix)
             ref_chunk_bytes = ref_map.get(prefix) if ref_map else None
+            # Most existing entries need no edit; reuse their bytes as-is.
+            if (
+                current_chunk_bytes is not None
+                and (
+                    ref_chunk_bytes is None
+                    or current_chunk_bytes[2:4] != b"\x00\x00"
+                    or ref_chunk_bytes[2:4] == b"\x00\x00"
+                )
+                and (
+                    index != 3
+                    or int.from_bytes(current_chunk_bytes[4:8], "little", signed=False) >= minimum
+                )
+            ):
+                new_section += current_chunk_bytes
+                entry_count += 1
+                continue
             if current_chunk_bytes is not None:
                 chunk = bytearray(current_chunk_bytes)
             elif ref_chunk_bytes is not None:
@@ -881,19 +963,18 @@ def ensureBestiaryEncounterMinimum(data, minimum=1, reference_data=None):
                 else:
                     new_value = current_value if current_value >= minimum else minimum
                 if new_value != current_value:
-                    chunk[4:8] = new_value.to_bytes(4, "little", signed=False)
+                    _BESTIARY_COUNT.pack_into(chunk, 4, new_value)
                     changed = True
             else:
                 if current_chunk_bytes is None:
                     if any(chunk[4:8]):
-                        chunk[4:8] = (0).to_bytes(4, "little", signed=False)
+                        _BESTIARY_COUNT.pack_into(chunk, 4, 0)
                         changed = True
 
-            chunks.append(bytes(chunk))
+            new_section += chunk
+            entry_count += 1
 
-        entry_count = len(chunks)
-        header[4:8] = (entry_count * 4).to_bytes(4, "little", signed=False)
-        group_chunks.append(bytes(header) + b"".join(chunks))
+        _BESTIARY_COUNT.pack_into(new_section, header_position + 4, entry_count * 4)
 
     if not changed:
         return data
@@ -905,31 +986,31 @@ def ensureBestiaryEncounterMinimum(data, minimum=1, reference_data=None):
         group_length = _BESTIARY_HEADER_SIZE + original_count * _BESTIARY_ENTRY_SIZE
         section_end = offset + group_length
 
-    new_section = b"".join(group_chunks)
-    return data[:section_start] + new_section + data[section_end:]
-
+    view = memoryview(data)
+    return b"".join((view[:section_start], new_section, view[section_end:]))
+
 # updateWinStreak: alterInt(data, getSectionOffsets(data)[1] + 0x4 + 0x54, 30)
 # updateGreedMachine: alterInt(data, getSectionOffsets(data)[1] + 0x4 + 0x1C8, 30)
 # updateDonationMachine: alterInt(data, getSectionOffsets(data)[1] + 0x4 + 0x1B0, 30)
-
-if __name__ == "__main__":
-    offset = 0x10
-    with open(filename, "rb") as file:
-        data = file.read()
-        length = len(data) - offset - 4
-        checksum = calcAfterbirthChecksum(data, offset, length).to_bytes(5, 'little', signed=True)[:4]
-        print(checksum)
-        old_checksum = data[offset + length:]    
-    # below are some examples on how to use this script that aren't covered in the gui implementation.
-    
-    # update a character's post-it: 0 is not completed, 1 is completed on normal, 2 is completed on hard. order is in checklist_order.
-    data = updateCheckListUnlocks(data, characters.index("Maggie"), [0,0,1,0,2,1,0,1,0,0,0,2])
+
+if __name__ == "__main__":
+    offset = 0x10
+    with open(filename, "rb") as file:
+        data = file.read()
+        length = len(data) - offset - 4
+        checksum = calcAfterbirthChecksum(data, offset, length).to_bytes(5, 'little', signed=True)[:4]
+        print(checksum)
+        old_checksum = data[offset + length:]    
+    # below are some examples on how to use this script that aren't covered in the gui implementation.
+    
+    # update a character's post-it: 0 is not completed, 1 is completed on normal, 2 is completed on hard. order is in checklist_order.
+    data = updateCheckListUnlocks(data, characters.index("Maggie"), [0,0,1,0,2,1,0,1,0,0,0,2])
     # enable secrets for online beta NOTE: THIS HAS NOT BEEN TESTED ON THE ONLINE BETA!!! USE AT OWN RISK!!!
     secret_count = getSecretCount(data)
     for i in range(secret_count - 4, secret_count + 1):
         data = alterSecret(data, i)
-
-
-    with open(filename, 'wb') as file:
-        print(calcAfterbirthChecksum(data, offset, length).to_bytes(5, 'little', signed=True)[:4])
+
+
+    with open(filename, 'wb') as file:
+        print(calcAfterbirthChecksum(data, offset, length).to_bytes(5, 'little', signed=True)[:4])
         file.write(updateChecksum(data))
\ No newline at end of file
@@ -1,31 +1,48 @@
 import csv
+import hashlib
+import os
 import re
+import shutil
+import tempfile
+import time
 from pathlib import Path
 from typing import Dict
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import html
 
 ROOT = Path(__file__).resolve().parent
 
 KO_FILES = [ROOT / "ko_kr1.lua", ROOT / "ko_kr2.lua", ROOT / "ko_kr3.lua"]
 
+# Downloaded pages are kept for a day so repeated runs skip the network.
+HTTP_CACHE_DIR = ROOT / ".http_cache"
+HTTP_CACHE_MAX_AGE = 24 * 60 * 60
+
+_SESSION = requests.Session()
+
+# The Lua files are scanned whole, so every pattern keeps to a single line:
+# the first entry on a line, optionally followed by its trailing comment.
+_LUA_ENTRY_RE = re.compile(
+    r"^[^\n]*?\{[^\S\n]*\"(\d+)\"[^\S\n]*,[^\S\n]*\"([^\"\n]*)\"", re.MULTILINE
+)
+_LUA_COMMENTED_ENTRY_RE = re.compile(
+    _LUA_ENTRY_RE.pattern + r"[^\n]*?--[^\S\n]*([^\n]+?)[^\S\n]*$", re.MULTILINE
+)
+_COLLECTIBLES_START_RE = re.compile(
+    r"^(?=[^\n]*=)(?=[^\n]*\{)[^\n]*?collectibles", re.MULTILINE | re.IGNORECASE
+)
+
 
 def build_english_to_korean() -> Dict[str, str]:
     mapping: Dict[str, str] = {}
     for path in KO_FILES:
-        with path.open(encoding="utf-8") as f:
-            for line in f:
-                match = re.search(r"\{\s*\"(\d+)\"\s*,\s*\"([^\"]*)\"", line)
-                if not match:
-                    continue
-                korean = match.group(2)
-                comment_match = re.search(r"--\s*(.+?)\s*$", line)
-                if not comment_match:
-                    continue
-                english = comment_match.group(1).strip()
-                if english and english not in mapping:
-                    mapping[english] = korean
+        text = path.read_text(encoding="utf-8")
+        for match in _LUA_COMMENTED_ENTRY_RE.finditer(text):
+            korean = match.group(2)
+            english = match.group(3).strip()
+            if english and english not in mapping:
+                mapping[english] = korean
     mapping.update(
         {
             "Jacob and Esau": "야곱과 에사우",
@@ -40,6 +57,10 @@ def build_english_to_korean() -> Dict[str, str]:
         mapping.setdefault(f"The {english}", korean)
         mapping.setdefault(f"A {english}", korean)
         mapping.setdefault(f"An {english}", korean)
+    # lowercase forms let the translators' single lowercase lookup match any
+    # casing; exact keys keep precedence
+    for english, korean in list(mapping.items()):
+        mapping.setdefault(english.lower(), korean)
     return mapping
 
 
@@ -76,53 +97,80 @@ def build_character_mapping(english_to_korean: Dict[str, str]) -> Dict[str, str]
     return char_map
 
 
+def _collectible_blocks(text: str):
+    # Yield (start, end) spans of each ``collectibles = {`` table, where a
+    # table ends on the first later line that closes its braces.
+    position = 0
+    while True:
+        start_match = _COLLECTIBLES_START_RE.search(text, position)
+        if not start_match:
+            return
+        start = start_match.start()
+        line_end = text.find("\n", start) + 1 or len(text)
+        first_line = text[start:line_end]
+        depth = first_line.count("{") - first_line.count("}")
+        position = line_end
+        while position < len(text):
+            line_end = text.find("\n", position) + 1 or len(text)
+            line = text[position:line_end]
+            depth += line.count("{") - line.count("}")
+            position = line_end
+            if depth <= 0:
+                break
+        yield start, position
+
+
 def parse_collectible_names() -> Dict[int, str]:
     mapping: Dict[int, str] = {}
     for path in KO_FILES:
-        with path.open(encoding="utf-8") as f:
-            lines = f.readlines()
-        in_block = False
-        depth = 0
-        for line in lines:
-            lower = line.lower()
-            if not in_block:
-                if "collectibles" in lower and "=" in line and "{" in line:
-                    in_block = True
-                    depth = line.count("{") - line.count("}")
-                    match = re.search(r"\{\s*\"(\d+)\"\s*,\s*\"([^\"]*)\"", line)
-                    if match:
-                        mapping[int(match.group(1))] = match.group(2)
-                    continue
-            else:
-                match = re.search(r"\{\s*\"(\d+)\"\s*,\s*\"([^\"]*)\"", line)
-                if match:
-                    mapping[int(match.group(1))] = match.group(2)
-                depth += line.count("{") - line.count("}")
-                if depth <= 0:
-                    in_block = False
+        text = path.read_text(encoding="utf-8")
+        for start, end in _collectible_blocks(text):
+            for match in _LUA_ENTRY_RE.finditer(text, start, end):
+                mapping[int(match.group(1))] = match.group(2)
     return mapping
 
 
+def _cell_text(cell) -> str:
+    # Same result as BeautifulSoup's get_text(strip=True).
+    return "".join(text.strip() for text in cell.xpath(".//text()"))
+
+
+def fetch_cached(url: str) -> bytes:
+    cache_path = HTTP_CACHE_DIR / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html")
+    try:
+        if time.time() - cache_path.stat().st_mtime < HTTP_CACHE_MAX_AGE:
+            return cache_path.read_bytes()
+    except OSError:
+        pass
+    response = _SESSION.get(url, timeout=30)
+    response.raise_for_status()
+    content = response.content
+    try:
+        HTTP_CACHE_DIR.mkdir(exist_ok=True)
+        cache_path.write_bytes(content)
+    except OSError:
+        pass
+    return content
+
+
 def fetch_item_metadata() -> Dict[int, Dict[str, str]]:
     url = "https://bindingofisaacrebirth.fandom.com/wiki/Items"
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "lxml")
-    tables = soup.find_all("table", class_="wikitable")
+    tree = html.fromstring(fetch_cached(url))
+    tables = tree.xpath("//table[contains(concat(' ', normalize-space(@class), ' '), ' wikitable ')]")
     mapping: Dict[int, Dict[str, str]] = {}
     for table, item_type in zip(tables[:2], ["Active", "Passive"]):
-        for row in table.find_all("tr")[1:]:
-            cols = row.find_all("td")
+        for row in table.xpath(".//tr")[1:]:
+            cols = row.xpath(".//td")
             if not cols:
                 continue
-            id_text = cols[1].get_text(strip=True)
+            id_text = _cell_text(cols[1])
             if not id_text:
                 continue
             id_part = id_text.split(".")[-1]
             if not id_part.isdigit():
                 continue
             item_id = int(id_part)
-            quality = cols[-1].get_text(strip=True) if len(cols) >= 6 else ""
+            quality = _cell_text(cols[-1]) if len(cols) >= 6 else ""
             mapping[item_id] = {"Type": item_type, "Quality": quality}
     return mapping
 
@@ -130,11 +178,10 @@ def fetch_item_metadata() -> Dict[int, Dict[str, str]]:
 def translate_generic(name: str, mapping: Dict[str, str]) -> str:
     if not name:
         return ""
-    if name in mapping:
-        return mapping[name]
-    if name.lower() in mapping:
-        return mapping[name.lower()]
-    return ""
+    korean = mapping.get(name)
+    if korean is None:
+        korean = mapping.get(name.lower(), "")
+    return korean
 
 
 def translate_character(name: str, char_map: Dict[str, str], eng_map: Dict[str, str]) -> str:
@@ -142,22 +189,36 @@ def translate_character(name: str, char_map: Dict[str, str], eng_map: Dict[str,
         return ""
     normalized = name.lower().replace("&", "and").strip()
     normalized = normalized.replace("the ", "the ", 1)
-    if normalized in char_map:
-        return char_map[normalized]
-    if name in eng_map:
-        return eng_map[name]
-    if name.lower() in eng_map:
-        return eng_map[name.lower()]
-    return ""
+    korean = char_map.get(normalized)
+    if korean is None:
+        korean = translate_generic(name, eng_map)
+    return korean
+
+
+def rewrite_csv(path: Path, fieldnames_for, transform) -> None:
+    # Stream rows into a temporary file beside ``path`` and swap it in, so a
+    # failure part-way leaves the original untouched.
+    tmp_name = None
+    try:
+        with path.open(encoding="utf-8-sig", newline="") as source, tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8-sig", newline="", dir=path.parent, suffix=".tmp", delete=False
+        ) as target:
+            tmp_name = target.name
+            reader = csv.DictReader(source)
+            writer = csv.DictWriter(target, fieldnames=fieldnames_for(reader.fieldnames or []))
+            writer.writeheader()
+            for row in reader:
+                writer.writerow(transform(row))
+        shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
 def update_ui_items(item_names: Dict[int, str], wiki_meta: Dict[int, Dict[str, str]], eng_map: Dict[str, str]) -> None:
-    path = ROOT / "ui_items.csv"
-    with path.open(encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    updated = []
-    for row in rows:
+    def transform(row: Dict[str, str]) -> Dict[str, str]:
         try:
             item_id = int(row["ItemID"])
         except ValueError:
@@ -169,40 +230,34 @@ def update_ui_items(item_names: Dict[int, str], wiki_meta: Dict[int, Dict[str, s
             name = row.get("ItemName", "")
             korean = translate_generic(name, eng_map)
         meta = wiki_meta.get(item_id, {}) if item_id is not None else {}
-        updated.append({
+        return {
             "ItemID": row["ItemID"],
             "ItemName": row.get("ItemName", ""),
             "Korean": korean,
             "UnlockedFlag": row.get("UnlockedFlag", ""),
             "Type": meta.get("Type", ""),
             "Quality": meta.get("Quality", ""),
-        })
-    with path.open("w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=["ItemID", "ItemName", "Korean", "UnlockedFlag", "Type", "Quality"])
-        writer.writeheader()
-        writer.writerows(updated)
+        }
+
+    rewrite_csv(
+        ROOT / "ui_items.csv",
+        lambda _: ["ItemID", "ItemName", "Korean", "UnlockedFlag", "Type", "Quality"],
+        transform,
+    )
 
 
 def update_generic_csv(filename: str, key_column: str, translator) -> None:
-    path = ROOT / filename
-    with path.open(encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    fieldnames = reader.fieldnames if reader.fieldnames else []
-    if "Korean" not in fieldnames:
-        insert_index = fieldnames.index(key_column) + 1 if key_column in fieldnames else len(fieldnames)
-        fieldnames = fieldnames[:insert_index] + ["Korean"] + fieldnames[insert_index:]
-    updated_rows = []
-    for row in rows:
-        name = row.get(key_column, "")
-        korean = translator(name)
-        row_copy = dict(row)
-        row_copy["Korean"] = korean
-        updated_rows.append(row_copy)
-    with path.open("w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(updated_rows)
+    def fieldnames_for(fieldnames):
+        if "Korean" not in fieldnames:
+            insert_index = fieldnames.index(key_column) + 1 if key_column in fieldnames else len(fieldnames)
+            fieldnames = fieldnames[:insert_index] + ["Korean"] + fieldnames[insert_index:]
+        return fieldnames
+
+    def transform(row: Dict[str, str]) -> Dict[str, str]:
+        row["Korean"] = translator(row.get(key_column, ""))
+        return row
+
+    rewrite_csv(ROOT / filename, fieldnames_for, transform)
 
 
 def main() -> None: